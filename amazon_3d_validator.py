@@ -4,24 +4,968 @@ Amazon 3D Model Compliance Checker
 Validates glTF/GLB models against Amazon Marketplace technical requirements
 """
 
+from __future__ import annotations
+
+import argparse
+import base64
+import contextlib
+import functools
+import glob
+import hashlib
+import importlib
+import importlib.util
+import io
 import json
 import os
+import re
+import shutil
+import signal
 import sys
+import tempfile
+import threading
+import time
+import typing
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
+from urllib.parse import unquote, unquote_to_bytes
 import subprocess
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass, asdict, field, fields, is_dataclass
 from datetime import datetime
 import math
+import mmap
+from collections import OrderedDict
+import struct
+
+
+# Third-party dependencies: import name -> pip distribution
+REQUIRED_PACKAGES = {
+    "numpy": "numpy",
+    "pygltflib": "pygltflib",
+    "PIL": "Pillow",
+}
+
+
+class MissingDependencyError(ImportError):
+    """A third-party package needed by a check is not installed"""
+
+
+def missing_dependencies() -> List[str]:
+    """pip distributions from REQUIRED_PACKAGES that cannot be imported"""
+    return [dist for name, dist in REQUIRED_PACKAGES.items()
+            if importlib.util.find_spec(name) is None]
+
+
+class _LazyModule:
+    """
+    Placeholder bound at module level in place of a heavy dependency.
+    
+    The first attribute access imports the real module and rebinds the
+    global ``alias`` to it, so later lookups cost nothing extra. Importing
+    this file therefore stays cheap, and cache hits or batch parents never
+    load numpy, pygltflib or Pillow at all.
+    """
+    
+    def __init__(self, name: str, alias: str):
+        self._name = name
+        self._alias = alias
+    
+    def _resolve(self):
+        try:
+            module = importlib.import_module(self._name)
+        except ImportError as e:
+            dist = REQUIRED_PACKAGES.get(self._name.split('.')[0], self._name)
+            raise MissingDependencyError(
+                f"{dist} is required (pip install -r requirements.txt)") from e
+        globals()[self._alias] = module
+        return module
+    
+    def __getattr__(self, attr):
+        return getattr(self._resolve(), attr)
+    
+    def __repr__(self):
+        return f"<lazy module {self._name!r}>"
+
+
+np = _LazyModule("numpy", "np")
+pygltflib = _LazyModule("pygltflib", "pygltflib")
+Image = _LazyModule("PIL.Image", "Image")
+
+
+def import_dependencies():
+    """
+    Import every lazily loaded dependency now rather than at first use.
+    
+    Lets --profile report import time as its own phase instead of charging
+    it to whichever check happens to touch numpy first, and lets long-lived
+    workers pay for it before their first request.
+    """
+    for value in list(globals().values()):
+        if isinstance(value, _LazyModule):
+            value._resolve()
+    # numpy 1.x (the pinned version) imports numpy.ma along with numpy, so
+    # this is a no-op there; 2.x defers it to the first np.unique call
+    importlib.import_module("numpy.ma")
+
+
+# glTF primitive topology modes (glTF 2.0 spec, mesh.primitive.mode)
+MODE_POINTS = 0
+MODE_LINES = 1
+MODE_LINE_LOOP = 2
+MODE_LINE_STRIP = 3
+MODE_TRIANGLES = 4
+MODE_TRIANGLE_STRIP = 5
+MODE_TRIANGLE_FAN = 6
+
+MODE_NAMES = {
+    MODE_POINTS: "POINTS",
+    MODE_LINES: "LINES",
+    MODE_LINE_LOOP: "LINE_LOOP",
+    MODE_LINE_STRIP: "LINE_STRIP",
+    MODE_TRIANGLES: "TRIANGLES",
+    MODE_TRIANGLE_STRIP: "TRIANGLE_STRIP",
+    MODE_TRIANGLE_FAN: "TRIANGLE_FAN",
+}
+
+
+def count_triangles(modes, element_counts) -> np.ndarray:
+    """
+    Compute triangle counts for a batch of primitives.
+
+    ``modes`` and ``element_counts`` are parallel sequences holding each
+    primitive's topology mode and its element count (index count for indexed
+    primitives, vertex count otherwise). Point and line modes contribute no
+    triangles; strips and fans yield ``count - 2`` triangles.
+    """
+    modes = np.asarray(modes, dtype=np.int64)
+    counts = np.asarray(element_counts, dtype=np.int64)
+    
+    triangles = np.zeros_like(counts)
+    
+    is_list = modes == MODE_TRIANGLES
+    triangles[is_list] = counts[is_list] // 3
+    
+    is_strip_or_fan = (modes == MODE_TRIANGLE_STRIP) | (modes == MODE_TRIANGLE_FAN)
+    triangles[is_strip_or_fan] = np.maximum(counts[is_strip_or_fan] - 2, 0)
+    
+    return triangles
+
+
+def triangle_indices(indices: np.ndarray, mode: int) -> np.ndarray:
+    """
+    (T, 3) vertex indices of the triangles a primitive's index stream
+    describes. Strips alternate winding so every triangle keeps the strip's
+    orientation; point and line modes yield no triangles.
+    """
+    indices = np.asarray(indices)
+    count = len(indices)
+    if mode == MODE_TRIANGLES:
+        return indices[:count - count % 3].reshape(-1, 3)
+    if mode not in (MODE_TRIANGLE_STRIP, MODE_TRIANGLE_FAN) or count < 3:
+        return np.empty((0, 3), dtype=indices.dtype)
+    
+    i = np.arange(count - 2)
+    if mode == MODE_TRIANGLE_STRIP:
+        odd = (i % 2).astype(bool)
+        first = np.where(odd, i + 1, i)
+        second = np.where(odd, i, i + 1)
+        return np.stack([indices[first], indices[second], indices[i + 2]], axis=1)
+    return np.stack([np.full(count - 2, indices[0]), indices[i + 1], indices[i + 2]], axis=1)
+
+
+# Accessor layout (glTF 2.0 spec, section 3.6.2)
+COMPONENT_DTYPES = {
+    5120: "int8",
+    5121: "uint8",
+    5122: "int16",
+    5123: "uint16",
+    5125: "uint32",
+    5126: "float32",
+}
+TYPE_COMPONENTS = {
+    "SCALAR": 1,
+    "VEC2": 2,
+    "VEC3": 3,
+    "VEC4": 4,
+    "MAT2": 4,
+    "MAT3": 9,
+    "MAT4": 16,
+}
+
+
+def weld_vertices(points: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Map each vertex to an id shared by every vertex at the exact same
+    position, so seams split for UVs or hard normals do not look like holes.
+    Returns (ids, number of distinct positions).
+    """
+    if len(points) == 0:
+        return np.zeros(0, dtype=np.int64), 0
+    order = np.lexsort(points.T[::-1])
+    ordered = points[order]
+    new_position = np.empty(len(points), dtype=bool)
+    new_position[0] = True
+    new_position[1:] = (ordered[1:] != ordered[:-1]).any(axis=1)
+    ids = np.empty(len(points), dtype=np.int64)
+    ids[order] = np.cumsum(new_position) - 1
+    return ids, int(new_position.sum())
+
+
+def edge_multiplicities(triangles: np.ndarray, vertex_count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Distinct undirected edges of a triangle list and how many triangles use
+    each, as ((E, 2) vertex pairs, (E,) counts). Edges are packed into
+    sortable int64 keys, so this is one sort rather than a per-edge dict.
+    """
+    triangles = triangles.astype(np.int64)
+    starts = triangles.reshape(-1)
+    ends = triangles[:, [1, 2, 0]].reshape(-1)
+    keep = starts != ends  # Collapsed edges of degenerate triangles
+    low = np.minimum(starts[keep], ends[keep])
+    high = np.maximum(starts[keep], ends[keep])
+    keys = np.sort(low * vertex_count + high)
+    if len(keys) == 0:
+        return np.empty((0, 2), dtype=np.int64), np.zeros(0, dtype=np.int64)
+    
+    run_starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    counts = np.diff(np.append(run_starts, len(keys)))
+    edges = np.stack(np.divmod(keys[run_starts], vertex_count), axis=1)
+    return edges, counts
+
+
+def connected_components(vertex_count: int, edges: np.ndarray) -> np.ndarray:
+    """
+    Component label (its smallest vertex id) for every vertex, by
+    repeatedly hooking each edge's larger root onto the smaller one and
+    pointer-jumping until every vertex points at its root.
+    """
+    parent = np.arange(vertex_count)
+    if len(edges) == 0:
+        return parent
+    first, second = edges[:, 0], edges[:, 1]
+    while True:
+        root_first, root_second = parent[first], parent[second]
+        differ = root_first != root_second
+        if not differ.any():
+            return parent
+        np.minimum.at(
+            parent,
+            np.maximum(root_first[differ], root_second[differ]),
+            np.minimum(root_first[differ], root_second[differ])
+        )
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+
+def rasterize_uv_coverage(corners: np.ndarray, size: int, max_rows: int = 1 << 21) -> np.ndarray:
+    """
+    Count, for every pixel of a ``size`` x ``size`` UV raster, how many of
+    the (T, 3, 2) UV triangles cover its centre.
+    
+    Triangles are scan-converted row by row: every (triangle, row) pair
+    gets its covered span from the two edges crossing that row, and spans
+    are summed through a per-row difference array, so the cost grows with
+    rows rather than pixels. Spans are half-open, so a centre on an edge
+    shared by two triangles counts once. Parts outside [0, 1] are clipped.
+    """
+    counts = np.zeros((size, size + 1), dtype=np.int64)
+    if len(corners) == 0:
+        return counts[:, :size]
+    
+    pixels = corners.astype(np.float64) * size
+    x, y = pixels[..., 0], pixels[..., 1]
+    finite = np.isfinite(pixels).all(axis=(1, 2))
+    # Rows whose centre (r + 0.5) lies in [min y, max y)
+    row_first = np.clip(np.ceil(np.where(finite, y.min(axis=1), 0) - 0.5), 0, size).astype(np.int64)
+    row_last = np.clip(np.ceil(np.where(finite, y.max(axis=1), 0) - 0.5) - 1, -1, size - 1).astype(np.int64)
+    rows = np.maximum(row_last - row_first + 1, 0)
+    
+    live = np.flatnonzero(rows)
+    ends = np.cumsum(rows[live])
+    start = 0
+    while start < len(live):
+        stop = max(int(np.searchsorted(ends, (ends[start - 1] if start else 0) + max_rows, side='right')), start + 1)
+        chunk = live[start:stop]
+        per_triangle = rows[chunk]
+        owner = np.repeat(chunk, per_triangle)
+        row = row_first[owner] + np.arange(len(owner)) - np.repeat(np.cumsum(per_triangle) - per_triangle, per_triangle)
+        centre = row + 0.5
+        
+        left = np.full(len(owner), np.inf)
+        right = np.full(len(owner), -np.inf)
+        for a, b in ((0, 1), (1, 2), (2, 0)):
+            ya, yb = y[owner, a], y[owner, b]
+            crosses = (np.minimum(ya, yb) <= centre) & (centre < np.maximum(ya, yb))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                at = x[owner, a] + (centre - ya) * (x[owner, b] - x[owner, a]) / (yb - ya)
+            left = np.where(crosses, np.minimum(left, at), left)
+            right = np.where(crosses, np.maximum(right, at), right)
+        
+        # Pixels whose centre (c + 0.5) lies in [left, right)
+        span_first = np.clip(np.ceil(left - 0.5), 0, size).astype(np.int64)
+        span_end = np.clip(np.ceil(right - 0.5), 0, size).astype(np.int64)
+        keep = span_end > span_first
+        flat = counts.reshape(-1)
+        flat += np.bincount(row[keep] * (size + 1) + span_first[keep], minlength=flat.size)
+        flat -= np.bincount(row[keep] * (size + 1) + span_end[keep], minlength=flat.size)
+        start = stop
+    return np.cumsum(counts, axis=1)[:, :size]
+
+
+# Image header probing: dimensions and pixel layout without decoding
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+KTX2_IDENTIFIER = b'\xabKTX 20\xbb\r\n\x1a\n'
+PNG_COLOR_TYPES = {0: ("grayscale", 1), 2: ("RGB", 3), 3: ("palette", 3), 4: ("grayscale+alpha", 2), 6: ("RGBA", 4)}
+PNG_TRNS_CHANNELS = {0: 2, 2: 4, 3: 4}  # Channel count once a tRNS chunk adds alpha
+JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+JPEG_COLOR_TYPES = {1: "grayscale", 3: "YCbCr", 4: "CMYK"}
+KTX2_SUPERCOMPRESSION = {0: "none", 1: "BasisLZ", 2: "Zstandard", 3: "ZLIB"}
+KTX2_COLOR_MODELS = {163: "ETC1S", 166: "UASTC"}
+KTX2_UASTC_CHANNELS = {0: 3, 3: 4, 4: 1, 5: 2, 6: 2}  # KHR_DF_CHANNEL_UASTC_* -> channel count
+
+
+TEXTURE_SUFFIX_FORMATS = {'.png': 'png', '.jpg': 'jpeg', '.jpeg': 'jpeg', '.ktx2': 'ktx2', '.webp': 'webp'}
+# Formats beyond PNG/JPEG are valid only when the model declares the extension that carries them
+TEXTURE_FORMAT_EXTENSIONS = {'ktx2': 'KHR_texture_basisu', 'webp': 'EXT_texture_webp'}
+
+
+TEXTURE_MIME_FORMATS = {'image/png': 'png', 'image/jpeg': 'jpeg', 'image/ktx2': 'ktx2', 'image/webp': 'webp'}
+
+
+class ByteViewReader:
+    """Seekable read-only file object over a bytes-like object, without copying it"""
+    
+    def __init__(self, data):
+        self._view = memoryview(data).cast('B')
+        self._pos = 0
+    
+    def __len__(self) -> int:
+        return len(self._view)
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self._pos
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: len(self)}[whence]
+        self._pos = max(base + offset, 0)
+        return self._pos
+    
+    def read(self, size: int = -1) -> bytes:
+        end = len(self) if size is None or size < 0 else min(self._pos + size, len(self))
+        data = bytes(self._view[self._pos:end]) if end > self._pos else b''
+        self._pos = max(self._pos, end)
+        return data
+
+
+class Base64Reader(ByteViewReader):
+    """
+    Seekable file object over base64 text that decodes only the 4-character
+    groups covering each read, so probing a header never decodes the image.
+    """
+    
+    def __init__(self, text: str):
+        self._text = text
+        self._pos = 0
+        padding = len(text) - len(text.rstrip('='))
+        self._length = len(text) // 4 * 3 - padding
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def read(self, size: int = -1) -> bytes:
+        end = len(self) if size is None or size < 0 else min(self._pos + size, len(self))
+        if end <= self._pos:
+            return b''
+        first_group, last_group = self._pos // 3, -(-end // 3)
+        decoded = base64.b64decode(self._text[first_group * 4:last_group * 4], validate=True)
+        offset = self._pos - first_group * 3
+        data = decoded[offset:offset + end - self._pos]
+        self._pos = end
+        return data
+
+
+_WHITESPACE = re.compile(r'\s')
+
+
+def data_uri_reader(uri: str):
+    """File object over the payload of a data: URI, decoding base64 lazily"""
+    header, _, payload = uri.partition(',')
+    if not header.endswith(';base64'):
+        return ByteViewReader(unquote_to_bytes(payload))
+    if _WHITESPACE.search(payload):
+        # Line-wrapped encodings may break anywhere, not just near the start
+        payload = ''.join(payload.split())
+    if len(payload) % 4:
+        # Missing padding: decoded up front
+        return ByteViewReader(base64.b64decode(payload + '=' * (-len(payload) % 4)))
+    return Base64Reader(payload)
+
+
+def _read_exact(stream, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError("Image header truncated")
+    return data
+
+
+def _probe_png(stream) -> Dict:
+    length, chunk_type = struct.unpack('>I4s', _read_exact(stream, 8))
+    if chunk_type != b'IHDR' or length != 13:
+        raise ValueError("PNG does not start with an IHDR chunk")
+    width, height, bit_depth, color_type = struct.unpack('>IIBB', _read_exact(stream, 10))
+    if color_type not in PNG_COLOR_TYPES:
+        raise ValueError(f"Unknown PNG color type {color_type}")
+    name, channels = PNG_COLOR_TYPES[color_type]
+    header = {"format": "png", "width": width, "height": height, "bit_depth": bit_depth,
+              "channels": channels, "color_type": name}
+    
+    if color_type in PNG_TRNS_CHANNELS:
+        # Grayscale, RGB and palette images carry alpha in a tRNS chunk, which
+        # precedes the pixel data
+        stream.seek(3 + 4, io.SEEK_CUR)  # Rest of IHDR and its CRC
+        while True:
+            chunk = stream.read(8)
+            if len(chunk) < 8:
+                break
+            length, chunk_type = struct.unpack('>I4s', chunk)
+            if chunk_type == b'tRNS':
+                header["channels"] = PNG_TRNS_CHANNELS[color_type]
+                break
+            if chunk_type in (b'IDAT', b'IEND'):
+                break
+            stream.seek(length + 4, io.SEEK_CUR)
+    return header
+
+
+def _probe_jpeg(stream) -> Dict:
+    # Walk marker segments, seeking past payloads (EXIF/ICC can be large)
+    while True:
+        byte = _read_exact(stream, 1)[0]
+        if byte != 0xFF:
+            raise ValueError("Corrupt JPEG marker sequence")
+        marker = _read_exact(stream, 1)[0]
+        while marker == 0xFF:  # Fill bytes
+            marker = _read_exact(stream, 1)[0]
+        if marker == 0xD8 or 0xD0 <= marker <= 0xD7 or marker == 0x01:
+            continue  # Markers without a payload
+        if marker in (0xD9, 0xDA):
+            raise ValueError("JPEG has no frame header before its scan data")
+        length = struct.unpack('>H', _read_exact(stream, 2))[0]
+        if marker in JPEG_SOF_MARKERS:
+            precision, height, width, components = struct.unpack('>BHHB', _read_exact(stream, 6))
+            return {"format": "jpeg", "width": width, "height": height, "bit_depth": precision,
+                    "channels": components, "color_type": JPEG_COLOR_TYPES.get(components, "unknown"),
+                    "progressive": marker in (0xC2, 0xC6, 0xCA, 0xCE)}
+        stream.seek(length - 2, io.SEEK_CUR)
+
+
+def _probe_ktx2(stream) -> Dict:
+    (vk_format, type_size, width, height, depth, layers, faces, levels,
+     supercompression, dfd_offset, dfd_length) = struct.unpack('<11I', _read_exact(stream, 44))
+    header = {"format": "ktx2", "width": width, "height": height, "bit_depth": 8,
+              "channels": None, "color_type": f"vkFormat {vk_format}",
+              "levels": levels, "supercompression": KTX2_SUPERCOMPRESSION.get(supercompression, "unknown")}
+    if dfd_length >= 4 + 24:
+        # Basic data format descriptor: colour model and per-channel samples
+        stream.seek(dfd_offset + 4)
+        block = _read_exact(stream, min(dfd_length - 4, 24 + 16 * 4))
+        color_model = block[8]
+        block_size = struct.unpack('<H', block[6:8])[0]
+        samples = max((block_size - 24) // 16, 0)
+        header["color_type"] = KTX2_COLOR_MODELS.get(color_model, header["color_type"])
+        if color_model == 163:  # ETC1S: an RGB slice plus an optional alpha slice
+            header["channels"] = 4 if samples >= 2 else 3
+        elif color_model == 166 and samples >= 1 and len(block) >= 28:
+            header["channels"] = KTX2_UASTC_CHANNELS.get(block[27] & 0x0F)
+    return header
+
+
+def _probe_webp(stream) -> Dict:
+    chunk_type = _read_exact(stream, 4)
+    _read_exact(stream, 4)  # Chunk size
+    if chunk_type == b'VP8 ':
+        frame = _read_exact(stream, 10)
+        if frame[3:6] != b'\x9d\x01\x2a':
+            raise ValueError("Corrupt WebP VP8 frame header")
+        width, height = struct.unpack('<HH', frame[6:10])
+        return {"format": "webp", "width": width & 0x3FFF, "height": height & 0x3FFF,
+                "bit_depth": 8, "channels": 3, "color_type": "lossy"}
+    if chunk_type == b'VP8L':
+        data = _read_exact(stream, 5)
+        if data[0] != 0x2F:
+            raise ValueError("Corrupt WebP lossless header")
+        bits = struct.unpack('<I', data[1:5])[0]
+        return {"format": "webp", "width": (bits & 0x3FFF) + 1, "height": ((bits >> 14) & 0x3FFF) + 1,
+                "bit_depth": 8, "channels": 4 if bits >> 28 & 1 else 3, "color_type": "lossless"}
+    if chunk_type == b'VP8X':
+        data = _read_exact(stream, 10)
+        width = int.from_bytes(data[4:7], 'little') + 1
+        height = int.from_bytes(data[7:10], 'little') + 1
+        return {"format": "webp", "width": width, "height": height, "bit_depth": 8,
+                "channels": 4 if data[0] & 0x10 else 3, "color_type": "extended"}
+    raise ValueError(f"Unknown WebP chunk {chunk_type!r}")
+
+
+def probe_image(stream) -> Dict:
+    """
+    Read an image's format, width, height, bit depth, channel count and
+    color type from its header. Supports PNG, JPEG, KTX2 and WebP; only
+    header bytes are read, seeking past anything else. Raises ValueError
+    for unknown or corrupt headers.
+    """
+    start = _read_exact(stream, 12)
+    if start[:8] == PNG_SIGNATURE:
+        stream.seek(-4, io.SEEK_CUR)
+        return _probe_png(stream)
+    if start[:2] == b'\xff\xd8':
+        stream.seek(-10, io.SEEK_CUR)
+        return _probe_jpeg(stream)
+    if start == KTX2_IDENTIFIER:
+        return _probe_ktx2(stream)
+    if start[:4] == b'RIFF' and start[8:12] == b'WEBP':
+        return _probe_webp(stream)
+    raise ValueError("Unrecognized image format")
+
+
+def probe_image_file(path) -> Dict:
+    with open(path, 'rb') as f:
+        return probe_image(f)
+
+
+def mip_chain_texels(width: int, height: int) -> int:
+    """Texels in a full mip chain, from the base level down to 1x1"""
+    total = 0
+    while True:
+        total += width * height
+        if width == 1 and height == 1:
+            return total
+        width, height = max(width // 2, 1), max(height // 2, 1)
+
+
+def normalize_components(values: np.ndarray, component_type: int) -> np.ndarray:
+    """Map normalized integer components to floats per the glTF spec"""
+    dtype = np.dtype(COMPONENT_DTYPES[component_type])
+    if dtype.kind == 'f':
+        return values.astype(np.float64, copy=False)
+    info = np.iinfo(dtype)
+    scaled = values.astype(np.float64) / info.max
+    return np.maximum(scaled, -1.0) if info.min < 0 else scaled
+
+
+def node_local_matrices(nodes) -> np.ndarray:
+    """
+    (N, 4, 4) local transforms for every node, from its matrix or TRS.
+    
+    Only the per-node property gathering is a Python loop; the quaternion
+    to matrix conversion and TRS composition run as batched array ops.
+    """
+    count = len(nodes)
+    translation = np.zeros((count, 3))
+    rotation = np.tile([0.0, 0.0, 0.0, 1.0], (count, 1))
+    scale = np.ones((count, 3))
+    explicit_index, explicit_matrix = [], []
+    for i, node in enumerate(nodes):
+        if node.matrix:
+            explicit_index.append(i)
+            explicit_matrix.append(node.matrix)
+            continue
+        if node.translation:
+            translation[i] = node.translation
+        if node.rotation:
+            rotation[i] = node.rotation
+        if node.scale:
+            scale[i] = node.scale
+    
+    x, y, z, w = rotation.T
+    matrices = np.zeros((count, 4, 4))
+    matrices[:, 0, 0] = 1 - 2 * (y * y + z * z)
+    matrices[:, 0, 1] = 2 * (x * y - z * w)
+    matrices[:, 0, 2] = 2 * (x * z + y * w)
+    matrices[:, 1, 0] = 2 * (x * y + z * w)
+    matrices[:, 1, 1] = 1 - 2 * (x * x + z * z)
+    matrices[:, 1, 2] = 2 * (y * z - x * w)
+    matrices[:, 2, 0] = 2 * (x * z - y * w)
+    matrices[:, 2, 1] = 2 * (y * z + x * w)
+    matrices[:, 2, 2] = 1 - 2 * (x * x + y * y)
+    matrices[:, :3, :3] *= scale[:, None, :]
+    matrices[:, :3, 3] = translation
+    matrices[:, 3, 3] = 1.0
+    
+    if explicit_index:
+        # glTF matrices are column-major
+        matrices[explicit_index] = np.asarray(explicit_matrix, dtype=np.float64).reshape(-1, 4, 4).transpose(0, 2, 1)
+    return matrices
+
+
+def expand_children(frontier: np.ndarray, child_ptr: np.ndarray, child_idx: np.ndarray) -> np.ndarray:
+    """All children of the ``frontier`` nodes from a CSR child table, without a Python loop"""
+    starts = child_ptr[frontier]
+    lengths = child_ptr[frontier + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    # Offset of each output slot within its parent's child range
+    offsets = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return child_idx[np.repeat(starts, lengths) + offsets]
+
+
+@functools.lru_cache(maxsize=None)
+def _box_corners() -> np.ndarray:
+    """Corner selector for axis-aligned boxes: 1 picks max, 0 picks min"""
+    return np.array(
+        [[(i >> 0) & 1, (i >> 1) & 1, (i >> 2) & 1] for i in range(8)], dtype=bool
+    )
+
+
+def transform_boxes(mins: np.ndarray, maxs: np.ndarray, matrices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    World-space AABB enclosing K local boxes, each under its own 4x4 matrix.
+    
+    ``mins``/``maxs`` are (K, 3) and ``matrices`` is (K, 4, 4); all eight
+    corners of every box are transformed in one batched product.
+    """
+    corners = np.where(_box_corners()[None, :, :], maxs[:, None, :], mins[:, None, :])
+    world = np.einsum('kij,kcj->kci', matrices[:, :3, :3], corners) + matrices[:, None, :3, 3]
+    return world.reshape(-1, 3).min(axis=0), world.reshape(-1, 3).max(axis=0)
+
+
+# Draco bitstream header (google/draco, src/draco/compression/)
+DRACO_MAGIC = b"DRACO"
+DRACO_ENCODER_MESH = 1
+DRACO_METHODS = {0: "sequential", 1: "edgebreaker"}
+DRACO_METADATA_FLAG = 0x8000
+DRACO_MAX_METADATA_DEPTH = 32
+
+
+class _DracoCursor:
+    """Bounds-checked little-endian reader over a Draco bitstream prefix"""
+    
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+    
+    def take(self, size: int):
+        if self.pos + size > len(self.data):
+            raise ValueError("Draco bitstream truncated")
+        chunk = self.data[self.pos:self.pos + size]
+        self.pos += size
+        return chunk
+    
+    def u8(self) -> int:
+        return self.take(1)[0]
+    
+    def u32(self) -> int:
+        return struct.unpack('<I', self.take(4))[0]
+    
+    def varint(self) -> int:
+        value = 0
+        for shift in range(0, 64, 7):
+            byte = self.u8()
+            value |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return value
+        raise ValueError("Draco varint too long")
+    
+    def skip_metadata(self, depth: int = 0):
+        """Skip one metadata block: entries, then nested sub-metadata"""
+        if depth > DRACO_MAX_METADATA_DEPTH:
+            raise ValueError("Draco metadata nested too deeply")
+        for _ in range(self.varint()):
+            self.take(self.u8())  # entry name
+            self.take(self.varint())  # entry value
+        for _ in range(self.varint()):
+            self.take(self.u8())  # sub-metadata name
+            self.skip_metadata(depth + 1)
+
+
+def read_draco_header(data) -> Dict:
+    """
+    Face and point counts from a Draco mesh bitstream without decoding it.
+    
+    Reads the header, skips any metadata, and stops at the connectivity
+    counts: (faces, points) for sequential encoding and (encoded vertices,
+    faces) for edgebreaker. Only the first few bytes of ``data`` are touched.
+    """
+    cursor = _DracoCursor(data)
+    if bytes(cursor.take(5)) != DRACO_MAGIC:
+        raise ValueError("Not a Draco bitstream")
+    major, minor = cursor.u8(), cursor.u8()
+    encoder_type, method = cursor.u8(), cursor.u8()
+    flags = struct.unpack('<H', cursor.take(2))[0]
+    
+    if major != 2:
+        raise ValueError(f"Unsupported Draco bitstream version {major}.{minor}")
+    if encoder_type != DRACO_ENCODER_MESH:
+        raise ValueError("Draco bitstream is a point cloud, not a mesh")
+    if method not in DRACO_METHODS:
+        raise ValueError(f"Unknown Draco encoding method {method}")
+    
+    # Bitstreams before 2.2 store counts as uint32 instead of varints
+    read_count = cursor.varint if minor >= 2 else cursor.u32
+    
+    if flags & DRACO_METADATA_FLAG:
+        for _ in range(cursor.varint()):
+            cursor.varint()  # attribute unique id
+            cursor.skip_metadata()
+        cursor.skip_metadata()  # file metadata
+    
+    if method == 0:
+        faces = read_count()
+        points = read_count()
+    else:
+        cursor.u8()  # traversal decoder type
+        if minor < 2:
+            cursor.u32()  # number of new vertices
+        points = read_count()
+        faces = read_count()
+    
+    return {
+        "version": f"{major}.{minor}",
+        "method": DRACO_METHODS[method],
+        "faces": faces,
+        "points": points
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _field_converters(cls) -> Tuple[Tuple[str, Optional[callable]], ...]:
+    """(field name, converter) pairs for a pygltflib dataclass, resolved once per class"""
+    hints = typing.get_type_hints(cls)
+    return tuple((f.name, _converter_for(hints.get(f.name))) for f in fields(cls))
+
+
+def _converter_for(annotation) -> Optional[callable]:
+    """Converter turning parsed JSON into the pygltflib type, or None for plain values"""
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union:
+        inner = [a for a in typing.get_args(annotation) if a is not type(None)]
+        return _converter_for(inner[0]) if len(inner) == 1 else None
+    if origin is list:
+        item_type = typing.get_args(annotation)[0]
+        if item_type is pygltflib.Attributes:
+            return None  # pygltflib keeps morph targets as plain dicts
+        item = _converter_for(item_type)
+        if item is None:
+            return None
+        return lambda values: [item(v) for v in values] if isinstance(values, list) else values
+    if annotation is float:
+        return lambda value: float(value) if isinstance(value, int) and not isinstance(value, bool) else value
+    if annotation is pygltflib.Attributes:
+        # Attributes is not a dataclass; it accepts arbitrary semantic names
+        return lambda value: pygltflib.Attributes(**value) if isinstance(value, dict) else value
+    if isinstance(annotation, type) and is_dataclass(annotation):
+        return lambda value: _build_dataclass(annotation, value) if isinstance(value, dict) else value
+    return None
 
-try:
-    import pygltflib
-    from PIL import Image
-except ImportError:
-    print("Installing required dependencies...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "--break-system-packages", "pygltflib", "Pillow"])
-    import pygltflib
-    from PIL import Image
+
+def _build_dataclass(cls, data: Dict):
+    kwargs = {}
+    for name, convert in _field_converters(cls):
+        if name in data:
+            value = data[name]
+            kwargs[name] = convert(value) if convert is not None and value is not None else value
+    return cls(**kwargs)
+
+
+def gltf_from_dict(doc: Dict):
+    """
+    Build a pygltflib GLTF2 from parsed glTF JSON.
+    
+    Produces the same objects as pygltflib's dataclasses-json decoding, but
+    resolves each class's field types once instead of on every object, which
+    matters for exports with tens of thousands of nodes. Unknown properties
+    are ignored, as they are by pygltflib.
+    """
+    return _build_dataclass(pygltflib.GLTF2, doc)
+
+
+# GLB container constants (glTF 2.0 spec, section 4.4 "Binary glTF Layout")
+GLB_MAGIC = 0x46546C67  # "glTF"
+GLB_HEADER_SIZE = 12
+GLB_CHUNK_HEADER_SIZE = 8
+GLB_CHUNK_JSON = 0x4E4F534A  # "JSON"
+GLB_CHUNK_BIN = 0x004E4942  # "BIN\0"
+
+
+class GLBReader:
+    """
+    Memory-mapped GLB container reader.
+
+    Only the header, chunk table and JSON chunk are touched when the file is
+    opened. The BIN chunk is exposed lazily as a zero-copy ``memoryview`` over
+    the mapping, so metadata-only checks never page in vertex or image data.
+    """
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self.version = None
+        self.json_chunk = (0, 0)  # (offset, length) within the file
+        self.bin_chunk = None  # (offset, length) or None when absent
+        self._file = open(self.path, 'rb')
+        self._mmap = None
+        self._bin_view = None
+        try:
+            self._map_and_index()
+        except Exception:
+            self.close()
+            raise
+    
+    def _map_and_index(self):
+        """Validate the 12-byte header and walk the chunk table"""
+        file_size = os.fstat(self._file.fileno()).st_size
+        if file_size < GLB_HEADER_SIZE:
+            raise ValueError(f"GLB too small: {file_size} bytes (header needs {GLB_HEADER_SIZE})")
+        
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        magic, version, length = struct.unpack_from('<III', self._mmap, 0)
+        if magic != GLB_MAGIC:
+            raise ValueError("Not a GLB file: bad magic (expected 'glTF')")
+        if version != 2:
+            raise ValueError(f"Unsupported GLB container version: {version} (expected 2)")
+        if length > file_size:
+            raise ValueError(f"GLB header declares {length} bytes but file has {file_size}")
+        self.version = version
+        
+        offset = GLB_HEADER_SIZE
+        chunk_index = 0
+        while offset + GLB_CHUNK_HEADER_SIZE <= length:
+            chunk_length, chunk_type = struct.unpack_from('<II', self._mmap, offset)
+            data_start = offset + GLB_CHUNK_HEADER_SIZE
+            data_end = data_start + chunk_length
+            if data_end > length:
+                raise ValueError(f"GLB chunk {chunk_index} overruns file ({data_end} > {length})")
+            
+            if chunk_index == 0:
+                if chunk_type != GLB_CHUNK_JSON:
+                    raise ValueError("First GLB chunk must be JSON")
+                self.json_chunk = (data_start, chunk_length)
+            elif chunk_index == 1 and chunk_type == GLB_CHUNK_BIN:
+                self.bin_chunk = (data_start, chunk_length)
+            # Other chunk types must be ignored per the spec
+            
+            # Chunks are 4-byte aligned
+            offset = data_end + (-chunk_length % 4)
+            chunk_index += 1
+        
+        if chunk_index == 0:
+            raise ValueError("GLB contains no JSON chunk")
+    
+    def json_text(self) -> str:
+        """Decode the JSON chunk (the only chunk that is copied)"""
+        start, length = self.json_chunk
+        return self._mmap[start:start + length].decode('utf-8')
+    
+    def load_gltf(self):
+        """Build a pygltflib document from the JSON chunk only"""
+        gltf = gltf_from_dict(json.loads(self.json_text()))
+        gltf._path = self.path.parent
+        gltf._name = self.path.name
+        return gltf
+    
+    @property
+    def bin_data(self) -> Optional[memoryview]:
+        """Zero-copy view of the BIN chunk, or None if the GLB has none"""
+        if self.bin_chunk is None:
+            return None
+        if self._bin_view is None:
+            start, length = self.bin_chunk
+            self._bin_view = memoryview(self._mmap)[start:start + length]
+        return self._bin_view
+    
+    def close(self):
+        """Release the mapping; views still held elsewhere keep it alive until collected"""
+        if self._bin_view is not None:
+            try:
+                self._bin_view.release()
+            except BufferError:
+                pass
+            self._bin_view = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class AccessorCache:
+    """
+    In-memory LRU of decoded accessor arrays, shared by every check of one
+    validation so each accessor is decoded at most once.
+    
+    Only arrays that own their memory (normalized, sparse or padded-matrix
+    decodes) count against ``max_bytes``; zero-copy views over buffer data
+    are free to keep. Cached arrays are read-only so no check can alter the
+    data another check sees.
+    """
+    
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[int, np.ndarray]' = OrderedDict()
+    
+    @staticmethod
+    def _cost(values: np.ndarray) -> int:
+        return values.nbytes if values.flags.owndata else 0
+    
+    def get(self, key: int) -> Optional[np.ndarray]:
+        values = self._entries.get(key)
+        if values is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return values
+    
+    def put(self, key: int, values: np.ndarray):
+        values.flags.writeable = False
+        cost = self._cost(values)
+        if cost > self.max_bytes:
+            return  # Larger than the whole budget: hand it out uncached
+        if key in self._entries:
+            self.current_bytes -= self._cost(self._entries.pop(key))
+        self._entries[key] = values
+        self.current_bytes += cost
+        while self.current_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= self._cost(evicted)
+            self.evictions += 1
+    
+    def clear(self):
+        self._entries.clear()
+        self.current_bytes = 0
+    
+    def stats(self) -> Dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
 
 
 @dataclass
@@ -29,7 +973,7 @@ class ValidationResult:
     """Stores validation results for a specific check"""
     category: str
     check_name: str
-    status: str  # "PASS", "FAIL", "WARNING", "INFO"
+    status: str  # "PASS", "FAIL", "WARNING", "INFO", "SKIPPED", "TIMEOUT"
     message: str
     details: Optional[Dict] = None
 
@@ -39,10 +983,263 @@ class ComplianceReport:
     """Complete compliance report"""
     model_name: str
     validation_time: str
-    overall_status: str  # "COMPLIANT", "NON_COMPLIANT", "WARNING"
+    overall_status: str  # "COMPLIANT", "NON_COMPLIANT", "WARNING", "TIMEOUT", "INCOMPLETE"
     results: List[ValidationResult]
     summary: Dict[str, int]
     model_info: Dict[str, any]
+    # Per-phase cost: {phase: {"wall_ms", "cpu_ms"}}, plus "peak_alloc_kb"
+    # only under --profile, the one mode that traces allocations
+    timings: Dict[str, Dict[str, Optional[float]]] = field(default_factory=dict)
+
+
+class ValidationTimeout(BaseException):
+    """
+    Raised at a cancellation point once a validation's deadline has passed.
+    
+    A BaseException, like asyncio.CancelledError, so the broad
+    ``except Exception`` handlers inside checks do not swallow it.
+    """
+
+
+def summarize_results(results: List[ValidationResult]) -> Tuple[Dict[str, int], str]:
+    """Count statuses and derive the overall compliance status"""
+    summary = {
+        "PASS": sum(1 for r in results if r.status == "PASS"),
+        "FAIL": sum(1 for r in results if r.status == "FAIL"),
+        "WARNING": sum(1 for r in results if r.status == "WARNING"),
+        "INFO": sum(1 for r in results if r.status == "INFO")
+    }
+    for status in ("SKIPPED", "TIMEOUT"):
+        count = sum(1 for r in results if r.status == status)
+        if count:
+            summary[status] = count
+    
+    # A failure is final; checks cut short by the deadline leave anything else open
+    if summary["FAIL"] > 0:
+        overall_status = "NON_COMPLIANT"
+    elif summary.get("TIMEOUT"):
+        overall_status = "TIMEOUT"
+    elif summary.get("SKIPPED"):
+        overall_status = "INCOMPLETE"  # e.g. a quick look: no failure among the checks that ran
+    elif summary["WARNING"] > 0:
+        overall_status = "WARNING"
+    else:
+        overall_status = "COMPLIANT"
+    
+    return summary, overall_status
+
+
+def referenced_uris(model_path) -> List[str]:
+    """External (non data:) buffer and image URIs named by a model's JSON"""
+    model_path = Path(model_path)
+    if model_path.suffix.lower() == '.glb':
+        with GLBReader(model_path) as glb:
+            doc = json.loads(glb.json_text())
+    else:
+        with open(model_path, 'r', encoding='utf-8') as f:
+            doc = json.load(f)
+    
+    uris = []
+    for entry in doc.get("buffers", []) + doc.get("images", []):
+        uri = entry.get("uri")
+        if uri and not uri.startswith('data:'):
+            uris.append(uri)
+    return sorted(set(uris))
+
+
+# Khronos glTF Validator (https://github.com/KhronosGroup/glTF-Validator)
+GLTF_VALIDATOR_COMMAND = 'gltf_validator'
+GLTF_VALIDATOR_INSTALL_HINT = "Install from: https://github.com/KhronosGroup/glTF-Validator"
+GLTF_VALIDATOR_MAX_MESSAGES = 10
+
+
+@functools.lru_cache(maxsize=None)
+def gltf_validator_available(probe_timeout: float = 5) -> bool:
+    """Probe for the Khronos CLI once per process"""
+    try:
+        result = subprocess.run(
+            [GLTF_VALIDATOR_COMMAND, '--version'],
+            capture_output=True,
+            text=True,
+            timeout=probe_timeout
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
+
+def _khronos_validation_result(report: Dict) -> ValidationResult:
+    """Turn one Khronos JSON report into a ValidationResult"""
+    issues = report.get("issues", {})
+    errors = issues.get("numErrors", 0)
+    warnings = issues.get("numWarnings", 0)
+    messages = [
+        f"{m.get('code')}: {m.get('message')}" + (f" ({m['pointer']})" if m.get('pointer') else "")
+        for m in issues.get("messages", [])
+        if m.get("severity", 0) <= 1  # 0 = error, 1 = warning
+    ][:GLTF_VALIDATOR_MAX_MESSAGES]
+    details = {
+        "errors": errors,
+        "warnings": warnings,
+        "validator_version": report.get("validatorVersion"),
+        "messages": messages
+    }
+    
+    if errors == 0:
+        return ValidationResult(
+            category="Official Validation",
+            check_name="Khronos glTF Validator",
+            status="PASS",
+            message="Model passed official glTF validation"
+            + (f" ({warnings} warning(s))" if warnings else ""),
+            details=details
+        )
+    return ValidationResult(
+        category="Official Validation",
+        check_name="Khronos glTF Validator",
+        status="FAIL",
+        message=f"Model failed glTF validation: {errors} error(s), {warnings} warning(s)",
+        details=details
+    )
+
+
+def _stage_for_khronos(model_path: Path, stage_dir: Path):
+    """
+    Link a model (and any external files it references) into its own directory.
+    
+    The model is placed deep enough below ``stage_dir`` that URIs climbing
+    out of its folder (``../shared/tex.png``) still land inside it, so models
+    staged side by side never share each other's files and nothing is linked
+    outside the scratch tree. Absolute URIs are not staged; the validator
+    reports them as missing.
+    """
+    stage_dir.mkdir()
+    try:
+        # URIs are percent-encoded; link the files under their on-disk names
+        uris = [unquote(uri) for uri in referenced_uris(model_path)]
+    except (OSError, ValueError):
+        uris = []  # The validator will report the broken file itself
+    
+    relative = [os.path.normpath(uri) for uri in uris if not os.path.isabs(uri)]
+    depth = max((uri.split(os.sep).count(os.pardir) for uri in relative), default=0)
+    model_dir = stage_dir.joinpath(*['_'] * depth)
+    root = stage_dir.resolve()
+    
+    for name in [model_path.name] + relative:
+        source = model_path.parent / name
+        target = Path(os.path.normpath(model_dir.resolve() / name))
+        if root not in target.parents or not source.exists() or target.exists():
+            continue
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.symlink(source.resolve(), target)
+            except OSError:
+                shutil.copy2(source, target)
+        except OSError:
+            continue  # e.g. a path too long to stage; the validator reports it missing
+
+
+class KhronosCancel:
+    """Lets another thread stop a run_khronos_validator call and kill its process"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._process = None
+        self.cancelled = False
+    
+    def _attach(self, process: subprocess.Popen) -> bool:
+        """Register the running validator; False if cancel() already happened"""
+        with self._lock:
+            self._process = process
+            return not self.cancelled
+    
+    def cancel(self):
+        with self._lock:
+            self.cancelled = True
+            if self._process is not None and self._process.poll() is None:
+                self._process.kill()
+
+
+def run_khronos_validator(model_paths: List[str], timeout: float = 30,
+                          cancel: Optional[KhronosCancel] = None) -> Dict[str, ValidationResult]:
+    """
+    Validate many models with a single Khronos validator process.
+    
+    Each model is linked into its own subdirectory of a scratch directory,
+    the validator is run once on that directory (a directory input is
+    searched recursively), and the ``*.report.json`` file it writes beside
+    each model is parsed back into a ValidationResult. ``timeout`` applies
+    to the whole invocation; ``cancel`` kills the process early. Returns a
+    mapping keyed by the paths as given.
+    """
+    results: Dict[str, ValidationResult] = {}
+    if not model_paths:
+        return results
+    
+    if not gltf_validator_available():
+        for path in model_paths:
+            results[path] = ValidationResult(
+                category="Official Validation",
+                check_name="Khronos glTF Validator",
+                status="INFO",
+                message=f"glTF Validator not installed. {GLTF_VALIDATOR_INSTALL_HINT}"
+            )
+        return results
+    
+    with tempfile.TemporaryDirectory(prefix="gltf_validator_") as scratch:
+        stage_dirs = {}
+        for i, path in enumerate(model_paths):
+            stage_dirs[path] = Path(scratch) / f"{i:06d}"
+            _stage_for_khronos(Path(path), stage_dirs[path])
+        
+        failure = None
+        try:
+            # --validate-resources (-r) checks the buffers and images each
+            # model references; it does not control directory traversal.
+            # Results come from the report files, so output is discarded.
+            process = subprocess.Popen(
+                [GLTF_VALIDATOR_COMMAND, '--validate-resources', scratch],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        except Exception as e:
+            failure = f"Could not run glTF Validator: {str(e)}"
+        else:
+            try:
+                if cancel is not None and not cancel._attach(process):
+                    process.kill()
+                process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                failure = "glTF Validator timed out"
+            finally:
+                # Also reached when a deadline or alarm interrupts the wait
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+            if cancel is not None and cancel.cancelled:
+                failure = "glTF Validator cancelled"
+        
+        for path, stage_dir in stage_dirs.items():
+            reports = sorted(stage_dir.rglob('*.report.json'))
+            if failure is None and reports:
+                try:
+                    with open(reports[0]) as f:
+                        results[path] = _khronos_validation_result(json.load(f))
+                    continue
+                except (OSError, ValueError) as e:
+                    failure_for_path = f"Could not read glTF Validator report: {str(e)}"
+            else:
+                failure_for_path = failure or "glTF Validator produced no report"
+            
+            results[path] = ValidationResult(
+                category="Official Validation",
+                check_name="Khronos glTF Validator",
+                status="WARNING",
+                message=failure_for_path
+            )
+    
+    return results
 
 
 class AmazonGLTFValidator:
@@ -64,37 +1261,303 @@ class AmazonGLTFValidator:
         'KHR_interactivity'
     ]
     
-    def __init__(self, model_path: str):
+    # Bump whenever check logic changes so cached reports are invalidated;
+    # class constants are fingerprinted on their own by ruleset_version()
+    RULESET_VERSION = 6
+    
+    # Thread pool size for per-texture checks
+    TEXTURE_WORKERS = 8
+    
+    # Seconds allowed for the external Khronos validator
+    GLTF_VALIDATOR_TIMEOUT = 30
+    
+    # Placement types (match the Blender add-on) and pivot tolerance as a
+    # fraction of the model's largest dimension
+    ALIGNMENT_TYPES = ['FLOOR', 'WALL', 'CEILING']
+    PIVOT_TOLERANCE = 0.01
+    # Triangles whose edge cross product is this small relative to the edge
+    # lengths are zero-area at float32 precision
+    DEGENERATE_TOLERANCE = 1e-7
+    INTEGRITY_SAMPLES = 5
+    # Declared bounds are float32 values rounded through JSON
+    BOUNDS_RTOL = 1e-5
+    BOUNDS_ATOL = 1e-6
+    BOUNDS_SAMPLE_THRESHOLD = 1_000_000  # Elements; larger accessors are sampled when sample_bounds is set
+    BOUNDS_SAMPLE_SIZE = 65_536
+    UNIT_LENGTH_TOLERANCE = 1e-3
+    UV_RASTER_SIZE = 256
+    UV_MIN_UTILIZATION = 0.5  # Below this, most of the texture's texels are never sampled
+    DECODED_TEXEL_BYTES = 4  # Images without a GPU-compressed format upload as RGBA8
+    COMPRESSED_TEXEL_BYTES = 1
+    CONTENT_PROXY_SIZE = 256  # Texture content is judged on a proxy about this size
+    FLAT_CHANNEL_RANGE = 2  # A channel whose values span no more than this is constant
+    LOSSY_CHANNEL_RANGE = 8  # The same for JPEG and lossy WebP, whose quantisation adds noise
+    ACCESSOR_CACHE_BYTES = 256 * 1024 * 1024
+    # Quick look: checks that need only metadata, image headers and vertex samples
+    QUICK_LOOK_PHASES = ["file_format", "geometry", "bounds", "textures", "footprint",
+                         "materials", "alignment", "extensions"]
+    QUICK_LOOK_BLOCKS = 32  # Contiguous runs sampled per POSITION accessor
+    QUICK_LOOK_BLOCK_SIZE = 256  # Vertices per run
+    
+    # Fail-fast check order, cheapest first: JSON-only checks, geometry data,
+    # textures, then the external validator. Alignment follows bounds so it
+    # sees the verified extents, as in a full run.
+    GATE_ORDER = [
+        "file_format", "geometry", "materials", "extensions",
+        "integrity", "bounds", "alignment", "normals", "topology", "uv_coverage",
+        "textures", "footprint", "texture_content",
+        "gltf_validator", "quick_look",
+    ]
+    
+    def __init__(self, model_path: str, texture_workers: Optional[int] = None,
+                 cache: Optional['ValidationCache'] = None, run_external_validator: bool = True,
+                 alignment_type: str = 'FLOOR', sample_bounds: bool = False, fail_fast: bool = False,
+                 deadline: Optional[float] = None, quick_look: bool = False):
         self.model_path = Path(model_path)
+        self.alignment_type = alignment_type.upper()
+        # Check min/max of very large accessors on a strided sample only
+        self.sample_bounds = sample_bounds
+        # Gate mode: run checks in GATE_ORDER and stop at the first FAIL
+        self.fail_fast = fail_fast
+        self.skipped_checks: List[str] = []
+        # Seconds allowed for the whole validation; checks still running or
+        # not yet started when it passes are reported as TIMEOUT
+        self.deadline = deadline
+        self._deadline_at: Optional[float] = None
+        self.timed_out_checks: List[str] = []
+        # Quick look: estimates from metadata, headers and strided vertex
+        # samples, for a first answer on huge files
+        self.quick_look = quick_look
+        self.quick_estimates: Optional[Dict] = None
+        self._bounds_sampling = {"sampled": 0, "total": 0, "undeclared": [], "outside": []}
+        self.texture_workers = texture_workers or self.TEXTURE_WORKERS
+        self.cache = cache
+        # Batch callers disable this and run Khronos once for many models
+        self.run_external_validator = run_external_validator
+        self._khronos_future = None
+        self.timings: Dict[str, Dict[str, Optional[float]]] = {}
+        self._buffers: Dict[int, object] = {}  # buffer index -> bytes-like
+        self._scene_graph = None  # (world matrices, child_ptr, child_idx, node meshes), built on first use
+        self._scene_nodes_cache: Dict[int, np.ndarray] = {}
+        self._primitive_table = None
+        self._draco_primitives: List[Dict] = []
+        self._decoded_bounds: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}  # accessor -> actual (min, max)
+        self._image_headers: Dict[int, Optional[Dict]] = {}
+        self.footprint: Optional[Dict] = None
+        self._buffer_maps: List[mmap.mmap] = []
+        self.accessors = AccessorCache(self.ACCESSOR_CACHE_BYTES)
         self.results: List[ValidationResult] = []
         self.gltf = None
+        self.glb = None  # GLBReader for .glb inputs
         self.model_dir = self.model_path.parent
         
+    @classmethod
+    def ruleset_version(cls) -> str:
+        """
+        Fingerprint of the limits and rules a report was produced under.
+        
+        Covers RULESET_VERSION and every other upper-case class constant, so
+        changing any threshold, tolerance or sample size (here or in a
+        subclass) invalidates cached reports without a manual bump.
+        """
+        rules = {
+            name: getattr(cls, name)
+            for name in dir(cls)
+            if name.isupper() and not callable(getattr(cls, name))
+        }
+        return hashlib.sha256(json.dumps(rules, sort_keys=True, default=repr).encode()).hexdigest()
+    
     def validate(self) -> ComplianceReport:
         """Run all validation checks"""
         print(f"🔍 Validating: {self.model_path.name}")
         print("=" * 60)
+        if self.deadline is not None:
+            self._deadline_at = time.monotonic() + self.deadline
         
-        # Load the model
-        if not self._load_model():
-            return self._generate_report()
+        cache_key = None
+        # A quick look skips the cache: hashing a huge file costs more than the look itself
+        if self.cache is not None and not self.quick_look:
+            try:
+                # Reports with and without the Khronos result are cached separately
+                external = self.run_external_validator and gltf_validator_available()
+                variant = f"{self.ruleset_version()}:{self.alignment_type}"
+                variant += ":khronos" if external else ""
+                variant += ":sampled-bounds" if self.sample_bounds else ""
+                variant += ":fail-fast" if self.fail_fast else ""
+                cache_key = self.cache.key_for(self.model_path, variant)
+            except OSError:
+                cache_key = None  # Unreadable inputs: validate normally and report the error
+            
+            if cache_key is not None:
+                cached = self._timed("cache_lookup", lambda: self.cache.get(cache_key))
+                if cached is not None:
+                    print("⚡ Cache hit - returning stored report")
+                    cached.model_name = self.model_path.name
+                    cached.model_info["filename"] = self.model_path.name
+                    cached.model_info["cached"] = True
+                    cached.timings = self.timings
+                    return cached
         
-        # Run all validation checks
-        self._validate_file_format()
-        self._validate_geometry()
-        self._validate_textures()
-        self._validate_materials()
-        self._validate_alignment()
-        self._validate_extensions()
-        self._run_gltf_validator()
+        report = self._run_checks()
+        if cache_key is not None and not self.timed_out_checks:
+            self.cache.put(cache_key, report)
+        return report
+    
+    def _run_checks(self) -> ComplianceReport:
+        """Load the model and run every check"""
+        # Start the external validator first so it overlaps the Python checks;
+        # gate mode defers it until every cheaper check has passed
+        khronos_executor = None
+        khronos_cancel = KhronosCancel()
+        if self.run_external_validator and not (self.fail_fast or self.quick_look) \
+                and gltf_validator_available():
+            khronos_executor = ThreadPoolExecutor(max_workers=1)
+            self._khronos_future = khronos_executor.submit(
+                run_khronos_validator, [str(self.model_path)], self.GLTF_VALIDATOR_TIMEOUT, khronos_cancel
+            )
         
-        return self._generate_report()
+        try:
+            checks = self._checks()
+            not_in_quick_look = []
+            if self.quick_look:
+                not_in_quick_look = [phase for phase, _ in checks if phase not in self.QUICK_LOOK_PHASES]
+                checks = [item for item in checks if item[0] in self.QUICK_LOOK_PHASES]
+                checks.append(("quick_look", self._summarize_quick_look))
+            if self.fail_fast:
+                rank = {phase: i for i, phase in enumerate(self.GATE_ORDER)}
+                checks.sort(key=lambda item: rank.get(item[0], len(rank)))
+            
+            # Load the model
+            if not self._timed("load_model", self._load_model):
+                if self.fail_fast:
+                    self._skip_checks([phase for phase, _ in checks], self._gate_reason())
+                return self._generate_report()
+            
+            # Run all validation checks
+            for position, (phase, check) in enumerate(checks):
+                first_result = len(self.results)
+                started = False
+                try:
+                    self._check_deadline()
+                    started = True
+                    self._timed(phase, check)
+                except ValidationTimeout:
+                    # Results the interrupted check already recorded stand
+                    not_started = [p for p, _ in checks[position + 1:]]
+                    if not started:
+                        not_started.insert(0, phase)
+                    self._time_out_checks(phase if started else None, not_started)
+                    break
+                if self.fail_fast and any(r.status == "FAIL" for r in self.results[first_result:]):
+                    self._skip_checks([phase for phase, _ in checks[position + 1:]], self._gate_reason())
+                    break
+            
+            if not_in_quick_look:
+                self._skip_checks(not_in_quick_look, "quick-look mode; run a full validation for exact results")
+            return self._generate_report()
+        finally:
+            if khronos_executor is not None:
+                # A deadline (or an earlier failure) can leave Khronos running;
+                # kill it rather than letting it hold this process for its timeout
+                khronos_cancel.cancel()
+                khronos_executor.shutdown(wait=True)
+                self._khronos_future = None
+            self._close_buffers()
+            if self.glb is not None:
+                self.glb.close()
+                self.glb = None
+    
+    def _checks(self) -> List[Tuple[str, callable]]:
+        """The ordered (phase name, check) list run after loading"""
+        checks = [
+            ("file_format", self._validate_file_format),
+            ("geometry", self._validate_geometry),
+            ("integrity", self._validate_mesh_integrity),
+            ("bounds", self._validate_accessor_bounds),
+            ("topology", self._validate_topology),
+            ("normals", self._validate_normals_tangents),
+            ("textures", self._validate_textures),
+            ("texture_content", self._validate_texture_content),
+            ("uv_coverage", self._validate_uv_coverage),
+            ("footprint", self._estimate_footprint),
+            ("materials", self._validate_materials),
+            ("alignment", self._validate_alignment),
+            ("extensions", self._validate_extensions),
+        ]
+        if self.run_external_validator:
+            checks.append(("gltf_validator", self._run_gltf_validator))
+        return checks
+    
+    def _check_deadline(self):
+        """Cancellation point: abort the running check once the deadline has passed"""
+        if self._deadline_at is not None and time.monotonic() > self._deadline_at:
+            raise ValidationTimeout()
+    
+    def _time_left(self) -> Optional[float]:
+        """Seconds until the deadline, or None without one"""
+        if self._deadline_at is None:
+            return None
+        return max(0.0, self._deadline_at - time.monotonic())
+    
+    def _time_out_checks(self, interrupted: Optional[str], phases: List[str]):
+        """Record the check cut short by the deadline, if any, and those never started"""
+        self.timed_out_checks = ([interrupted] if interrupted else []) + phases
+        for phase in self.timed_out_checks:
+            started = "Interrupted" if phase == interrupted else "Not started"
+            self.results.append(ValidationResult(
+                category="Timed Out Checks",
+                check_name=phase,
+                status="TIMEOUT",
+                message=f"{started}: validation deadline of {self.deadline}s reached"
+            ))
+    
+    def _gate_reason(self) -> str:
+        failure = next(r for r in self.results if r.status == "FAIL")
+        return f"fail-fast gate stopped at {failure.category} / {failure.check_name}"
+    
+    def _skip_checks(self, phases: List[str], reason: str):
+        """Record checks that were deliberately not run"""
+        self.skipped_checks.extend(phases)
+        for phase in phases:
+            self.results.append(ValidationResult(
+                category="Skipped Checks",
+                check_name=phase,
+                status="SKIPPED",
+                message=f"Not run: {reason}"
+            ))
+    
+    def _timed(self, phase: str, func):
+        """
+        Run ``func`` and record its wall time, process CPU time and, when
+        tracemalloc is tracing, its peak allocation above the starting level.
+        """
+        # Only --profile starts tracing, and it imports tracemalloc to do so
+        tracemalloc = sys.modules.get("tracemalloc")
+        tracing = tracemalloc is not None and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            start_alloc, _ = tracemalloc.get_traced_memory()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            return func()
+        finally:
+            entry = {
+                "wall_ms": round((time.perf_counter() - wall_start) * 1000, 3),
+                "cpu_ms": round((time.process_time() - cpu_start) * 1000, 3)
+            }
+            if tracing:
+                _, peak = tracemalloc.get_traced_memory()
+                entry["peak_alloc_kb"] = round(max(0, peak - start_alloc) / 1024, 1)
+            self.timings[phase] = entry
     
     def _load_model(self) -> bool:
         """Load the glTF model"""
         try:
             if self.model_path.suffix.lower() == '.glb':
-                self.gltf = pygltflib.GLTF2().load(str(self.model_path))
+                # Parse only the JSON chunk; BIN stays memory-mapped
+                self.glb = GLBReader(self.model_path)
+                self.gltf = self.glb.load_gltf()
                 self.results.append(ValidationResult(
                     category="File Format",
                     check_name="Model Loading",
@@ -102,7 +1565,10 @@ class AmazonGLTFValidator:
                     message="GLB model loaded successfully"
                 ))
             elif self.model_path.suffix.lower() == '.gltf':
-                self.gltf = pygltflib.GLTF2().load(str(self.model_path))
+                with open(self.model_path, 'r', encoding='utf-8') as f:
+                    self.gltf = gltf_from_dict(json.load(f))
+                self.gltf._path = self.model_dir
+                self.gltf._name = self.model_path.name
                 self.results.append(ValidationResult(
                     category="File Format",
                     check_name="Model Loading",
@@ -173,15 +1639,27 @@ class AmazonGLTFValidator:
             ))
             return
         
-        # Count total triangles
-        total_triangles = 0
-        for mesh in self.gltf.meshes:
-            for primitive in mesh.primitives:
-                if primitive.indices is not None:
-                    accessor = self.gltf.accessors[primitive.indices]
-                    # Assuming triangles (mode 4 or default)
-                    triangle_count = accessor.count // 3
-                    total_triangles += triangle_count
+        # Count rendered triangles in the active scene: every primitive honors
+        # its mode and is weighted by how many nodes instance its mesh
+        mesh_ids, modes, triangles, vertices = self._primitive_stats()
+        scene_index = self._active_scene_index()
+        instances = self._mesh_instance_counts(scene_index)[mesh_ids]
+        rendered = triangles * instances
+        total_triangles = int(rendered.sum())
+        
+        triangles_by_mode = {}
+        for mode in sorted(set(modes.tolist())):
+            name = MODE_NAMES.get(mode, f"MODE_{mode}")
+            triangles_by_mode[name] = int(rendered[modes == mode].sum())
+        
+        details = {
+            "triangle_count": total_triangles,
+            "limit": self.MAX_TRIANGLES,
+            "unique_mesh_triangles": int(triangles.sum()),
+            "vertex_count": int((vertices * instances).sum()),
+            "scene": scene_index,
+            "triangles_by_mode": triangles_by_mode
+        }
         
         # Triangle count check
         if total_triangles <= self.MAX_TRIANGLES:
@@ -190,7 +1668,7 @@ class AmazonGLTFValidator:
                 check_name="Triangle Count",
                 status="PASS",
                 message=f"Triangle count: {total_triangles:,} (limit: {self.MAX_TRIANGLES:,})",
-                details={"triangle_count": total_triangles, "limit": self.MAX_TRIANGLES}
+                details=details
             ))
         else:
             self.results.append(ValidationResult(
@@ -198,7 +1676,7 @@ class AmazonGLTFValidator:
                 check_name="Triangle Count",
                 status="FAIL",
                 message=f"Triangle count exceeds limit: {total_triangles:,} > {self.MAX_TRIANGLES:,}",
-                details={"triangle_count": total_triangles, "limit": self.MAX_TRIANGLES}
+                details=details
             ))
         
         # Check for animations, cameras, lights (should not exist)
@@ -239,6 +1717,827 @@ class AmazonGLTFValidator:
             status="INFO",
             message=f"Model has {len(self.gltf.meshes)} mesh(es) and {len(self.gltf.nodes)} node(s)"
         ))
+        
+        self._validate_instancing()
+        self._validate_draco()
+    
+    def _validate_draco(self):
+        """Report Draco primitive counts read from bitstream headers"""
+        if not self._draco_primitives:
+            return
+        
+        readable = [p for p in self._draco_primitives if "error" not in p]
+        if readable:
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Draco Compression",
+                status="INFO",
+                message=f"{len(readable)} Draco primitive(s): "
+                        f"{sum(p['faces'] for p in readable):,} faces, "
+                        f"{sum(p['points'] for p in readable):,} points (from bitstream headers)",
+                details={"primitives": readable}
+            ))
+        
+        mismatched = [
+            p for p in readable
+            if p["declared_triangles"] and p["declared_triangles"] != p["faces"]
+        ]
+        if mismatched:
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Draco Accessor Counts",
+                status="WARNING",
+                message=f"{len(mismatched)} Draco primitive(s) declare accessor counts that disagree "
+                        "with the compressed data. Header face counts were used",
+                details={"primitives": mismatched}
+            ))
+        
+        unreadable = [p for p in self._draco_primitives if "error" in p]
+        if unreadable:
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Draco Header",
+                status="WARNING",
+                message=f"Could not read {len(unreadable)} Draco bitstream header(s). "
+                        "Triangle counts fall back to accessor metadata",
+                details={"primitives": unreadable}
+            ))
+    
+    def _validate_instancing(self):
+        """Report per-scene instancing and meshes that no scene renders"""
+        scenes, orphaned = self._scene_statistics()
+        if scenes:
+            instances = self._mesh_instance_counts(self._active_scene_index())
+            instanced = {int(m): int(instances[m]) for m in np.flatnonzero(instances > 1)}
+            active = scenes[self._active_scene_index()] if self._active_scene_index() is not None else scenes[0]
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Scene Instancing",
+                status="INFO",
+                message=f"Active scene renders {active['mesh_instances']} mesh instance(s) of "
+                        f"{active['unique_meshes']} unique mesh(es): {active['rendered_triangles']:,} triangles",
+                details={"scenes": scenes, "instanced_meshes": instanced}
+            ))
+        
+        if len(orphaned):
+            names = [self.gltf.meshes[m].name or f"Mesh_{m}" for m in orphaned.tolist()]
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Orphaned Meshes",
+                status="WARNING",
+                message=f"{len(orphaned)} mesh(es) not reachable from any scene. "
+                        "They add download size but are never rendered",
+                details={"meshes": names}
+            ))
+    
+    def _primitive_element_count(self, primitive) -> int:
+        """Number of topology elements: index count, or vertex count if non-indexed"""
+        if primitive.indices is not None:
+            return self.gltf.accessors[primitive.indices].count
+        
+        position = getattr(primitive.attributes, "POSITION", None)
+        if position is not None:
+            return self.gltf.accessors[position].count
+        return 0
+    
+    def _primitive_stats(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Per-primitive (mesh index, mode, triangles, vertices) arrays,
+        built once per validation from accessor metadata and, for Draco
+        primitives, from the compressed bitstream header.
+        """
+        if self._primitive_table is None:
+            mesh_ids, modes, counts, vertices, draco_faces = [], [], [], [], []
+            for mesh_index, mesh in enumerate(self.gltf.meshes or []):
+                for primitive_index, primitive in enumerate(mesh.primitives):
+                    mode = MODE_TRIANGLES if primitive.mode is None else primitive.mode
+                    count = self._primitive_element_count(primitive)
+                    position = getattr(primitive.attributes, "POSITION", None)
+                    vertex_count = self.gltf.accessors[position].count if position is not None else 0
+                    
+                    faces = -1
+                    draco = (primitive.extensions or {}).get('KHR_draco_mesh_compression')
+                    if draco is not None:
+                        header = self._draco_primitive_header(mesh_index, primitive_index, draco, mode, count)
+                        if header is not None:
+                            # Draco decodes to a triangle list whatever the declared mode
+                            faces = header["faces"]
+                            vertex_count = vertex_count or header["points"]
+                    
+                    mesh_ids.append(mesh_index)
+                    modes.append(mode)
+                    counts.append(count)
+                    vertices.append(vertex_count)
+                    draco_faces.append(faces)
+            
+            modes = np.asarray(modes, dtype=np.int64)
+            draco_faces = np.asarray(draco_faces, dtype=np.int64)
+            self._primitive_table = (
+                np.asarray(mesh_ids, dtype=np.int64),
+                modes,
+                np.where(draco_faces >= 0, draco_faces, count_triangles(modes, counts)),
+                np.asarray(vertices, dtype=np.int64)
+            )
+        return self._primitive_table
+    
+    def _draco_primitive_header(self, mesh_index: int, primitive_index: int, draco: Dict,
+                                mode: int, declared_count: int) -> Optional[Dict]:
+        """Read a Draco primitive's bitstream header and record it for reporting"""
+        entry = {
+            "mesh": mesh_index,
+            "primitive": primitive_index,
+            "declared_triangles": int(count_triangles([mode], [declared_count])[0])
+        }
+        try:
+            header = read_draco_header(self._buffer_view_data(draco['bufferView']))
+        except (ValueError, KeyError, IndexError, TypeError, OSError) as e:
+            entry["error"] = str(e)
+            self._draco_primitives.append(entry)
+            return None
+        entry.update(header)
+        self._draco_primitives.append(entry)
+        return header
+    
+    def _buffer_view_data(self, view_index: int) -> memoryview:
+        """Zero-copy view of a bufferView's bytes"""
+        view = self.gltf.bufferViews[view_index]
+        data = self._buffer_data(view.buffer)
+        if data is None:
+            raise ValueError(f"bufferView {view_index} has no buffer data")
+        start = view.byteOffset or 0
+        end = start + view.byteLength
+        if end > len(data):
+            raise ValueError(f"bufferView {view_index} overruns its buffer")
+        return memoryview(data)[start:end]
+    
+    def _mesh_instance_counts(self, scene_index: Optional[int]) -> np.ndarray:
+        """How many times each mesh is rendered by a scene (all ones without scenes)"""
+        mesh_count = len(self.gltf.meshes or [])
+        if scene_index is None:
+            return np.ones(mesh_count, dtype=np.int64)
+        _, mesh_ids = self._scene_mesh_nodes(scene_index)
+        return np.bincount(mesh_ids, minlength=mesh_count)
+    
+    def _scene_statistics(self) -> Tuple[List[Dict], np.ndarray]:
+        """Per-scene rendered totals, plus the meshes no scene reaches"""
+        mesh_ids, _, triangles, vertices = self._primitive_stats()
+        mesh_count = len(self.gltf.meshes or [])
+        mesh_triangles = np.bincount(mesh_ids, weights=triangles, minlength=mesh_count).astype(np.int64)
+        mesh_vertices = np.bincount(mesh_ids, weights=vertices, minlength=mesh_count).astype(np.int64)
+        
+        scenes = []
+        referenced = np.zeros(mesh_count, dtype=bool)
+        for scene_index in range(len(self.gltf.scenes or [])):
+            instances = self._mesh_instance_counts(scene_index)
+            referenced |= instances > 0
+            scenes.append({
+                "scene": scene_index,
+                "name": self.gltf.scenes[scene_index].name,
+                "nodes": int(len(self._scene_nodes(scene_index))),
+                "mesh_instances": int(instances.sum()),
+                "unique_meshes": int((instances > 0).sum()),
+                "rendered_triangles": int(instances @ mesh_triangles),
+                "rendered_vertices": int(instances @ mesh_vertices)
+            })
+        return scenes, np.flatnonzero(~referenced)
+    
+    def _mesh_primitives(self, mesh_index: Optional[int] = None):
+        """(mesh index, primitive index, primitive) for every primitive with readable data"""
+        meshes = enumerate(self.gltf.meshes or []) if mesh_index is None \
+            else [(mesh_index, self.gltf.meshes[mesh_index])]
+        for mesh_index, mesh in meshes:
+            for primitive_index, primitive in enumerate(mesh.primitives):
+                if 'KHR_draco_mesh_compression' in (primitive.extensions or {}):
+                    continue  # Vertex data is only in the compressed stream
+                self._check_deadline()
+                yield mesh_index, primitive_index, primitive
+    
+    def _primitive_indices(self, primitive, vertex_count: int) -> Optional[np.ndarray]:
+        """Flat index stream of a primitive; implicit 0..n-1 when non-indexed"""
+        if primitive.indices is None:
+            return np.arange(vertex_count)
+        indices = self._read_accessor(primitive.indices)
+        return None if indices is None else indices[:, 0]
+    
+    def _validate_mesh_integrity(self):
+        """Check index bounds, degenerate/duplicate triangles and non-finite vertex data"""
+        if not self.gltf.meshes:
+            return
+        
+        issues = {name: [] for name in ("out_of_range", "non_finite_position", "non_finite_normal",
+                                        "degenerate", "duplicate")}
+        scanned = 0
+        unreadable = []
+        
+        def record(kind, mesh_index, primitive_index, offenders):
+            if len(offenders):
+                issues[kind].append({
+                    "mesh": mesh_index,
+                    "primitive": primitive_index,
+                    "count": int(len(offenders)),
+                    "sample": offenders[:self.INTEGRITY_SAMPLES].tolist()
+                })
+        
+        for mesh_index, primitive_index, primitive in self._mesh_primitives():
+            position = getattr(primitive.attributes, "POSITION", None)
+            if position is None:
+                continue
+            try:
+                positions = self._read_accessor(position)
+                normal = getattr(primitive.attributes, "NORMAL", None)
+                normals = self._read_accessor(normal) if normal is not None else None
+                indices = self._primitive_indices(primitive, self.gltf.accessors[position].count)
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                unreadable.append({"mesh": mesh_index, "primitive": primitive_index, "error": str(e)})
+                continue
+            if positions is None or indices is None:
+                continue
+            scanned += 1
+            
+            finite = np.isfinite(positions).all(axis=1)
+            record("non_finite_position", mesh_index, primitive_index, np.flatnonzero(~finite))
+            if normals is not None:
+                record("non_finite_normal", mesh_index, primitive_index,
+                       np.flatnonzero(~np.isfinite(normals).all(axis=1)))
+            
+            in_range = indices < len(positions)
+            record("out_of_range", mesh_index, primitive_index, np.flatnonzero(~in_range))
+            
+            mode = MODE_TRIANGLES if primitive.mode is None else primitive.mode
+            triangles = triangle_indices(indices, mode)
+            if len(triangles) == 0:
+                continue
+            if in_range.all():
+                degenerate, duplicate = self._degenerate_and_duplicate(triangles, positions)
+            else:
+                # Only triangles whose corners all exist can be measured
+                valid = np.flatnonzero((triangles < len(positions)).all(axis=1))
+                degenerate, duplicate = self._degenerate_and_duplicate(triangles[valid], positions)
+                degenerate, duplicate = valid[degenerate], valid[duplicate]
+            record("degenerate", mesh_index, primitive_index, degenerate)
+            record("duplicate", mesh_index, primitive_index, duplicate)
+        
+        self._report_integrity(issues, scanned, unreadable)
+    
+    @staticmethod
+    def _triangle_edges(triangles: np.ndarray, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(T, 3) float64 edge vectors from each triangle's first corner to its second and third"""
+        points = np.ascontiguousarray(positions[:, :3], dtype=np.float64)
+        origin = np.take(points, triangles[:, 0], axis=0)
+        return np.take(points, triangles[:, 1], axis=0) - origin, np.take(points, triangles[:, 2], axis=0) - origin
+    
+    def _degenerate_and_duplicate(self, triangles: np.ndarray, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Indices into ``triangles`` of zero-area triangles and of repeats of an earlier triangle"""
+        first, second, third = (triangles[:, k].astype(np.int64) for k in range(3))
+        edge1, edge2 = self._triangle_edges(triangles, positions)
+        cross = np.cross(edge1, edge2)
+        # |e1 x e2| <= tol * |e1| |e2|, compared squared to avoid square roots
+        cross_sq = np.einsum('ij,ij->i', cross, cross)
+        scale_sq = np.einsum('ij,ij->i', edge1, edge1) * np.einsum('ij,ij->i', edge2, edge2)
+        degenerate = np.flatnonzero(cross_sq <= self.DEGENERATE_TOLERANCE ** 2 * scale_sq)
+        
+        # Same three vertices in any order: sort each row, then compare neighbours
+        low = np.minimum(np.minimum(first, second), third)
+        high = np.maximum(np.maximum(first, second), third)
+        middle = first + second + third - low - high
+        vertex_count = len(positions)
+        if vertex_count < 2 ** 21:
+            # Pack the sorted row into one int64 so a single argsort suffices
+            keys = (low * vertex_count + middle) * vertex_count + high
+            order = np.argsort(keys, kind='stable')
+            keys = keys[order]
+            repeats = keys[1:] == keys[:-1]
+        else:
+            order = np.lexsort((high, middle, low))
+            repeats = (low[order][1:] == low[order][:-1]) & (middle[order][1:] == middle[order][:-1]) \
+                & (high[order][1:] == high[order][:-1])
+        collapsed = (low == middle) | (middle == high)  # Already reported as degenerate
+        repeats &= ~collapsed[order][1:]
+        duplicate = np.sort(order[1:][repeats])
+        return degenerate, duplicate
+    
+    def _report_integrity(self, issues: Dict[str, List[Dict]], scanned: int, unreadable: List[Dict]):
+        checks = [
+            ("out_of_range", "Index Bounds", "FAIL", "index value(s) reference missing vertices"),
+            ("non_finite_position", "Finite Positions", "FAIL", "vertex position(s) are NaN or infinite"),
+            ("non_finite_normal", "Finite Normals", "FAIL", "vertex normal(s) are NaN or infinite"),
+            ("degenerate", "Degenerate Triangles", "WARNING", "zero-area triangle(s)"),
+            ("duplicate", "Duplicate Triangles", "WARNING", "triangle(s) repeat an earlier triangle"),
+        ]
+        for kind, check_name, status, description in checks:
+            if not issues[kind]:
+                continue
+            total = sum(entry["count"] for entry in issues[kind])
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name=check_name,
+                status=status,
+                message=f"{total:,} {description} in {len(issues[kind])} primitive(s)",
+                details={"primitives": issues[kind]}
+            ))
+        
+        if unreadable:
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Mesh Integrity",
+                status="WARNING",
+                message=f"Could not read vertex data for {len(unreadable)} primitive(s)",
+                details={"primitives": unreadable}
+            ))
+        elif scanned and not any(issues.values()):
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Mesh Integrity",
+                status="PASS",
+                message=f"{scanned} primitive(s) have valid indices and finite, non-degenerate geometry"
+            ))
+    
+    def _validate_accessor_bounds(self):
+        """Compare declared POSITION min/max with the decoded vertex data"""
+        positions = sorted({
+            primitive.attributes.POSITION
+            for _, _, primitive in self._mesh_primitives()
+            if getattr(primitive.attributes, "POSITION", None) is not None
+        })
+        if not positions:
+            return
+        
+        checked, sampled = 0, 0
+        missing, mismatched, unreadable = [], [], []
+        for accessor_index in positions:
+            self._check_deadline()
+            accessor = self.gltf.accessors[accessor_index]
+            try:
+                if self.quick_look:
+                    values = self._sample_accessor(accessor_index)
+                else:
+                    values = self._read_accessor(accessor_index)
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                unreadable.append({"accessor": accessor_index, "error": str(e)})
+                continue
+            if values is None or len(values) == 0:
+                continue
+            
+            is_sample = self.quick_look and len(values) < accessor.count
+            if self.sample_bounds and values.size > self.BOUNDS_SAMPLE_THRESHOLD:
+                values = values[::-(-len(values) // self.BOUNDS_SAMPLE_SIZE)]
+                is_sample = True
+            # fmin/fmax skip NaN, which the integrity check reports on its own
+            actual_min = np.fmin.reduce(values, axis=0).astype(np.float64)
+            actual_max = np.fmax.reduce(values, axis=0).astype(np.float64)
+            self._bounds_sampling["sampled"] += len(values)
+            self._bounds_sampling["total"] += accessor.count
+            if not is_sample:
+                self._decoded_bounds[accessor_index] = (actual_min, actual_max)
+            
+            if not accessor.min or not accessor.max:
+                if self.quick_look and is_sample:
+                    # Lets alignment bound the mesh without reading every vertex
+                    self._decoded_bounds[accessor_index] = (actual_min, actual_max)
+                    self._bounds_sampling["undeclared"].append(accessor_index)
+                missing.append(accessor_index)
+                continue
+            checked += 1
+            sampled += is_sample
+            declared_min = np.asarray(accessor.min, dtype=np.float64)
+            declared_max = np.asarray(accessor.max, dtype=np.float64)
+            if accessor.normalized:
+                declared_min = normalize_components(declared_min, accessor.componentType)
+                declared_max = normalize_components(declared_max, accessor.componentType)
+            if declared_min.shape != actual_min.shape or declared_max.shape != actual_max.shape:
+                matches = False
+            elif is_sample:
+                # A sample cannot show that bounds are too loose, only too tight
+                tolerance = self.BOUNDS_ATOL + self.BOUNDS_RTOL * np.abs(declared_max - declared_min)
+                matches = bool((actual_min >= declared_min - tolerance).all()
+                               and (actual_max <= declared_max + tolerance).all())
+            else:
+                matches = bool(np.allclose(declared_min, actual_min, rtol=self.BOUNDS_RTOL, atol=self.BOUNDS_ATOL)
+                               and np.allclose(declared_max, actual_max, rtol=self.BOUNDS_RTOL, atol=self.BOUNDS_ATOL))
+            if not matches:
+                if is_sample:
+                    self._bounds_sampling["outside"].append(accessor_index)
+                mismatched.append({
+                    "accessor": accessor_index,
+                    "declared_min": declared_min.tolist(),
+                    "declared_max": declared_max.tolist(),
+                    "actual_min": actual_min.tolist(),
+                    "actual_max": actual_max.tolist(),
+                    "sampled": is_sample
+                })
+        
+        sample_note = f" ({sampled} sampled)" if sampled else ""
+        if mismatched:
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Accessor Bounds",
+                status="WARNING",
+                message=f"{len(mismatched)} of {checked} POSITION accessor(s) declare min/max that "
+                        f"do not match their data{sample_note}",
+                details={"accessors": mismatched}
+            ))
+        elif checked:
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Accessor Bounds",
+                status="PASS",
+                message=f"Declared min/max match the data of {checked} POSITION accessor(s){sample_note}"
+            ))
+        if missing:
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Missing Accessor Bounds",
+                status="WARNING",
+                message=f"{len(missing)} POSITION accessor(s) have no min/max (required by glTF 2.0)",
+                details={"accessors": missing}
+            ))
+        if unreadable:
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Accessor Bounds",
+                status="WARNING",
+                message=f"Could not read {len(unreadable)} POSITION accessor(s)",
+                details={"accessors": unreadable}
+            ))
+    
+    def _sample_accessor(self, accessor_index: int) -> Optional[np.ndarray]:
+        """
+        QUICK_LOOK_BLOCKS evenly spaced runs of an accessor's elements, first
+        and last included. Dense accessors are sliced from the strided view,
+        so only the sampled pages of a mapped buffer are ever read.
+        """
+        accessor = self.gltf.accessors[accessor_index]
+        if accessor.sparse is not None or accessor.bufferView is None:
+            values = self._read_accessor(accessor_index)
+            normalized = False
+        else:
+            if self._buffer_data(self.gltf.bufferViews[accessor.bufferView].buffer) is None:
+                return None
+            values = self._strided_view(accessor.bufferView, accessor.byteOffset or 0, accessor.count,
+                                        accessor.componentType, accessor.type)
+            normalized = accessor.normalized
+        if values is None:
+            return None
+        
+        block = self.QUICK_LOOK_BLOCK_SIZE
+        if len(values) > self.QUICK_LOOK_BLOCKS * block:
+            starts = np.linspace(0, len(values) - block, self.QUICK_LOOK_BLOCKS).astype(np.int64)
+            values = np.concatenate([values[start:start + block] for start in starts.tolist()])
+        if normalized:
+            values = normalize_components(values, accessor.componentType)
+        return values
+    
+    def _summarize_quick_look(self):
+        """Quick-look estimates of size, bounds, textures and footprint, each with a confidence"""
+        mesh_ids, _, triangles, vertices = self._primitive_stats()
+        instances = self._mesh_instance_counts(self._active_scene_index())[mesh_ids]
+        estimates = {
+            "triangles": {
+                "value": int((triangles * instances).sum()),
+                "confidence": "exact",
+                "basis": "accessor counts and Draco headers"
+            },
+            "vertices": {
+                "value": int((vertices * instances).sum()),
+                "confidence": "exact",
+                "basis": "accessor counts"
+            }
+        }
+        
+        sampling = self._bounds_sampling
+        try:
+            bounds = self._world_bounds()
+        except (ValueError, KeyError, IndexError, OSError):
+            bounds = None
+        if bounds is not None:
+            if sampling["outside"]:
+                confidence, basis = "low", "sampled vertices fall outside the declared min/max"
+            elif sampling["undeclared"]:
+                confidence, basis = "medium", "some accessors lack min/max; bounded from samples, may be too tight"
+            elif sampling["sampled"] < sampling["total"]:
+                confidence, basis = "high", "declared min/max, consistent with sampled vertices"
+            else:
+                confidence, basis = "exact", "every vertex read"
+            estimates["bounds"] = {
+                "min": [round(float(v), 4) for v in bounds[0]],
+                "max": [round(float(v), 4) for v in bounds[1]],
+                "size": [round(float(v), 4) for v in bounds[1] - bounds[0]],
+                "confidence": confidence,
+                "basis": basis,
+                "sampled_vertices": sampling["sampled"],
+                "total_vertices": sampling["total"]
+            }
+        
+        textures = []
+        for image_index in range(len(self.gltf.images or [])):
+            header = self._image_header(image_index)
+            textures.append({
+                "image": image_index,
+                "format": header["format"] if header else None,
+                "width": header["width"] if header else None,
+                "height": header["height"] if header else None,
+                "confidence": "exact" if header else "unknown"
+            })
+        estimates["textures"] = {"images": textures, "basis": "image headers only; content not decoded"}
+        
+        if self.footprint:
+            estimates["footprint"] = dict(
+                self.footprint["totals"],
+                confidence="medium",
+                basis="metadata and image headers; full mip chains, RGBA8 upload for PNG/JPEG/WebP"
+            )
+        self.quick_estimates = estimates
+        
+        parts = [f"{estimates['triangles']['value']:,} triangles (exact)"]
+        if "bounds" in estimates:
+            size = " x ".join(f"{v:.3g}" for v in estimates["bounds"]["size"])
+            parts.append(f"bounds {size} ({estimates['bounds']['confidence']})")
+        known = [t for t in textures if t["width"]]
+        if known:
+            largest = max(known, key=lambda t: t["width"] * t["height"])
+            parts.append(f"{len(textures)} texture(s), largest {largest['width']}x{largest['height']} (exact)")
+        if "footprint" in estimates:
+            parts.append(f"~{estimates['footprint']['gpu_mb']:.1f} MB GPU (medium)")
+        self.results.append(ValidationResult(
+            category="Quick Look",
+            check_name="Estimates",
+            status="INFO",
+            message="; ".join(parts),
+            details=estimates
+        ))
+    
+    def _mesh_triangles(self, mesh_index: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        All triangles of a mesh over its welded vertices: ((T, 3) welded ids,
+        (V, 3) distinct positions). Primitives share welded vertices where
+        their positions coincide, so material splits do not open seams.
+        """
+        points, triangles, offset = [], [], 0
+        for _, _, primitive in self._mesh_primitives(mesh_index):
+            mode = MODE_TRIANGLES if primitive.mode is None else primitive.mode
+            position = getattr(primitive.attributes, "POSITION", None)
+            if position is None or mode not in (MODE_TRIANGLES, MODE_TRIANGLE_STRIP, MODE_TRIANGLE_FAN):
+                continue
+            positions = self._read_accessor(position)
+            indices = self._primitive_indices(primitive, self.gltf.accessors[position].count)
+            if positions is None or indices is None:
+                continue
+            primitive_triangles = triangle_indices(indices, mode).astype(np.int64)
+            # Out-of-range indices are reported by the integrity check
+            primitive_triangles = primitive_triangles[(primitive_triangles < len(positions)).all(axis=1)]
+            points.append(positions[:, :3])
+            triangles.append(primitive_triangles + offset)
+            offset += len(positions)
+        
+        if not triangles:
+            return None
+        ids, distinct = weld_vertices(np.concatenate(points))
+        welded_points = np.empty((distinct, 3), dtype=points[0].dtype)
+        welded_points[ids] = np.concatenate(points)
+        return ids[np.concatenate(triangles)], welded_points
+    
+    def _validate_topology(self):
+        """Count boundary and non-manifold edges and connected components per mesh"""
+        if not self.gltf.meshes:
+            return
+        
+        meshes, unreadable = [], []
+        for mesh_index in range(len(self.gltf.meshes)):
+            try:
+                welded = self._mesh_triangles(mesh_index)
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                unreadable.append({"mesh": mesh_index, "error": str(e)})
+                continue
+            if welded is None:
+                continue
+            triangles, points = welded
+            edges, counts = edge_multiplicities(triangles, len(points))
+            labels = connected_components(len(points), edges)
+            used = np.zeros(len(points), dtype=bool)
+            used[triangles.reshape(-1)] = True
+            
+            boundary = edges[counts == 1]
+            non_manifold = edges[counts > 2]
+            meshes.append({
+                "mesh": mesh_index,
+                "name": self.gltf.meshes[mesh_index].name,
+                "edges": int(len(edges)),
+                "boundary_edges": int(len(boundary)),
+                "non_manifold_edges": int(len(non_manifold)),
+                "components": int(np.count_nonzero(labels[used] == np.flatnonzero(used))),
+                "boundary_sample": points[boundary[:self.INTEGRITY_SAMPLES]].tolist(),
+                "non_manifold_sample": points[non_manifold[:self.INTEGRITY_SAMPLES]].tolist()
+            })
+        
+        if meshes:
+            self._report_topology(meshes)
+        if unreadable:
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Mesh Topology",
+                status="WARNING",
+                message=f"Could not read triangles of {len(unreadable)} mesh(es)",
+                details={"meshes": unreadable}
+            ))
+    
+    def _report_topology(self, meshes: List[Dict]):
+        open_meshes = [m for m in meshes if m["boundary_edges"]]
+        non_manifold = [m for m in meshes if m["non_manifold_edges"]]
+        
+        if open_meshes:
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Open Boundaries",
+                status="WARNING",
+                message=f"{sum(m['boundary_edges'] for m in open_meshes):,} boundary edge(s) "
+                        f"(holes or open borders) in {len(open_meshes)} mesh(es)",
+                details={"meshes": [{k: m[k] for k in ("mesh", "name", "boundary_edges", "boundary_sample")}
+                                    for m in open_meshes]}
+            ))
+        if non_manifold:
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Non-Manifold Edges",
+                status="WARNING",
+                message=f"{sum(m['non_manifold_edges'] for m in non_manifold):,} edge(s) shared by "
+                        f"more than two triangles in {len(non_manifold)} mesh(es)",
+                details={"meshes": [{k: m[k] for k in ("mesh", "name", "non_manifold_edges", "non_manifold_sample")}
+                                    for m in non_manifold]}
+            ))
+        if not open_meshes and not non_manifold:
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Mesh Topology",
+                status="PASS",
+                message=f"{len(meshes)} mesh(es) are closed and manifold"
+            ))
+        
+        self.results.append(ValidationResult(
+            category="Geometry",
+            check_name="Connected Components",
+            status="INFO",
+            message=f"{sum(m['components'] for m in meshes):,} connected component(s) across {len(meshes)} mesh(es)",
+            details={"meshes": [{k: m[k] for k in ("mesh", "name", "components", "edges")} for m in meshes]}
+        ))
+    
+    def _validate_normals_tangents(self):
+        """Check NORMAL/TANGENT vectors, missing tangents and winding against normals"""
+        if not self.gltf.meshes:
+            return
+        
+        materials = self.gltf.materials or []
+        bad_normals, bad_tangents, missing_tangents, inverted, unreadable = [], [], [], [], []
+        # material index -> [triangles checked, triangles wound against their normals]
+        winding_by_material: Dict[Optional[int], List[int]] = {}
+        
+        for mesh_index, primitive_index, primitive in self._mesh_primitives():
+            attributes = primitive.attributes
+            position = getattr(attributes, "POSITION", None)
+            normal = getattr(attributes, "NORMAL", None)
+            tangent = getattr(attributes, "TANGENT", None)
+            where = {"mesh": mesh_index, "primitive": primitive_index}
+            
+            material = materials[primitive.material] if primitive.material is not None \
+                and primitive.material < len(materials) else None
+            if material is not None and material.normalTexture is not None and tangent is None:
+                missing_tangents.append(dict(where, material=primitive.material))
+            
+            try:
+                normals = self._read_accessor(normal) if normal is not None else None
+                tangents = self._read_accessor(tangent) if tangent is not None else None
+                positions = self._read_accessor(position) if position is not None else None
+                indices = self._primitive_indices(primitive, self.gltf.accessors[position].count) \
+                    if position is not None else None
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                unreadable.append(dict(where, error=str(e)))
+                continue
+            
+            if normals is not None:
+                # Non-finite normals are reported by the integrity check
+                length = np.sqrt(np.einsum('ij,ij->i', normals[:, :3], normals[:, :3]))
+                off = np.flatnonzero(np.abs(length - 1.0) > self.UNIT_LENGTH_TOLERANCE)
+                if len(off):
+                    bad_normals.append(dict(where, count=int(len(off)),
+                                            sample=off[:self.INTEGRITY_SAMPLES].tolist()))
+            
+            if tangents is not None:
+                finite = np.isfinite(tangents).all(axis=1)
+                length = np.sqrt(np.einsum('ij,ij->i', tangents[:, :3], tangents[:, :3]))
+                problems = {
+                    "non_finite": ~finite,
+                    "non_unit": finite & (np.abs(length - 1.0) > self.UNIT_LENGTH_TOLERANCE),
+                    "bad_handedness": finite & (np.abs(np.abs(tangents[:, 3]) - 1.0) > self.UNIT_LENGTH_TOLERANCE)
+                        if tangents.shape[1] == 4 else np.zeros(len(tangents), dtype=bool),
+                }
+                counts = {name: int(np.count_nonzero(mask)) for name, mask in problems.items()}
+                if any(counts.values()):
+                    offenders = np.flatnonzero(problems["non_finite"] | problems["non_unit"] | problems["bad_handedness"])
+                    bad_tangents.append(dict(where, **counts, sample=offenders[:self.INTEGRITY_SAMPLES].tolist()))
+            
+            mode = MODE_TRIANGLES if primitive.mode is None else primitive.mode
+            if normals is None or positions is None or indices is None:
+                continue
+            triangles = triangle_indices(indices, mode).astype(np.int64)
+            triangles = triangles[(triangles < min(len(positions), len(normals))).all(axis=1)]
+            if len(triangles) == 0:
+                continue
+            
+            # Winding gives the face normal; compare it with the summed corner normals
+            edge1, edge2 = self._triangle_edges(triangles, positions)
+            face = np.cross(edge1, edge2)
+            corner_sum = normals[:, :3][triangles].sum(axis=1)
+            agreement = np.einsum('ij,ij->i', face, corner_sum)
+            against = np.flatnonzero(agreement < 0)
+            tally = winding_by_material.setdefault(primitive.material, [0, 0])
+            tally[0] += len(triangles)
+            tally[1] += len(against)
+            if len(against):
+                inverted.append(dict(where, material=primitive.material, triangles=int(len(triangles)),
+                                     inverted=int(len(against)), sample=against[:self.INTEGRITY_SAMPLES].tolist()))
+        
+        self._report_normals_tangents(bad_normals, bad_tangents, missing_tangents, inverted,
+                                      winding_by_material, unreadable)
+    
+    def _report_normals_tangents(self, bad_normals, bad_tangents, missing_tangents, inverted,
+                                 winding_by_material, unreadable):
+        materials = self.gltf.materials or []
+        
+        if bad_normals:
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Normal Vectors",
+                status="WARNING",
+                message=f"{sum(p['count'] for p in bad_normals):,} normal(s) are not unit length "
+                        f"in {len(bad_normals)} primitive(s)",
+                details={"primitives": bad_normals}
+            ))
+        if bad_tangents:
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Tangent Vectors",
+                status="WARNING",
+                message=f"Invalid tangents in {len(bad_tangents)} primitive(s): "
+                        f"{sum(p['non_finite'] for p in bad_tangents):,} non-finite, "
+                        f"{sum(p['non_unit'] for p in bad_tangents):,} not unit length, "
+                        f"{sum(p['bad_handedness'] for p in bad_tangents):,} with w not ±1",
+                details={"primitives": bad_tangents}
+            ))
+        if missing_tangents:
+            self.results.append(ValidationResult(
+                category="Materials",
+                check_name="Missing Tangents",
+                status="WARNING",
+                message=f"{len(missing_tangents)} normal-mapped primitive(s) have no TANGENT attribute. "
+                        "Viewers will generate tangents, which may not match the baked normal map",
+                details={"primitives": missing_tangents}
+            ))
+        
+        if inverted:
+            single_sided = [p for p in inverted
+                            if p["material"] is None or p["material"] >= len(materials)
+                            or not materials[p["material"]].doubleSided]
+            note = (f" {len(single_sided)} of these use single-sided materials, so the inverted faces "
+                    "are culled and show as holes" if single_sided
+                    else " All use double-sided materials, which hides the inverted faces")
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Winding Consistency",
+                status="WARNING",
+                message=f"{sum(p['inverted'] for p in inverted):,} triangle(s) in {len(inverted)} primitive(s) "
+                        f"are wound against their vertex normals.{note}",
+                details={"primitives": inverted}
+            ))
+        elif winding_by_material:
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Winding Consistency",
+                status="PASS",
+                message="Triangle winding agrees with vertex normals"
+            ))
+        
+        # Double-sided materials whose geometry is consistently wound can be made single-sided
+        for material_index, (checked, against) in sorted(winding_by_material.items(), key=lambda kv: str(kv[0])):
+            if material_index is None or material_index >= len(materials):
+                continue
+            material = materials[material_index]
+            if material.doubleSided and checked and not against:
+                self.results.append(ValidationResult(
+                    category="Materials",
+                    check_name=f"Material {material_index} Winding",
+                    status="INFO",
+                    message=f"Material '{material.name or f'Material_{material_index}'}' is double-sided, but its "
+                            f"{checked:,} triangle(s) are wound consistently with their normals. "
+                            "It can likely be made single-sided"
+                ))
+        
+        if unreadable:
+            self.results.append(ValidationResult(
+                category="Geometry",
+                check_name="Normal Vectors",
+                status="WARNING",
+                message=f"Could not read normal/tangent data for {len(unreadable)} primitive(s)",
+                details={"primitives": unreadable}
+            ))
     
     def _validate_textures(self):
         """Validate texture requirements"""
@@ -254,71 +2553,16 @@ class AmazonGLTFValidator:
         texture_issues = []
         texture_info = []
         
-        for idx, image in enumerate(self.gltf.images):
-            # Get image path
-            if image.uri:
-                if image.uri.startswith('data:'):
-                    self.results.append(ValidationResult(
-                        category="Textures",
-                        check_name=f"Texture {idx} Format",
-                        status="FAIL",
-                        message="Embedded textures (data URI) not allowed. Must use external files"
-                    ))
-                    continue
-                
-                image_path = self.model_dir / image.uri
-                
-                if not image_path.exists():
-                    texture_issues.append(f"Texture {idx} not found: {image.uri}")
-                    continue
-                
-                # Check file format
-                if image_path.suffix.lower() not in self.VALID_TEXTURE_FORMATS:
-                    texture_issues.append(
-                        f"Texture {idx} has invalid format: {image_path.suffix}. "
-                        f"Must be {', '.join(self.VALID_TEXTURE_FORMATS)}"
-                    )
-                    continue
-                
-                # Check resolution
-                try:
-                    with Image.open(image_path) as img:
-                        width, height = img.size
-                        
-                        # Check if square
-                        if width != height:
-                            texture_issues.append(
-                                f"Texture {idx} not square: {width}x{height}. Must be square"
-                            )
-                        
-                        # Check if power of 2
-                        if not self._is_power_of_two(width) or not self._is_power_of_two(height):
-                            texture_issues.append(
-                                f"Texture {idx} not power of 2: {width}x{height}"
-                            )
-                        
-                        # Check size limits
-                        if width < self.MIN_TEXTURE_SIZE or height < self.MIN_TEXTURE_SIZE:
-                            texture_issues.append(
-                                f"Texture {idx} too small: {width}x{height}. "
-                                f"Minimum: {self.MIN_TEXTURE_SIZE}x{self.MIN_TEXTURE_SIZE}"
-                            )
-                        elif width > self.MAX_TEXTURE_SIZE or height > self.MAX_TEXTURE_SIZE:
-                            texture_issues.append(
-                                f"Texture {idx} too large: {width}x{height}. "
-                                f"Maximum: {self.MAX_TEXTURE_SIZE}x{self.MAX_TEXTURE_SIZE}"
-                            )
-                        else:
-                            texture_info.append({
-                                "index": idx,
-                                "name": image.uri,
-                                "resolution": f"{width}x{height}",
-                                "format": image_path.suffix,
-                                "size_mb": round(image_path.stat().st_size / (1024 * 1024), 2)
-                            })
-                
-                except Exception as e:
-                    texture_issues.append(f"Failed to analyze texture {idx}: {str(e)}")
+        # Per-image checks are I/O bound; run them on a bounded pool.
+        # executor.map yields in submission order, keeping reports reproducible.
+        workers = max(1, min(self.texture_workers, len(self.gltf.images)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            analyses = executor.map(self._analyze_texture, range(len(self.gltf.images)), self.gltf.images)
+            for results, issues, info in analyses:
+                self.results.extend(results)
+                texture_issues.extend(issues)
+                if info:
+                    texture_info.append(info)
         
         if texture_issues:
             for issue in texture_issues:
@@ -338,6 +2582,508 @@ class AmazonGLTFValidator:
                 details={"textures": texture_info}
             ))
     
+    def _analyze_texture(self, idx: int, image) -> Tuple[List[ValidationResult], List[str], Optional[Dict]]:
+        """
+        Run the per-image checks for one texture.
+        
+        Runs on a worker thread, so it must not touch ``self.results``; it
+        returns (results, issues, info) for the caller to merge in index order.
+        """
+        self._check_deadline()
+        results = []
+        issues = []
+        
+        if image.bufferView is not None:
+            # Images packed into the binary buffer are how GLB embeds textures
+            try:
+                byte_size = self.gltf.bufferViews[image.bufferView].byteLength
+            except (IndexError, TypeError):
+                issues.append(f"Texture {idx} references missing bufferView {image.bufferView}")
+                return results, issues, None
+            storage = "GLB binary chunk" if self.glb is not None else "binary buffer"
+            results.append(ValidationResult(
+                category="Textures",
+                check_name=f"Texture {idx} Storage",
+                status="PASS",
+                message=f"Embedded in the {storage} (bufferView {image.bufferView})"
+            ))
+            name = image.name or f"bufferView {image.bufferView}"
+            declared = TEXTURE_MIME_FORMATS.get(image.mimeType)
+            declared_as = f"declared as {image.mimeType}"
+            suffix = f".{declared}" if declared else ""
+        elif image.uri and image.uri.startswith('data:'):
+            results.append(ValidationResult(
+                category="Textures",
+                check_name=f"Texture {idx} Storage",
+                status="FAIL",
+                message="Embedded textures (data URI) not allowed. Must use external files or GLB bufferViews"
+            ))
+            mime_type = image.uri[5:].split(',', 1)[0].split(';', 1)[0]
+            byte_size = None
+            name = image.name or f"data URI ({mime_type or 'no type'})"
+            declared = TEXTURE_MIME_FORMATS.get(mime_type)
+            declared_as = f"declared as {mime_type or 'no type'}"
+            suffix = f".{declared}" if declared else ""
+        elif image.uri:
+            image_path = self.model_dir / unquote(image.uri)
+            if not image_path.exists():
+                issues.append(f"Texture {idx} not found: {image.uri}")
+                return results, issues, None
+            byte_size = image_path.stat().st_size
+            name = image.uri
+            declared = TEXTURE_SUFFIX_FORMATS.get(image_path.suffix.lower())
+            declared_as = f"named '{image_path.name}'"
+            suffix = image_path.suffix
+        else:
+            return results, issues, None
+        
+        # Check resolution and format from the header alone
+        try:
+            header = self._image_header(idx)
+            if header is None:
+                raise ValueError("unrecognized or corrupt image header")
+            if byte_size is None:
+                byte_size = len(self._image_stream(image))
+            
+            # Check format by content, not by name or declared type
+            allowed = self._allowed_texture_formats()
+            if header["format"] not in allowed:
+                issues.append(
+                    f"Texture {idx} has invalid format: {header['format'].upper()}. "
+                    f"Must be {', '.join(sorted(f.upper() for f in allowed))}"
+                )
+                return results, issues, None
+            if declared != header["format"]:
+                results.append(ValidationResult(
+                    category="Textures",
+                    check_name=f"Texture {idx} Format",
+                    status="WARNING",
+                    message=f"Texture {idx} is {header['format'].upper()} data but {declared_as}"
+                ))
+            
+            width, height = header["width"], header["height"]
+            
+            # Check if square
+            if width != height:
+                issues.append(
+                    f"Texture {idx} not square: {width}x{height}. Must be square"
+                )
+            
+            # Check if power of 2
+            if not self._is_power_of_two(width) or not self._is_power_of_two(height):
+                issues.append(
+                    f"Texture {idx} not power of 2: {width}x{height}"
+                )
+            
+            # Check size limits
+            if width < self.MIN_TEXTURE_SIZE or height < self.MIN_TEXTURE_SIZE:
+                issues.append(
+                    f"Texture {idx} too small: {width}x{height}. "
+                    f"Minimum: {self.MIN_TEXTURE_SIZE}x{self.MIN_TEXTURE_SIZE}"
+                )
+            elif width > self.MAX_TEXTURE_SIZE or height > self.MAX_TEXTURE_SIZE:
+                issues.append(
+                    f"Texture {idx} too large: {width}x{height}. "
+                    f"Maximum: {self.MAX_TEXTURE_SIZE}x{self.MAX_TEXTURE_SIZE}"
+                )
+            else:
+                return results, issues, {
+                    "index": idx,
+                    "name": name,
+                    "resolution": f"{width}x{height}",
+                    "format": suffix or f".{header['format']}",
+                    "bit_depth": header["bit_depth"],
+                    "channels": header["channels"],
+                    "color_type": header["color_type"],
+                    "size_mb": round(byte_size / (1024 * 1024), 2)
+                }
+        
+        except Exception as e:
+            issues.append(f"Failed to analyze texture {idx}: {str(e)}")
+        
+        return results, issues, None
+    
+    def _image_roles(self) -> Dict[int, List[Tuple[int, str]]]:
+        """image index -> [(material index, texture slot)] for every material texture"""
+        roles: Dict[int, List[Tuple[int, str]]] = {}
+        for m, material in enumerate(self.gltf.materials or []):
+            pbr = material.pbrMetallicRoughness
+            slots = {
+                "baseColor": pbr.baseColorTexture if pbr else None,
+                "metallicRoughness": pbr.metallicRoughnessTexture if pbr else None,
+                "normal": material.normalTexture,
+                "occlusion": material.occlusionTexture,
+                "emissive": material.emissiveTexture,
+            }
+            for slot, ref in slots.items():
+                if ref is None or ref.index is None or ref.index >= len(self.gltf.textures or []):
+                    continue
+                source = self._texture_source(ref.index)
+                if source is not None and source < len(self.gltf.images or []):
+                    roles.setdefault(source, []).append((m, slot))
+        return roles
+    
+    def _texture_proxy(self, image_index: int) -> Tuple[Optional[np.ndarray], Optional[str]]:
+        """
+        Small (H, W, C) uint8 proxy of an image and its original Pillow mode.
+        
+        JPEG decodes straight to a reduced scale through draft(); other
+        formats are decoded once and shrunk with reduce(), both far cheaper
+        than resampling the full image. Returns (None, reason) when the
+        image cannot be decoded (e.g. KTX2, which Pillow does not read).
+        """
+        image = self.gltf.images[image_index]
+        header = self._image_header(image_index)
+        if header is None:
+            return None, "unreadable header"
+        if header["format"] == "ktx2":
+            return None, "KTX2 is not decoded"
+        
+        source = self._image_stream(image) or self.model_dir / unquote(image.uri or '')
+        target = (self.CONTENT_PROXY_SIZE, self.CONTENT_PROXY_SIZE)
+        with Image.open(source) as img:
+            mode = img.mode
+            if img.format == 'JPEG':
+                img.draft('L' if mode == 'L' else 'RGB', target)
+            if 'transparency' in img.info:
+                # tRNS alpha (palette, grayscale or RGB PNGs) becomes a real channel
+                img = img.convert('LA' if img.mode == 'L' else 'RGBA')
+            elif img.mode not in ('L', 'LA', 'RGB', 'RGBA'):
+                img = img.convert('RGBA' if 'A' in img.mode else 'RGB')
+            factor = max(1, min(img.size) // self.CONTENT_PROXY_SIZE)
+            proxy = img.reduce(factor) if factor > 1 else img.copy()
+        return np.asarray(proxy), mode
+    
+    def _texture_content_stats(self, image_index: int) -> Dict:
+        """Channel statistics of one image's proxy; runs on a worker thread"""
+        self._check_deadline()
+        try:
+            pixels, mode = self._texture_proxy(image_index)
+        except Exception as e:
+            return {"image": image_index, "skipped": f"decode failed: {e}"}
+        if pixels is None:
+            return {"image": image_index, "skipped": mode}
+        
+        header = self._image_header(image_index)
+        lossy = header["format"] == "jpeg" or header.get("color_type") == "lossy"
+        
+        if pixels.ndim == 2:
+            pixels = pixels[:, :, None]
+        channels = pixels.reshape(-1, pixels.shape[2])
+        low, high = channels.min(axis=0), channels.max(axis=0)
+        has_alpha = pixels.shape[2] in (2, 4)
+        color = channels[:, :-1] if has_alpha else channels
+        return {
+            "image": image_index,
+            "mode": mode,
+            "proxy": f"{pixels.shape[1]}x{pixels.shape[0]}",
+            "min": low.tolist(),
+            "max": high.tolist(),
+            "mean": [round(float(v), 1) for v in channels.mean(axis=0)],
+            "has_alpha": has_alpha,
+            "lossy": lossy,
+            "solid": bool((color.max(axis=0) - color.min(axis=0) <= self._flat_range(lossy)).all()),
+            "grayscale": mode in ('L', 'LA')
+        }
+    
+    def _validate_texture_content(self):
+        """Catch solid textures, unused or ignored alpha and mis-packed metallic-roughness maps"""
+        if not self.gltf.images:
+            return
+        
+        workers = max(1, min(self.texture_workers, len(self.gltf.images)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            stats = list(executor.map(self._texture_content_stats, range(len(self.gltf.images))))
+        
+        roles = self._image_roles()
+        materials = self.gltf.materials or []
+        findings = {"solid": [], "unused_alpha": [], "opaque_alpha": [], "mr_packing": []}
+        skipped = [s for s in stats if "skipped" in s]
+        for entry in stats:
+            if "skipped" in entry:
+                continue
+            image_index = entry["image"]
+            image_roles = roles.get(image_index, [])
+            if entry["solid"]:
+                findings["solid"].append({"image": image_index, "color": entry["mean"][:3 if not entry["grayscale"] else 1]})
+            if entry["has_alpha"]:
+                alpha_low = entry["min"][-1]
+                if alpha_low >= 255 - self.FLAT_CHANNEL_RANGE:
+                    findings["unused_alpha"].append({"image": image_index})
+                else:
+                    opaque = [m for m, slot in image_roles
+                              if slot == "baseColor" and (materials[m].alphaMode or "OPAQUE") == "OPAQUE"]
+                    if opaque:
+                        findings["opaque_alpha"].append({"image": image_index, "materials": opaque,
+                                                         "alpha_min": alpha_low})
+            if any(slot == "metallicRoughness" for _, slot in image_roles):
+                problem = self._metallic_roughness_problem(entry)
+                if problem:
+                    findings["mr_packing"].append({"image": image_index, "problem": problem})
+        
+        self._report_texture_content(findings, stats, skipped)
+    
+    def _flat_range(self, lossy: bool) -> int:
+        """Largest value spread still treated as a constant channel"""
+        return self.LOSSY_CHANNEL_RANGE if lossy else self.FLAT_CHANNEL_RANGE
+    
+    def _metallic_roughness_problem(self, entry: Dict) -> Optional[str]:
+        """Describe a metallic-roughness packing mistake (G = roughness, B = metallic), if any"""
+        if entry["grayscale"]:
+            return "grayscale image: roughness (G) and metallic (B) are forced to the same values"
+        low, high = entry["min"], entry["max"]
+        spread = [high[c] - low[c] for c in range(3)]
+        flat = [value <= self._flat_range(entry["lossy"]) for value in spread]
+        if flat[1] and flat[2] and not flat[0]:
+            return "only the red channel varies; roughness belongs in G and metallic in B"
+        return None
+    
+    def _report_texture_content(self, findings: Dict[str, List[Dict]], stats: List[Dict], skipped: List[Dict]):
+        checks = [
+            ("solid", "Solid Color Textures",
+             "texture(s) are a single flat color. Use a material factor instead of a texture"),
+            ("unused_alpha", "Unused Alpha",
+             "texture(s) carry a fully opaque alpha channel. Dropping it reduces size"),
+            ("opaque_alpha", "Alpha Ignored",
+             "base color texture(s) have transparency, but their materials use alphaMode OPAQUE"),
+            ("mr_packing", "Metallic-Roughness Packing",
+             "metallic-roughness texture(s) appear to be packed incorrectly"),
+        ]
+        for kind, check_name, description in checks:
+            if findings[kind]:
+                self.results.append(ValidationResult(
+                    category="Textures",
+                    check_name=check_name,
+                    status="WARNING",
+                    message=f"{len(findings[kind])} {description}",
+                    details={"textures": findings[kind]}
+                ))
+        
+        analysed = len(stats) - len(skipped)
+        if analysed and not any(findings.values()):
+            self.results.append(ValidationResult(
+                category="Textures",
+                check_name="Texture Content",
+                status="PASS",
+                message=f"Content of {analysed} texture(s) looks consistent with its use"
+            ))
+        if skipped:
+            self.results.append(ValidationResult(
+                category="Textures",
+                check_name="Texture Content",
+                status="INFO",
+                message=f"Content of {len(skipped)} texture(s) was not analysed",
+                details={"textures": skipped}
+            ))
+    
+    def _image_stream(self, image):
+        """Seekable reader over an image stored in a bufferView or a data URI, or None"""
+        if image.bufferView is not None:
+            return ByteViewReader(self._buffer_view_data(image.bufferView))
+        if image.uri and image.uri.startswith('data:'):
+            return data_uri_reader(image.uri)
+        return None
+    
+    def _image_header(self, image_index: int) -> Optional[Dict]:
+        """Header fields of an image (see probe_image), or None if unreadable"""
+        if image_index not in self._image_headers:
+            image = self.gltf.images[image_index]
+            try:
+                stream = self._image_stream(image)
+                if stream is not None:
+                    header = probe_image(stream)
+                else:
+                    header = probe_image_file(self.model_dir / unquote(image.uri or ''))
+            except (OSError, ValueError, IndexError, TypeError):
+                header = None
+            self._image_headers[image_index] = header
+        return self._image_headers[image_index]
+    
+    def _image_size(self, image_index: int) -> Optional[Tuple[int, int]]:
+        """(width, height) of an image from its header, or None if unreadable"""
+        header = self._image_header(image_index)
+        return (header["width"], header["height"]) if header else None
+    
+    def _allowed_texture_formats(self) -> List[str]:
+        allowed = sorted({TEXTURE_SUFFIX_FORMATS[suffix] for suffix in self.VALID_TEXTURE_FORMATS})
+        used = self.gltf.extensionsUsed or []
+        return allowed + [fmt for fmt, ext in TEXTURE_FORMAT_EXTENSIONS.items() if ext in used]
+    
+    def _mesh_area_scales(self) -> Dict[int, float]:
+        """
+        Mean factor by which each mesh's surface area grows in world space,
+        from |det| of its instances' world matrices. Assumes roughly uniform
+        scale; meshes outside the active scene keep their local size.
+        """
+        scene_index = self._active_scene_index()
+        if scene_index is None or not self.gltf.nodes:
+            return {}
+        mesh_nodes, mesh_ids = self._scene_mesh_nodes(scene_index)
+        if len(mesh_nodes) == 0:
+            return {}
+        volume_scale = np.abs(np.linalg.det(self._world_matrices()[mesh_nodes][:, :3, :3]))
+        area_scale = volume_scale ** (2.0 / 3.0)
+        totals = np.bincount(mesh_ids, weights=area_scale)
+        instances = np.bincount(mesh_ids)
+        return {int(m): float(totals[m] / instances[m]) for m in np.flatnonzero(instances)}
+    
+    def _validate_uv_coverage(self):
+        """Rasterize TEXCOORD_0 per texture for utilization/overlap and measure texel density per material"""
+        if not self.gltf.materials or not self.gltf.images:
+            return
+        
+        material_images = {m: self._texture_images(material, tex_coord=0)
+                           for m, material in enumerate(self.gltf.materials)}
+        area_scales = self._mesh_area_scales()
+        uv_triangles: Dict[int, List[np.ndarray]] = {}  # material -> its UV triangles
+        densities: Dict[int, Dict] = {}  # material -> UV / world area totals
+        out_of_range, unreadable = [], []
+        
+        for mesh_index, primitive_index, primitive in self._mesh_primitives():
+            images = material_images.get(primitive.material) if primitive.material is not None else None
+            texcoord = getattr(primitive.attributes, "TEXCOORD_0", None)
+            position = getattr(primitive.attributes, "POSITION", None)
+            if not images or texcoord is None or position is None:
+                continue
+            try:
+                uvs = self._read_accessor(texcoord)
+                positions = self._read_accessor(position)
+                indices = self._primitive_indices(primitive, self.gltf.accessors[position].count)
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                unreadable.append({"mesh": mesh_index, "primitive": primitive_index, "error": str(e)})
+                continue
+            if uvs is None or positions is None or indices is None:
+                continue
+            
+            outside = np.count_nonzero(((uvs < 0.0) | (uvs > 1.0)).any(axis=1))
+            if outside:
+                out_of_range.append({"mesh": mesh_index, "primitive": primitive_index,
+                                     "vertices": int(outside), "of": int(len(uvs))})
+            
+            mode = MODE_TRIANGLES if primitive.mode is None else primitive.mode
+            triangles = triangle_indices(indices, mode).astype(np.int64)
+            triangles = triangles[(triangles < min(len(uvs), len(positions))).all(axis=1)]
+            if len(triangles) == 0:
+                continue
+            corners = uvs[:, :2][triangles]
+            uv_triangles.setdefault(primitive.material, []).append(corners)
+            
+            uv_edge1 = corners[:, 1] - corners[:, 0]
+            uv_edge2 = corners[:, 2] - corners[:, 0]
+            uv_area = 0.5 * np.abs(uv_edge1[:, 0] * uv_edge2[:, 1] - uv_edge1[:, 1] * uv_edge2[:, 0])
+            edge1, edge2 = self._triangle_edges(triangles, positions)
+            world_area = 0.5 * np.linalg.norm(np.cross(edge1, edge2), axis=1)
+            totals = densities.setdefault(primitive.material, {"uv_area": 0.0, "world_area": 0.0})
+            totals["uv_area"] += float(np.nansum(uv_area))
+            totals["world_area"] += float(np.nansum(world_area)) * area_scales.get(mesh_index, 1.0)
+        
+        # One raster per material: overlap is judged within a material, while a
+        # texture's utilization is the union over every material sampling it
+        overlaps, image_covered = {}, {}
+        for m in sorted(uv_triangles):
+            self._check_deadline()
+            counts = rasterize_uv_coverage(np.concatenate(uv_triangles[m]), self.UV_RASTER_SIZE)
+            covered = counts > 0
+            overlaps[m] = float((counts > 1).sum() / max(covered.sum(), 1))
+            for image_index in material_images[m]:
+                image_covered[image_index] = image_covered.get(image_index, False) | covered
+        
+        coverage = []
+        for image_index in sorted(image_covered):
+            utilization = float(image_covered[image_index].mean())
+            entry = {
+                "image": image_index,
+                "name": self.gltf.images[image_index].name or self.gltf.images[image_index].uri,
+                "utilization": round(utilization, 4)
+            }
+            size = self._image_size(image_index)
+            if size is not None:
+                width, height = size
+                # Smallest power-of-two square keeping the same texel density once islands are repacked
+                needed = max(utilization, 1e-6) * width * height
+                repacked = 1 << max(int(math.ceil(math.log2(math.sqrt(needed)))), 0)
+                entry["resolution"] = f"{width}x{height}"
+                if repacked * repacked < width * height:
+                    entry["repacked_resolution"] = f"{repacked}x{repacked}"
+                    entry["texel_savings_pct"] = round(100.0 * (1 - repacked * repacked / (width * height)), 1)
+            coverage.append(entry)
+        
+        self._report_uv_coverage(coverage, overlaps, densities, material_images, out_of_range, unreadable)
+    
+    def _report_uv_coverage(self, coverage, overlaps, densities, material_images, out_of_range, unreadable):
+        for entry in coverage:
+            percent = entry["utilization"] * 100
+            if entry["utilization"] < self.UV_MIN_UTILIZATION:
+                saving = (f". Repacking into {entry['repacked_resolution']} would save about "
+                          f"{entry['texel_savings_pct']:.0f}% of its texels") if "repacked_resolution" in entry else ""
+                status, message = "WARNING", f"UVs cover only {percent:.1f}% of the texture{saving}"
+            else:
+                status, message = "PASS", f"UVs cover {percent:.1f}% of the texture"
+            self.results.append(ValidationResult(
+                category="Textures",
+                check_name=f"Texture {entry['image']} UV Utilization",
+                status=status,
+                message=message,
+                details=entry
+            ))
+        
+        # Overlapping islands share texels, which breaks baked lighting/occlusion
+        for m, overlap in sorted(overlaps.items()):
+            if overlap <= 0:
+                continue
+            material = self.gltf.materials[m]
+            baked = material.occlusionTexture is not None
+            self.results.append(ValidationResult(
+                category="Textures",
+                check_name=f"Material {m} UV Overlap",
+                status="WARNING" if baked else "INFO",
+                message=f"Material '{material.name or f'Material_{m}'}': {overlap * 100:.1f}% of its texels are "
+                        "shared by overlapping UV islands" + (", which corrupts its baked occlusion map" if baked else ""),
+                details={"overlap": round(overlap, 4)}
+            ))
+        
+        if out_of_range:
+            self.results.append(ValidationResult(
+                category="Textures",
+                check_name="UV Range",
+                status="WARNING",
+                message=f"{sum(p['vertices'] for p in out_of_range):,} TEXCOORD_0 value(s) fall outside [0, 1] "
+                        f"in {len(out_of_range)} primitive(s)",
+                details={"primitives": out_of_range}
+            ))
+        
+        density_info = []
+        for m, totals in sorted(densities.items()):
+            sizes = [self._image_size(i) for i in material_images.get(m, [])]
+            sizes = [w * h for w, h in (size for size in sizes if size is not None)]
+            if not sizes or totals["world_area"] <= 0:
+                continue
+            density_info.append({
+                "material": m,
+                "name": self.gltf.materials[m].name or f"Material_{m}",
+                "texels_per_unit": round(math.sqrt(totals["uv_area"] * max(sizes) / totals["world_area"]), 1),
+                "uv_area": round(totals["uv_area"], 4),
+                "world_area": round(totals["world_area"], 4)
+            })
+        if density_info:
+            self.results.append(ValidationResult(
+                category="Textures",
+                check_name="Texel Density",
+                status="INFO",
+                message="Texel density (texels per world unit): " + ", ".join(
+                    f"{d['name']} {d['texels_per_unit']:,.0f}" for d in density_info),
+                details={"materials": density_info}
+            ))
+        
+        if unreadable:
+            self.results.append(ValidationResult(
+                category="Textures",
+                check_name="UV Coverage",
+                status="WARNING",
+                message=f"Could not read TEXCOORD_0 data for {len(unreadable)} primitive(s)",
+                details={"primitives": unreadable}
+            ))
+    
     def _validate_materials(self):
         """Validate material requirements"""
         if not self.gltf.materials:
@@ -415,7 +3161,7 @@ class AmazonGLTFValidator:
             ))
     
     def _validate_alignment(self):
-        """Validate model alignment and orientation"""
+        """Validate model alignment and orientation from world-space bounds"""
         if not self.gltf.scenes or not self.gltf.nodes:
             self.results.append(ValidationResult(
                 category="Alignment",
@@ -425,25 +3171,387 @@ class AmazonGLTFValidator:
             ))
             return
         
-        # Check if model has proper scene structure
-        scene = self.gltf.scenes[self.gltf.scene] if self.gltf.scene is not None else self.gltf.scenes[0]
+        try:
+            bounds = self._world_bounds()
+        except (ValueError, KeyError, IndexError, OSError) as e:
+            self.results.append(ValidationResult(
+                category="Alignment",
+                check_name="World Bounds",
+                status="WARNING",
+                message=f"Cannot compute world bounds: {str(e)}"
+            ))
+            return
+        if bounds is None:
+            self.results.append(ValidationResult(
+                category="Alignment",
+                check_name="Scene Structure",
+                status="WARNING",
+                message="Cannot validate alignment - active scene has no mesh geometry"
+            ))
+            return
         
-        self.results.append(ValidationResult(
-            category="Alignment",
-            check_name="Scene Structure",
-            status="INFO",
-            message=f"Model has {len(self.gltf.nodes)} node(s). "
-                    "Verify alignment manually: Front=+Z, Up=+Y, Pivot at (0,0,0)"
-        ))
+        world_min, world_max, decoded = bounds
+        size = world_max - world_min
+        center = (world_min + world_max) / 2
+        tolerance = max(self.PIVOT_TOLERANCE * float(size.max()), 0.001)
         
-        # Note: Full alignment validation requires analyzing mesh vertices
-        # which is complex. This is a placeholder for manual verification
         self.results.append(ValidationResult(
             category="Alignment",
-            check_name="Orientation Check",
+            check_name="World Bounds",
             status="INFO",
-            message="Manual verification required: Ensure model front faces +Z, up is +Y, pivot at origin"
+            message=f"Dimensions: {size[0]:.3f} x {size[1]:.3f} x {size[2]:.3f} (W x H x D)",
+            details={
+                "min": [round(float(v), 4) for v in world_min],
+                "max": [round(float(v), 4) for v in world_max],
+                "center": [round(float(v), 4) for v in center],
+                "decoded_primitives": decoded
+            }
         ))
+        
+        if self.alignment_type not in self.ALIGNMENT_TYPES:
+            self.results.append(ValidationResult(
+                category="Alignment",
+                check_name="Pivot Check",
+                status="WARNING",
+                message=f"Unknown alignment type '{self.alignment_type}'. "
+                        f"Use one of: {', '.join(self.ALIGNMENT_TYPES)}"
+            ))
+            return
+        
+        # Offsets of the placement's anchor point from the origin, axis by axis
+        offsets = self._pivot_offsets(world_min, world_max, center, self.alignment_type)
+        pivot_offset = [round(float(v), 4) for v in offsets]
+        if np.all(np.abs(offsets) <= tolerance):
+            self.results.append(ValidationResult(
+                category="Alignment",
+                check_name="Pivot Check",
+                status="PASS",
+                message=f"Pivot at origin for {self.alignment_type} placement",
+                details={"pivot_offset": pivot_offset, "tolerance": round(tolerance, 4)}
+            ))
+        else:
+            self.results.append(ValidationResult(
+                category="Alignment",
+                check_name="Pivot Check",
+                status="WARNING",
+                message=f"Pivot offset from origin for {self.alignment_type} placement: "
+                        f"({pivot_offset[0]}, {pivot_offset[1]}, {pivot_offset[2]})",
+                details={"pivot_offset": pivot_offset, "tolerance": round(tolerance, 4)}
+            ))
+        
+        self._check_orientation(world_min, world_max, size, tolerance)
+    
+    @staticmethod
+    def _pivot_offsets(world_min, world_max, center, alignment_type) -> np.ndarray:
+        """
+        Per-axis distance of the placement anchor from the origin.
+        
+        FLOOR: base on Y=0, centered in X/Z. CEILING: top on Y=0, centered in
+        X/Z. WALL: back on Z=0, centered in X/Y.
+        """
+        if alignment_type == 'FLOOR':
+            return np.array([center[0], world_min[1], center[2]])
+        if alignment_type == 'CEILING':
+            return np.array([center[0], world_max[1], center[2]])
+        return np.array([center[0], center[1], world_min[2]])
+    
+    def _check_orientation(self, world_min, world_max, size, tolerance):
+        """Y-up / +Z-front sanity: flag bounds that only fit a rotated frame"""
+        suspect = None
+        if self.alignment_type in ('FLOOR', 'CEILING'):
+            resting = world_min if self.alignment_type == 'FLOOR' else world_max
+            if abs(resting[1]) > tolerance and abs(resting[2]) <= tolerance:
+                suspect = "Model appears to be Z-up; glTF requires +Y up"
+        else:
+            if abs(world_min[2]) > tolerance and abs(world_max[2]) <= tolerance:
+                suspect = "Model appears to face -Z; front must face +Z with the back on Z=0"
+            elif abs(world_min[2]) > tolerance and min(abs(world_min[0]), abs(world_max[0])) <= tolerance:
+                suspect = "Model appears to face along X; front must face +Z with the back on Z=0"
+        
+        if suspect:
+            self.results.append(ValidationResult(
+                category="Alignment",
+                check_name="Orientation Check",
+                status="WARNING",
+                message=suspect,
+                details={"dimensions": [round(float(v), 4) for v in size]}
+            ))
+        else:
+            self.results.append(ValidationResult(
+                category="Alignment",
+                check_name="Orientation Check",
+                status="PASS",
+                message=f"Bounds consistent with +Y up / +Z front for {self.alignment_type} placement"
+            ))
+    
+    def _active_scene_index(self) -> Optional[int]:
+        """Index of the scene a viewer would display, or None if there is none"""
+        if not self.gltf.scenes:
+            return None
+        scene_index = self.gltf.scene if self.gltf.scene is not None else 0
+        return scene_index if scene_index < len(self.gltf.scenes) else None
+    
+    def _build_scene_graph(self):
+        """
+        Compute world matrices for every node, breadth-first by depth.
+        
+        The hierarchy is stored as a CSR child table; each depth level is
+        expanded and multiplied by its parents' world matrices in one batched
+        matmul, so cost scales with tree depth rather than node count.
+        """
+        nodes = self.gltf.nodes or []
+        count = len(nodes)
+        parent = np.full(count, -1, dtype=np.int64)
+        node_mesh = np.full(count, -1, dtype=np.int64)
+        child_lists = []
+        for i, node in enumerate(nodes):
+            if node.mesh is not None:
+                node_mesh[i] = node.mesh
+            kept = []
+            for child in node.children or []:
+                # A node may have only one parent; extra links and self
+                # references are invalid glTF and are ignored. Longer cycles
+                # survive here and are cut by the visited masks of the walks.
+                if 0 <= child < count and child != i and parent[child] == -1:
+                    parent[child] = i
+                    kept.append(child)
+            child_lists.append(kept)
+        
+        child_ptr = np.zeros(count + 1, dtype=np.int64)
+        child_ptr[1:] = np.cumsum([len(c) for c in child_lists])
+        child_idx = np.fromiter((c for kept in child_lists for c in kept), dtype=np.int64, count=int(child_ptr[-1]))
+        
+        local = node_local_matrices(nodes)
+        world = local.copy()
+        frontier = np.flatnonzero(parent == -1)
+        while frontier.size:
+            self._check_deadline()
+            # Nodes on a cycle have a parent on the cycle, so they are never
+            # reached from the parentless roots and this walk terminates
+            frontier = expand_children(frontier, child_ptr, child_idx)
+            if frontier.size:
+                world[frontier] = world[parent[frontier]] @ local[frontier]
+        
+        self._scene_graph = (world, child_ptr, child_idx, node_mesh)
+    
+    def _world_matrices(self) -> np.ndarray:
+        """Cached (N, 4, 4) world matrices of all nodes"""
+        if self._scene_graph is None:
+            self._build_scene_graph()
+        return self._scene_graph[0]
+    
+    def _scene_nodes(self, scene_index: int) -> np.ndarray:
+        """Sorted indices of every node reachable from a scene's roots"""
+        if scene_index in self._scene_nodes_cache:
+            return self._scene_nodes_cache[scene_index]
+        
+        if self._scene_graph is None:
+            self._build_scene_graph()
+        _, child_ptr, child_idx, _ = self._scene_graph
+        node_count = len(self.gltf.nodes or [])
+        roots = [n for n in (self.gltf.scenes[scene_index].nodes or []) if 0 <= n < node_count]
+        
+        # Scene roots may sit on a child cycle, so only unvisited nodes are expanded
+        visited = np.zeros(node_count, dtype=bool)
+        frontier = np.unique(np.asarray(roots, dtype=np.int64))
+        visited[frontier] = True
+        while frontier.size:
+            self._check_deadline()
+            frontier = np.unique(expand_children(frontier, child_ptr, child_idx))
+            frontier = frontier[~visited[frontier]]
+            visited[frontier] = True
+        nodes = np.flatnonzero(visited)
+        
+        self._scene_nodes_cache[scene_index] = nodes
+        return nodes
+    
+    def _scene_mesh_nodes(self, scene_index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(node indices, mesh indices) of valid mesh instances in a scene"""
+        nodes = self._scene_nodes(scene_index)
+        mesh_count = len(self.gltf.meshes or [])
+        meshes = self._scene_graph[3][nodes]
+        valid = (meshes >= 0) & (meshes < mesh_count)
+        return nodes[valid], meshes[valid]
+    
+    def _mesh_local_bounds(self, mesh_index: int) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+        """
+        Local AABB of a mesh from its POSITION accessor bounds.
+        
+        Falls back to decoding POSITION only for accessors without min/max.
+        Returns (min, max, decoded primitive count) or None if no positions.
+        """
+        mins, maxs = [], []
+        decoded = 0
+        for primitive in self.gltf.meshes[mesh_index].primitives:
+            position = getattr(primitive.attributes, "POSITION", None)
+            if position is None:
+                continue
+            accessor = self.gltf.accessors[position]
+            if position in self._decoded_bounds:
+                lo, hi = self._decoded_bounds[position]  # Verified against the vertex data
+            elif accessor.min and accessor.max and len(accessor.min) == 3 and len(accessor.max) == 3:
+                lo = np.asarray(accessor.min, dtype=np.float64)
+                hi = np.asarray(accessor.max, dtype=np.float64)
+                if accessor.normalized:
+                    lo = normalize_components(lo, accessor.componentType)
+                    hi = normalize_components(hi, accessor.componentType)
+            else:
+                values = self._read_accessor(position)
+                if values is None or len(values) == 0:
+                    continue
+                lo, hi = values.min(axis=0), values.max(axis=0)
+                decoded += 1
+            mins.append(lo)
+            maxs.append(hi)
+        
+        if not mins:
+            return None
+        return np.min(mins, axis=0), np.max(maxs, axis=0), decoded
+    
+    def _world_bounds(self) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+        """World-space AABB of the active scene: (min, max, decoded primitives)"""
+        scene_index = self._active_scene_index()
+        if scene_index is None:
+            return None
+        mesh_nodes, mesh_ids = self._scene_mesh_nodes(scene_index)
+        
+        local_bounds = {}
+        decoded = 0
+        for mesh_index in np.unique(mesh_ids).tolist():
+            local_bounds[mesh_index] = self._mesh_local_bounds(mesh_index)
+            if local_bounds[mesh_index] is not None:
+                decoded += local_bounds[mesh_index][2]
+        
+        keep = np.fromiter((local_bounds[m] is not None for m in mesh_ids.tolist()), dtype=bool, count=len(mesh_ids))
+        if not keep.any():
+            return None
+        mins = np.array([local_bounds[m][0] for m in mesh_ids[keep].tolist()])
+        maxs = np.array([local_bounds[m][1] for m in mesh_ids[keep].tolist()])
+        world_min, world_max = transform_boxes(mins, maxs, self._world_matrices()[mesh_nodes[keep]])
+        return world_min, world_max, decoded
+    
+    def _buffer_data(self, buffer_index: int):
+        """Bytes of a buffer: the GLB BIN chunk, a data URI, or a mapped .bin file"""
+        if buffer_index in self._buffers:
+            return self._buffers[buffer_index]
+        
+        buffer = self.gltf.buffers[buffer_index]
+        if buffer.uri is None:
+            data = self.glb.bin_data if self.glb is not None and buffer_index == 0 else None
+        elif buffer.uri.startswith('data:'):
+            data = base64.b64decode(buffer.uri.split(',', 1)[1])
+        else:
+            with open(self.model_dir / unquote(buffer.uri), 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    data = b''
+                else:
+                    mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    self._buffer_maps.append(mapping)
+                    data = memoryview(mapping)
+        
+        self._buffers[buffer_index] = data
+        return data
+    
+    def _close_buffers(self):
+        """Drop cached accessors and buffer views, and unmap external .bin files"""
+        self.accessors.clear()
+        for data in self._buffers.values():
+            if isinstance(data, memoryview) and data is not getattr(self.glb, '_bin_view', None):
+                try:
+                    data.release()
+                except BufferError:
+                    pass
+        self._buffers.clear()
+        for mapping in self._buffer_maps:
+            try:
+                mapping.close()
+            except BufferError:
+                pass  # Still referenced by an array; freed when that is collected
+        self._buffer_maps.clear()
+    
+    def _read_accessor(self, accessor_index: int) -> Optional[np.ndarray]:
+        """
+        Decoded (count, components) array for an accessor, or None if its
+        data lives elsewhere (e.g. a Draco extension) or is unavailable.
+        
+        Dense accessors come back as zero-copy strided views over the
+        bufferView; normalized integers are mapped to floats and sparse
+        substitutions are applied to a copy. Results are memoized in
+        ``self.accessors`` and are read-only.
+        """
+        values = self.accessors.get(accessor_index)
+        if values is None:
+            values = self._decode_accessor(accessor_index)
+            if values is not None:
+                self.accessors.put(accessor_index, values)
+        return values
+    
+    def _strided_view(self, view_index: int, byte_offset: int, count: int,
+                      component_type: int, accessor_type: str) -> np.ndarray:
+        """Zero-copy (count, components) view of elements inside a bufferView"""
+        view = self.gltf.bufferViews[view_index]
+        data = self._buffer_view_data(view_index)
+        dtype = np.dtype(COMPONENT_DTYPES[component_type])
+        components = TYPE_COMPONENTS[accessor_type]
+        
+        # Matrix columns start on 4-byte boundaries (MAT2 of bytes, MAT3 of bytes/shorts)
+        rows = {'MAT2': 2, 'MAT3': 3, 'MAT4': 4}.get(accessor_type)
+        column_stride = -(-rows * dtype.itemsize // 4) * 4 if rows else 0
+        padded = rows is not None and column_stride != rows * dtype.itemsize
+        element_size = column_stride * rows if padded else dtype.itemsize * components
+        
+        stride = view.byteStride or element_size
+        if count == 0:
+            return np.empty((0, components), dtype=dtype)
+        needed = byte_offset + stride * (count - 1) + element_size
+        if needed > len(data):
+            raise ValueError(f"Accessor data overruns bufferView {view_index}")
+        
+        if padded:
+            columns = np.ndarray(
+                shape=(count, rows, rows),
+                dtype=dtype,
+                buffer=data,
+                offset=byte_offset,
+                strides=(stride, column_stride, dtype.itemsize)
+            )
+            return columns.reshape(count, components)
+        return np.ndarray(
+            shape=(count, components),
+            dtype=dtype,
+            buffer=data,
+            offset=byte_offset,
+            strides=(stride, dtype.itemsize)
+        )
+    
+    def _decode_accessor(self, accessor_index: int) -> Optional[np.ndarray]:
+        accessor = self.gltf.accessors[accessor_index]
+        sparse = accessor.sparse
+        if accessor.bufferView is not None:
+            if self._buffer_data(self.gltf.bufferViews[accessor.bufferView].buffer) is None:
+                return None
+            values = self._strided_view(accessor.bufferView, accessor.byteOffset or 0, accessor.count,
+                                        accessor.componentType, accessor.type)
+        elif sparse is not None:
+            # Sparse accessors without a bufferView start from zeros
+            values = np.zeros((accessor.count, TYPE_COMPONENTS[accessor.type]),
+                              dtype=COMPONENT_DTYPES[accessor.componentType])
+        else:
+            return None
+        
+        if sparse is not None and sparse.count:
+            indices = self._strided_view(sparse.indices.bufferView, sparse.indices.byteOffset or 0,
+                                         sparse.count, sparse.indices.componentType, 'SCALAR')[:, 0]
+            substitutes = self._strided_view(sparse.values.bufferView, sparse.values.byteOffset or 0,
+                                             sparse.count, accessor.componentType, accessor.type)
+            if len(indices) and int(indices.max()) >= accessor.count:
+                raise ValueError(f"Accessor {accessor_index} has sparse indices beyond its count")
+            values = values.copy()
+            values[indices] = substitutes
+        
+        if accessor.normalized:
+            values = normalize_components(values, accessor.componentType)
+        return values
     
     def _validate_extensions(self):
         """Validate glTF extensions"""
@@ -484,81 +3592,182 @@ class AmazonGLTFValidator:
             ))
     
     def _run_gltf_validator(self):
-        """Run the official Khronos glTF validator"""
-        try:
-            # Check if gltf_validator is available
-            result = subprocess.run(
-                ['gltf_validator', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            if result.returncode != 0:
-                raise FileNotFoundError()
-            
-            # Run validator
-            result = subprocess.run(
-                ['gltf_validator', str(self.model_path)],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            if result.returncode == 0:
-                self.results.append(ValidationResult(
-                    category="Official Validation",
-                    check_name="Khronos glTF Validator",
-                    status="PASS",
-                    message="Model passed official glTF validation"
-                ))
-            else:
-                self.results.append(ValidationResult(
-                    category="Official Validation",
-                    check_name="Khronos glTF Validator",
-                    status="FAIL",
-                    message=f"Model failed glTF validation: {result.stdout}"
-                ))
-        
-        except FileNotFoundError:
+        """Collect the official Khronos glTF validator result"""
+        deferred = self._khronos_future is None and self.fail_fast and gltf_validator_available()
+        if self._khronos_future is None and not deferred:
             self.results.append(ValidationResult(
                 category="Official Validation",
                 check_name="Khronos glTF Validator",
                 status="INFO",
-                message="glTF Validator not installed. Install from: https://github.com/KhronosGroup/glTF-Validator"
-            ))
-        except subprocess.TimeoutExpired:
-            self.results.append(ValidationResult(
-                category="Official Validation",
-                check_name="Khronos glTF Validator",
-                status="WARNING",
-                message="glTF Validator timed out"
+                message=f"glTF Validator not installed. {GLTF_VALIDATOR_INSTALL_HINT}"
             ))
+            return
+        
+        time_left = self._time_left()
+        try:
+            if deferred:
+                timeout = self.GLTF_VALIDATOR_TIMEOUT if time_left is None \
+                    else min(self.GLTF_VALIDATOR_TIMEOUT, time_left)
+                results = run_khronos_validator([str(self.model_path)], timeout)
+                self._check_deadline()  # Stopped by the deadline rather than its own timeout
+            else:
+                results = self._khronos_future.result(timeout=time_left)
+            result = results[str(self.model_path)]
+        except FutureTimeout:
+            raise ValidationTimeout()
         except Exception as e:
-            self.results.append(ValidationResult(
+            result = ValidationResult(
                 category="Official Validation",
                 check_name="Khronos glTF Validator",
                 status="WARNING",
                 message=f"Could not run glTF Validator: {str(e)}"
-            ))
+            )
+        self.results.append(result)
     
-    def _generate_report(self) -> ComplianceReport:
-        """Generate the final compliance report"""
-        # Count statuses
-        summary = {
-            "PASS": sum(1 for r in self.results if r.status == "PASS"),
-            "FAIL": sum(1 for r in self.results if r.status == "FAIL"),
-            "WARNING": sum(1 for r in self.results if r.status == "WARNING"),
-            "INFO": sum(1 for r in self.results if r.status == "INFO")
+    def _accessor_bytes(self, accessor_index: int) -> int:
+        """Bytes an accessor occupies once uploaded, from its metadata alone"""
+        accessor = self.gltf.accessors[accessor_index]
+        element = np.dtype(COMPONENT_DTYPES[accessor.componentType]).itemsize * TYPE_COMPONENTS[accessor.type]
+        return accessor.count * element
+    
+    def _texture_source(self, texture_index: int) -> Optional[int]:
+        """Image a texture samples, preferring KHR_texture_basisu/EXT_texture_webp sources"""
+        texture = self.gltf.textures[texture_index]
+        for extension in TEXTURE_FORMAT_EXTENSIONS.values():
+            source = (texture.extensions or {}).get(extension, {}).get('source')
+            if source is not None:
+                return source
+        return texture.source
+    
+    def _texture_images(self, material, tex_coord: Optional[int] = None) -> List[int]:
+        """Images referenced by a material's textures, optionally only those using one TEXCOORD set"""
+        refs = [material.normalTexture, material.occlusionTexture, material.emissiveTexture]
+        if material.pbrMetallicRoughness is not None:
+            refs += [material.pbrMetallicRoughness.baseColorTexture,
+                     material.pbrMetallicRoughness.metallicRoughnessTexture]
+        images = []
+        for ref in refs:
+            if ref is None or ref.index is None or ref.index >= len(self.gltf.textures or []):
+                continue
+            if tex_coord is not None and (ref.texCoord or 0) != tex_coord:
+                continue
+            source = self._texture_source(ref.index)
+            if source is not None and source < len(self.gltf.images or []) and source not in images:
+                images.append(source)
+        return images
+    
+    def _download_bytes(self) -> int:
+        """Size of the model file plus every external buffer and image it references"""
+        total = self.model_path.stat().st_size
+        uris = {entry.uri for entry in (self.gltf.buffers or []) + (self.gltf.images or [])
+                if entry.uri and not entry.uri.startswith('data:')}
+        for uri in uris:
+            path = self.model_dir / unquote(uri)
+            if path.is_file():
+                total += path.stat().st_size
+        return total
+    
+    def _estimate_footprint(self):
+        """
+        Estimate GPU memory and download size from accessor metadata and
+        image headers, per mesh and per material. Shared accessors and
+        images count once in the totals; instances share GPU buffers.
+        """
+        mb = 1024 * 1024
+        attribute_bytes: Dict[str, int] = {}
+        seen_accessors = set()
+        meshes, by_material = [], {}
+        
+        for mesh_index, mesh in enumerate(self.gltf.meshes or []):
+            self._check_deadline()
+            mesh_accessors = {}  # accessor -> (kind, semantic)
+            for primitive in mesh.primitives:
+                primitive_accessors = {}
+                for semantic, accessor_index in vars(primitive.attributes).items():
+                    if accessor_index is not None:
+                        primitive_accessors[accessor_index] = ("vertex", semantic)
+                for target in primitive.targets or []:
+                    for semantic, accessor_index in target.items():
+                        primitive_accessors[accessor_index] = ("vertex", f"morph {semantic}")
+                if primitive.indices is not None:
+                    primitive_accessors[primitive.indices] = ("index", "indices")
+                mesh_accessors.update(primitive_accessors)
+                
+                totals = by_material.setdefault(primitive.material, {"vertex_bytes": 0, "index_bytes": 0})
+                for accessor_index, (kind, _) in primitive_accessors.items():
+                    totals[f"{kind}_bytes"] += self._accessor_bytes(accessor_index)
+            
+            mesh_totals = {"vertex_bytes": 0, "index_bytes": 0}
+            for accessor_index, (kind, semantic) in mesh_accessors.items():
+                size = self._accessor_bytes(accessor_index)
+                mesh_totals[f"{kind}_bytes"] += size
+                if accessor_index not in seen_accessors:
+                    seen_accessors.add(accessor_index)
+                    attribute_bytes[semantic] = attribute_bytes.get(semantic, 0) + size
+            meshes.append({"mesh": mesh_index, "name": mesh.name, **mesh_totals})
+        
+        texture_bytes, unknown_images = {}, []
+        for image_index in range(len(self.gltf.images or [])):
+            header = self._image_header(image_index)
+            if header is None:
+                unknown_images.append(image_index)
+                continue
+            width, height = header["width"], header["height"]
+            if header["format"] == "ktx2":
+                # Basis textures transcode to a block format (BC7/ASTC 4x4: one byte per
+                # texel) and upload only the levels they store
+                levels = header.get("levels") or 0
+                texels = width * height if levels == 1 else mip_chain_texels(width, height)
+                texture_bytes[image_index] = texels * self.COMPRESSED_TEXEL_BYTES
+            else:
+                texture_bytes[image_index] = mip_chain_texels(width, height) * self.DECODED_TEXEL_BYTES
+        
+        materials = []
+        for m, material in enumerate(self.gltf.materials or []):
+            images = self._texture_images(material)
+            geometry = by_material.get(m, {"vertex_bytes": 0, "index_bytes": 0})
+            materials.append({
+                "material": m,
+                "name": material.name or f"Material_{m}",
+                **geometry,
+                "texture_bytes": sum(texture_bytes.get(i, 0) for i in images),
+                "images": images
+            })
+        
+        vertex_total = sum(size for semantic, size in attribute_bytes.items() if semantic != "indices")
+        index_total = attribute_bytes.get("indices", 0)
+        texture_total = sum(texture_bytes.values())
+        download = self._download_bytes()
+        totals = {
+            "gpu_mb": round((vertex_total + index_total + texture_total) / mb, 2),
+            "vertex_mb": round(vertex_total / mb, 2),
+            "index_mb": round(index_total / mb, 2),
+            "texture_mb": round(texture_total / mb, 2),
+            "download_mb": round(download / mb, 2)
+        }
+        self.footprint = {
+            "totals": totals,
+            "attributes": {k: v for k, v in sorted(attribute_bytes.items()) if k != "indices"},
+            "meshes": meshes,
+            "materials": materials,
+            "unknown_images": unknown_images
         }
         
-        # Determine overall status
-        if summary["FAIL"] > 0:
-            overall_status = "NON_COMPLIANT"
-        elif summary["WARNING"] > 0:
-            overall_status = "WARNING"
-        else:
-            overall_status = "COMPLIANT"
+        unknown = f". Sizes of {len(unknown_images)} image(s) unknown" if unknown_images else ""
+        self.results.append(ValidationResult(
+            category="File Format",
+            check_name="Memory Footprint",
+            status="INFO",
+            message=f"Estimated GPU memory {totals['gpu_mb']:.2f} MB (vertices {totals['vertex_mb']:.2f} MB, "
+                    f"indices {totals['index_mb']:.2f} MB, textures {totals['texture_mb']:.2f} MB with mipmaps); "
+                    f"download {totals['download_mb']:.2f} MB{unknown}",
+            details=self.footprint
+        ))
+    
+    def _generate_report(self) -> ComplianceReport:
+        """Generate the final compliance report"""
+        # Count statuses and determine overall status
+        summary, overall_status = summarize_results(self.results)
         
         # Gather model info
         model_info = {
@@ -574,6 +3783,14 @@ class AmazonGLTFValidator:
                 "textures": len(self.gltf.images) if self.gltf.images else 0,
                 "nodes": len(self.gltf.nodes) if self.gltf.nodes else 0
             })
+        if self.footprint:
+            model_info["footprint"] = self.footprint["totals"]
+        if self.fail_fast:
+            model_info["fail_fast"] = {"complete": not self.skipped_checks, "skipped": self.skipped_checks}
+        if self.deadline is not None:
+            model_info["deadline"] = {"seconds": self.deadline, "timed_out": self.timed_out_checks}
+        if self.quick_estimates:
+            model_info["quick_look"] = self.quick_estimates
         
         return ComplianceReport(
             model_name=self.model_path.name,
@@ -581,7 +3798,8 @@ class AmazonGLTFValidator:
             overall_status=overall_status,
             results=self.results,
             summary=summary,
-            model_info=model_info
+            model_info=model_info,
+            timings=self.timings
         )
     
     @staticmethod
@@ -590,6 +3808,126 @@ class AmazonGLTFValidator:
         return n > 0 and (n & (n - 1)) == 0
 
 
+def report_from_dict(data: Dict) -> ComplianceReport:
+    """Rebuild a ComplianceReport from its asdict() form"""
+    data = dict(data)
+    data["results"] = [ValidationResult(**r) for r in data["results"]]
+    return ComplianceReport(**data)
+
+
+class ValidationCache:
+    """
+    Content-addressed on-disk cache of compliance reports.
+    
+    Keys hash the model bytes, every external buffer/image it references and
+    the validator's ruleset version, so an identical re-upload skips every
+    check. Entries are JSON files whose mtime tracks last use; the cache is
+    trimmed least-recently-used first once it exceeds ``max_bytes``.
+    """
+    
+    HASH_CHUNK_SIZE = 1024 * 1024
+    
+    def __init__(self, cache_dir, max_bytes: int = 256 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.writable = True  # Cleared when a run is interrupted; put() becomes a no-op
+        self._lock = threading.Lock()
+    
+    def _hash_file(self, digest, path: Path):
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+    
+    def key_for(self, model_path, ruleset: str) -> str:
+        """Content hash of the model, its referenced files and the ruleset"""
+        model_path = Path(model_path)
+        digest = hashlib.sha256()
+        digest.update(ruleset.encode())
+        digest.update(model_path.suffix.lower().encode())
+        self._hash_file(digest, model_path)
+        
+        try:
+            uris = referenced_uris(model_path)
+        except (ValueError, UnicodeDecodeError):
+            uris = []  # Unparseable model: the bytes alone identify the result
+        
+        for uri in uris:
+            digest.update(b"\0" + uri.encode())
+            ref_path = model_path.parent / unquote(uri)  # Resolved like the loader does
+            if ref_path.is_file():
+                self._hash_file(digest, ref_path)
+            else:
+                digest.update(b"<missing>")
+        return digest.hexdigest()
+    
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[ComplianceReport]:
+        """Return the stored report for ``key`` and mark it recently used"""
+        entry = self._entry_path(key)
+        try:
+            with open(entry) as f:
+                report = report_from_dict(json.load(f))
+            os.utime(entry)
+        except (OSError, ValueError, TypeError, KeyError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return report
+    
+    def put(self, key: str, report: ComplianceReport):
+        """Store a report atomically, then evict down to the size budget"""
+        if not self.writable:
+            return
+        entry = self._entry_path(key)
+        tmp = entry.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, 'w') as f:
+            json.dump(asdict(report), f)
+        os.replace(tmp, entry)
+        self._evict()
+    
+    def _evict(self):
+        with self._lock:
+            entries = []
+            total = 0
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+            
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+                self.evictions += 1
+    
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters plus current on-disk footprint"""
+        entries = list(self.cache_dir.glob("*.json"))
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "bytes": sum(p.stat().st_size for p in entries if p.exists()),
+        }
+
+
 def print_report(report: ComplianceReport):
     """Print a formatted console report"""
     print("\n" + "=" * 60)
@@ -607,6 +3945,10 @@ def print_report(report: ComplianceReport):
     print(f"  ✗ FAIL: {report.summary['FAIL']}")
     print(f"  ⚠ WARNING: {report.summary['WARNING']}")
     print(f"  ℹ INFO: {report.summary['INFO']}")
+    if report.summary.get("SKIPPED"):
+        print(f"  ⏭ SKIPPED: {report.summary['SKIPPED']}")
+    if report.summary.get("TIMEOUT"):
+        print(f"  ⏱ TIMEOUT: {report.summary['TIMEOUT']}")
     
     print(f"\nDetailed Results:")
     print("-" * 60)
@@ -621,7 +3963,9 @@ def print_report(report: ComplianceReport):
             "PASS": "✓",
             "FAIL": "✗",
             "WARNING": "⚠",
-            "INFO": "ℹ"
+            "INFO": "ℹ",
+            "SKIPPED": "⏭",
+            "TIMEOUT": "⏱"
         }.get(result.status, "?")
         
         print(f"  {status_icon} {result.check_name}: {result.message}")
@@ -641,6 +3985,26 @@ def print_report(report: ComplianceReport):
     print("\n" + "=" * 60)
 
 
+def print_timing_table(report: ComplianceReport):
+    """Print the per-phase timing table recorded during validation"""
+    print("\n" + "=" * 60)
+    print("PER-PHASE TIMING")
+    print("=" * 60)
+    print(f"{'Phase':<18}{'Wall ms':>12}{'CPU ms':>12}{'Peak alloc KB':>16}")
+    print("-" * 60)
+    total_wall = 0.0
+    total_cpu = 0.0
+    for phase, entry in report.timings.items():
+        peak = entry.get("peak_alloc_kb")
+        peak_text = f"{peak:,.1f}" if peak is not None else "-"
+        print(f"{phase:<18}{entry['wall_ms']:>12,.1f}{entry['cpu_ms']:>12,.1f}{peak_text:>16}")
+        total_wall += entry["wall_ms"]
+        total_cpu += entry["cpu_ms"]
+    print("-" * 60)
+    print(f"{'total':<18}{total_wall:>12,.1f}{total_cpu:>12,.1f}")
+    print("=" * 60)
+
+
 def save_json_report(report: ComplianceReport, output_path: str):
     """Save report as JSON"""
     report_dict = asdict(report)
@@ -651,34 +4015,546 @@ def save_json_report(report: ComplianceReport, output_path: str):
     print(f"\n📄 JSON report saved to: {output_path}")
 
 
+MODEL_SUFFIXES = ('.glb', '.gltf')
+
+# Extra seconds the batch parent waits beyond --timeout before it assumes a
+# worker is wedged in native code and kills the pool
+BATCH_KILL_GRACE = 10.0
+
+
+class _ModelTimeout(BaseException):
+    """
+    Raised inside a batch worker when its per-model alarm fires.
+    
+    Derives from BaseException, like ValidationTimeout, so the loader's and
+    checks' ``except Exception`` handlers cannot turn it into a FAIL result.
+    """
+
+
+def collect_model_paths(inputs: List[str], manifest: Optional[str] = None) -> List[str]:
+    """
+    Expand directories, glob patterns, plain files and an optional manifest
+    (one path per line, '#' comments allowed) into a de-duplicated list.
+    """
+    entries = list(inputs)
+    if manifest:
+        with open(manifest) as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    entries.append(line)
+    
+    paths = []
+    for entry in entries:
+        if os.path.isdir(entry):
+            paths.extend(
+                str(p) for p in sorted(Path(entry).rglob('*'))
+                if p.suffix.lower() in MODEL_SUFFIXES and p.is_file()
+            )
+        elif glob.has_magic(entry):
+            paths.extend(
+                p for p in sorted(glob.glob(entry, recursive=True))
+                if Path(p).suffix.lower() in MODEL_SUFFIXES and os.path.isfile(p)
+            )
+        else:
+            # Missing files are kept so they surface as ERROR records
+            paths.append(entry)
+    
+    return list(dict.fromkeys(paths))
+
+
+def _batch_validate_one(model_path: str, timeout: Optional[float], cache_dir: Optional[str] = None,
+                        validator_options: Optional[Dict] = None) -> Dict:
+    """Process-pool worker: validate a single model and return a JSON-able record"""
+    start = time.perf_counter()
+    record = {"path": model_path, "status": None, "elapsed_s": None, "error": None, "report": None}
+    
+    cache = None
+    
+    def on_alarm(signum, frame):
+        # Whatever the run produces from here on is partial; never cache it
+        if cache is not None:
+            cache.writable = False
+        raise _ModelTimeout()
+    
+    use_alarm = bool(timeout) and hasattr(signal, 'setitimer')
+    if use_alarm:
+        signal.signal(signal.SIGALRM, on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(f"File not found: {model_path}")
+        cache = ValidationCache(cache_dir) if cache_dir else None
+        # validate() prints progress; keep the worker's stdout out of the JSONL stream
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            report = AmazonGLTFValidator(model_path, cache=cache, **(validator_options or {})).validate()
+        record["status"] = report.overall_status
+        record["report"] = asdict(report)
+    except _ModelTimeout:
+        record["status"] = "TIMEOUT"
+        record["error"] = f"Validation exceeded {timeout}s"
+    except Exception as e:
+        record["status"] = "ERROR"
+        record["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    
+    record["elapsed_s"] = round(time.perf_counter() - start, 3)
+    return record
+
+
+def _kill_pool(executor: ProcessPoolExecutor):
+    """Terminate every worker of a pool, including ones stuck in native code"""
+    if sys.version_info >= (3, 14):
+        executor.terminate_workers()
+        return
+    # Before 3.14 the pool has no public way to reach its workers, so use the
+    # private pid -> Process map (unchanged since 3.2). The getattr keeps an
+    # interpreter without it working: queued models are still cancelled, and
+    # a wedged worker then lives until it finishes or the batch exits.
+    for process in list((getattr(executor, '_processes', None) or {}).values()):
+        process.terminate()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_batch_pool(paths: List[str], workers: int, timeout: Optional[float], emit,
+                    worker_options: Optional[Dict] = None) -> Tuple[List[str], List[str]]:
+    """
+    Validate ``paths`` on one process pool, calling ``emit`` per finished record.
+    
+    At most ``workers`` models are in flight, so submission time is a good
+    proxy for start time. Returns (crashed, requeue): models that were in
+    flight when a worker died, and innocent models that were in flight when
+    a wedged pool had to be killed.
+    """
+    pending = list(reversed(paths))
+    in_flight = {}
+    crashed, requeue = [], []
+    
+    import multiprocessing
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+    from concurrent.futures.process import BrokenProcessPool
+    
+    # spawn, not fork: forked workers would inherit pipes of Khronos
+    # subprocesses being launched concurrently from the batch thread
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+    try:
+        while pending or in_flight:
+            while pending and len(in_flight) < workers:
+                path = pending.pop()
+                in_flight[executor.submit(_batch_validate_one, path, timeout, **(worker_options or {}))] = (path, time.monotonic())
+            
+            # Wake up when the oldest in-flight model runs out of grace, so
+            # models submitted later are not charged for it
+            wait_for = None
+            if timeout:
+                oldest = min(started for _, started in in_flight.values())
+                wait_for = max(0.0, oldest + timeout + BATCH_KILL_GRACE - time.monotonic())
+            done, _ = wait(in_flight, timeout=wait_for, return_when=FIRST_COMPLETED)
+            
+            if not done:
+                # Nothing finished within the grace period: some worker ignored
+                # its alarm. Kill the pool, charge the overdue models and
+                # requeue the rest.
+                now = time.monotonic()
+                for path, started in in_flight.values():
+                    if now - started >= timeout + BATCH_KILL_GRACE:
+                        emit({"path": path, "status": "TIMEOUT", "elapsed_s": round(now - started, 3),
+                              "error": f"Worker killed after {timeout}s timeout", "report": None})
+                    else:
+                        requeue.append(path)
+                _kill_pool(executor)
+                requeue.extend(reversed(pending))
+                return crashed, requeue
+            
+            for future in done:
+                path, _ = in_flight.pop(future)
+                try:
+                    emit(future.result())
+                except BrokenProcessPool:
+                    # A worker died (segfault, OOM kill). Every in-flight model
+                    # is a suspect; the caller re-runs them one at a time.
+                    crashed.append(path)
+                    crashed.extend(p for p, _ in in_flight.values())
+                    requeue.extend(reversed(pending))
+                    return crashed, requeue
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    return crashed, requeue
+
+
+KHRONOS_BATCH_SIZE = 64
+
+
+class _KhronosBatch:
+    """Runs the Khronos validator over a batch in chunks on a background thread"""
+    
+    def __init__(self, paths: List[str]):
+        self._results: Dict[str, ValidationResult] = {}
+        self._chunks = []
+        self._ready: Dict[str, threading.Event] = {}
+        for i in range(0, len(paths), KHRONOS_BATCH_SIZE):
+            chunk = paths[i:i + KHRONOS_BATCH_SIZE]
+            event = threading.Event()
+            self._chunks.append((chunk, event))
+            for path in chunk:
+                self._ready[path] = event
+        threading.Thread(target=self._run, daemon=True).start()
+    
+    def _run(self):
+        for chunk, event in self._chunks:
+            try:
+                existing = [p for p in chunk if os.path.exists(p)]
+                timeout = AmazonGLTFValidator.GLTF_VALIDATOR_TIMEOUT * max(1, len(existing))
+                self._results.update(run_khronos_validator(existing, timeout))
+            finally:
+                event.set()
+    
+    def ready(self, path: str) -> bool:
+        """Whether the chunk holding ``path`` has been validated"""
+        return self._ready[path].is_set()
+    
+    def result_for(self, path: str) -> ValidationResult:
+        """Block until the chunk holding ``path`` has been validated"""
+        self._ready[path].wait()
+        return self._results.get(path) or ValidationResult(
+            category="Official Validation",
+            check_name="Khronos glTF Validator",
+            status="WARNING",
+            message="glTF Validator produced no report"
+        )
+
+
+def _merge_khronos_result(record: Dict, result: ValidationResult):
+    """Append a Khronos result to a batch record and refresh its summary/status"""
+    report = record["report"]
+    report["results"].append(asdict(result))
+    summary, overall_status = summarize_results([ValidationResult(**r) for r in report["results"]])
+    report["summary"] = summary
+    report["overall_status"] = overall_status
+    record["status"] = overall_status
+
+
+def run_batch(paths: List[str], workers: int, timeout: Optional[float], output=None,
+              cache_dir: Optional[str] = None, validator_options: Optional[Dict] = None) -> Dict[str, int]:
+    """
+    Validate many models on a process pool, streaming one JSON line per model
+    to ``output`` (default stdout). ``validator_options`` are passed to each
+    AmazonGLTFValidator. Returns per-status counts.
+    """
+    output = output or sys.stdout
+    counts: Dict[str, int] = {}
+    
+    # One Khronos process per chunk of models instead of one per model. Gate
+    # mode keeps Khronos in the workers, which run it only once the cheaper
+    # checks have passed; a quick look never runs it.
+    validator_options = dict(validator_options or {})
+    batched_khronos = not (validator_options.get("fail_fast") or validator_options.get("quick_look")) \
+        and gltf_validator_available()
+    khronos = _KhronosBatch(paths) if batched_khronos else None
+    validator_options["run_external_validator"] = khronos is None
+    worker_options = {"cache_dir": cache_dir, "validator_options": validator_options}
+    
+    # Records whose Khronos chunk is still running. Holding them here instead
+    # of waiting in emit keeps the pool loop collecting finished models.
+    waiting: List[Dict] = []
+    
+    def write(record):
+        counts[record["status"]] = counts.get(record["status"], 0) + 1
+        output.write(json.dumps(record) + "\n")
+        output.flush()
+    
+    def flush_waiting(block=False):
+        for record in list(waiting):
+            if block or khronos.ready(record["path"]):
+                waiting.remove(record)
+                _merge_khronos_result(record, khronos.result_for(record["path"]))
+                write(record)
+    
+    def emit(record):
+        if khronos is None:
+            write(record)
+            return
+        if record["report"] is not None:
+            waiting.append(record)
+        else:
+            write(record)
+        flush_waiting()
+    
+    queue = list(paths)
+    while queue:
+        crashed, requeue = _run_batch_pool(queue, workers, timeout, emit, worker_options)
+        # Isolate crash suspects: re-run each alone so only the culprit fails
+        for path in crashed:
+            solo_crashed, _ = _run_batch_pool([path], 1, timeout, emit, worker_options)
+            if solo_crashed:
+                emit({"path": path, "status": "CRASH", "elapsed_s": None,
+                      "error": "Validator process died", "report": None})
+        queue = requeue
+    
+    if khronos is not None:
+        flush_waiting(block=True)
+    return counts
+
+
+def validate_in_background(model_path: str, cache_dir: Optional[str] = None,
+                           validator_options: Optional[Dict] = None):
+    """
+    Start a full validation of one model in a separate process.
+    
+    Returns (executor, future); the future resolves to a batch record. Lets
+    --then-full run the exact validation while the quick look runs here.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    
+    executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+    future = executor.submit(_batch_validate_one, model_path, None, cache_dir, validator_options)
+    return executor, future
+
+
+def print_batch_summary(counts: Dict[str, int], elapsed: float):
+    """Print the aggregate batch summary (to stderr, keeping stdout pure JSONL)"""
+    total = sum(counts.values())
+    out = sys.stderr
+    print("\n" + "=" * 60, file=out)
+    print("BATCH VALIDATION SUMMARY", file=out)
+    print("=" * 60, file=out)
+    print(f"Models: {total}", file=out)
+    for status in ("COMPLIANT", "WARNING", "NON_COMPLIANT", "ERROR", "TIMEOUT", "CRASH"):
+        if counts.get(status):
+            print(f"  {status}: {counts[status]}", file=out)
+    rate = total / elapsed if elapsed > 0 else 0.0
+    print(f"Elapsed: {elapsed:.1f}s ({rate:.2f} models/s)", file=out)
+    print("=" * 60, file=out)
+
+
+def benchmark_startup(runs: int = 5) -> Dict:
+    """
+    Time cold imports of this module in fresh interpreters.
+    
+    Each run executes ``python -X importtime -c "import amazon_3d_validator"``
+    and parses the per-module timings the interpreter writes to stderr. The
+    breakdown of the fastest run lists the top-level imports by cumulative
+    time, along with any heavy dependency that was loaded eagerly.
+    """
+    module = Path(__file__).stem
+    probe = (f"import sys, {module}; "
+             f"print(','.join(n for n in {sorted(REQUIRED_PACKAGES)!r} if n in sys.modules))")
+    best = None
+    totals = []
+    for _ in range(max(1, runs)):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", probe],
+                              cwd=Path(__file__).resolve().parent,
+                              capture_output=True, text=True, check=True)
+        # Children are printed before their parent, indented two more spaces
+        total_us, children, pending = None, [], []
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, name = line.split("|")
+            if not cumulative.strip().isdigit():
+                continue  # header row
+            depth = (len(name) - len(name.lstrip()) - 1) // 2
+            if depth == 1:
+                pending.append((name.strip(), int(cumulative)))
+            elif depth == 0:
+                if name.strip() == module:
+                    total_us, children = int(cumulative), pending
+                pending = []
+        totals.append(total_us)
+        if best is None or total_us < best["total_us"]:
+            best = {"total_us": total_us, "imports": children,
+                    "eager": [n for n in proc.stdout.strip().split(",") if n]}
+    
+    return {
+        "runs": len(totals),
+        "best_ms": round(min(totals) / 1000, 2),
+        "median_ms": round(sorted(totals)[len(totals) // 2] / 1000, 2),
+        "top_imports": sorted(best["imports"], key=lambda item: -item[1])[:10],
+        "eager_dependencies": best["eager"],
+    }
+
+
+def print_startup_benchmark(result: Dict):
+    """Print the output of benchmark_startup"""
+    print("\n" + "=" * 60)
+    print("⏱️  STARTUP BENCHMARK")
+    print("=" * 60)
+    print(f"Import time over {result['runs']} runs: "
+          f"best {result['best_ms']:.1f} ms, median {result['median_ms']:.1f} ms")
+    print("\nSlowest imports (cumulative, fastest run):")
+    for name, us in result["top_imports"]:
+        print(f"  {us / 1000:>8.2f} ms  {name}")
+    if result["eager_dependencies"]:
+        print(f"\n⚠️  Loaded at import: {', '.join(result['eager_dependencies'])}")
+    else:
+        print(f"\n✅ No heavy dependency loaded at import ({', '.join(sorted(REQUIRED_PACKAGES))})")
+    print("=" * 60)
+
+
+def check_dependencies(verbose: bool = False) -> bool:
+    """Report missing third-party packages; True when everything is installed"""
+    missing = missing_dependencies()
+    if missing:
+        print(f"❌ Missing dependencies: {', '.join(missing)}", file=sys.stderr)
+        print(f"   Install with: {Path(sys.executable).name} -m pip install {' '.join(missing)}",
+              file=sys.stderr)
+        print("   (or: pip install -r requirements.txt)", file=sys.stderr)
+    elif verbose:
+        print(f"✅ All dependencies installed: {', '.join(REQUIRED_PACKAGES.values())}")
+    return not missing
+
+
+def batch_main(args) -> int:
+    """Entry point for --batch mode; returns the process exit code"""
+    paths = collect_model_paths(args.paths, args.manifest)
+    if not paths:
+        print("Error: no .glb/.gltf models matched the given inputs", file=sys.stderr)
+        return 1
+    
+    validator_options = {"alignment_type": args.alignment, "sample_bounds": args.fast_bounds,
+                         "fail_fast": args.fail_fast, "deadline": args.deadline,
+                         "quick_look": args.quick_look}
+    start = time.perf_counter()
+    if args.output:
+        with open(args.output, 'w') as f:
+            counts = run_batch(paths, args.workers, args.timeout, f, args.cache_dir, validator_options)
+    else:
+        counts = run_batch(paths, args.workers, args.timeout,
+                           cache_dir=args.cache_dir, validator_options=validator_options)
+    print_batch_summary(counts, time.perf_counter() - start)
+    
+    if any(counts.get(s) for s in ("NON_COMPLIANT", "ERROR", "TIMEOUT", "CRASH")):
+        return 1
+    if counts.get("WARNING") or counts.get("INCOMPLETE"):
+        return 2
+    return 0
+
+
 def main():
     """Main entry point"""
     if len(sys.argv) < 2:
         print("Usage: python amazon_3d_validator.py <path_to_gltf_or_glb_file>")
+        print("       python amazon_3d_validator.py --batch <dir|glob|file>... [--manifest FILE]")
         print("Example: python amazon_3d_validator.py model.glb")
         sys.exit(1)
     
-    model_path = sys.argv[1]
+    parser = argparse.ArgumentParser(description="Validate glTF/GLB models against Amazon 3D requirements")
+    parser.add_argument('paths', nargs='*', help="Model file, or directories/globs with --batch")
+    parser.add_argument('--batch', action='store_true', help="Validate many models on a process pool")
+    parser.add_argument('--manifest', help="File listing one model path per line (implies --batch)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Batch worker processes")
+    parser.add_argument('--timeout', type=float, default=300.0, help="Per-model timeout in seconds (batch)")
+    parser.add_argument('-o', '--output', help="Write batch JSON lines here instead of stdout")
+    parser.add_argument('--cache-dir', help="Reuse reports for unchanged models from this cache directory")
+    parser.add_argument('--alignment', default='FLOOR', choices=AmazonGLTFValidator.ALIGNMENT_TYPES,
+                        help="Placement type used for the pivot/orientation check")
+    parser.add_argument('--fast-bounds', action='store_true',
+                        help="Verify min/max of very large accessors on a strided sample")
+    parser.add_argument('--fail-fast', action='store_true',
+                        help="Gate mode: run checks cheapest-first and stop at the first FAIL")
+    parser.add_argument('--deadline', type=float, metavar='SECONDS',
+                        help="Time budget per model; unfinished checks are reported as TIMEOUT "
+                             "(in batch mode, keep it below --timeout)")
+    parser.add_argument('--quick-look', action='store_true',
+                        help="Estimate from metadata, image headers and vertex samples (huge files)")
+    parser.add_argument('--then-full', action='store_true',
+                        help="With --quick-look: run the exact validation in a second process "
+                             "alongside the quick look and print both")
+    parser.add_argument('--profile', nargs='?', const='', metavar='PSTATS',
+                        help="Trace allocations, print a per-phase timing table and dump cProfile "
+                             "stats (default: <model>_profile.pstats)")
+    parser.add_argument('--check-deps', action='store_true',
+                        help="Check that numpy, pygltflib and Pillow are installed, then exit")
+    parser.add_argument('--startup-benchmark', nargs='?', type=int, const=5, metavar='RUNS',
+                        help="Measure cold import time with python -X importtime, then exit")
+    args = parser.parse_args()
+    
+    if args.startup_benchmark is not None:
+        print_startup_benchmark(benchmark_startup(args.startup_benchmark))
+        sys.exit(0)
+    if not check_dependencies(verbose=args.check_deps):
+        sys.exit(1)
+    if args.check_deps:
+        sys.exit(0)
+    
+    batch = args.batch or args.manifest or len(args.paths) > 1
+    if batch and args.profile is not None:
+        parser.error("--profile profiles a single model and cannot be combined with --batch")
+    if batch:
+        sys.exit(batch_main(args))
+    
+    if not args.paths:
+        parser.error("a model path is required")
+    if args.then_full and not args.quick_look:
+        parser.error("--then-full requires --quick-look")
+    if args.then_full and args.profile is not None:
+        parser.error("--then-full cannot be combined with --profile")
+    model_path = args.paths[0]
     
     if not os.path.exists(model_path):
         print(f"Error: File not found: {model_path}")
         sys.exit(1)
     
     # Run validation
-    validator = AmazonGLTFValidator(model_path)
-    report = validator.validate()
+    cache = ValidationCache(args.cache_dir) if args.cache_dir else None
+    options = {"alignment_type": args.alignment, "sample_bounds": args.fast_bounds,
+               "fail_fast": args.fail_fast, "deadline": args.deadline}
+    if args.then_full:
+        # The exact validation starts first, in its own process, so it
+        # overlaps the quick look instead of waiting for it
+        executor, full = validate_in_background(model_path, args.cache_dir, options)
+        try:
+            print_report(AmazonGLTFValidator(model_path, quick_look=True, **options).validate())
+            print("\n⏳ Quick look done; waiting for the exact validation...\n")
+            record = full.result()
+        except BaseException:
+            _kill_pool(executor)
+            raise
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if record["report"] is None:
+            print(f"❌ Exact validation failed: {record['error']}")
+            sys.exit(1)
+        report = report_from_dict(record["report"])
+    else:
+        validator = AmazonGLTFValidator(model_path, cache=cache, quick_look=args.quick_look, **options)
+        if args.profile is not None:
+            import cProfile
+            import pstats
+            import tracemalloc
+            profiler = cProfile.Profile()
+            tracemalloc.start()
+            try:
+                # Imports get their own row instead of inflating the first check
+                validator._timed("imports", import_dependencies)
+                report = profiler.runcall(validator.validate)
+            finally:
+                tracemalloc.stop()
+            stats_path = args.profile or Path(model_path).stem + "_profile.pstats"
+            profiler.dump_stats(stats_path)
+        else:
+            report = validator.validate()
     
     # Print report
     print_report(report)
     
+    if args.profile is not None:
+        print_timing_table(report)
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+        print(f"📊 cProfile stats saved to: {stats_path}")
+    
     # Save JSON report
     json_output = Path(model_path).stem + "_compliance_report.json"
     save_json_report(report, json_output)
     
     # Exit with appropriate code
-    if report.overall_status == "NON_COMPLIANT":
+    if report.overall_status in ("NON_COMPLIANT", "TIMEOUT"):
         sys.exit(1)
-    elif report.overall_status == "WARNING":
+    elif report.overall_status in ("WARNING", "INCOMPLETE"):
         sys.exit(2)
     else:
         sys.exit(0)
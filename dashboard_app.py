@@ -16,6 +16,8 @@ from datetime import datetime
 from flask import Flask, render_template_string, request, jsonify, send_file
 import sys
 
+import validator_daemon
+
 # Install Flask if needed
 try:
     import flask
@@ -30,8 +32,8 @@ app.config['REPORTS_FOLDER'] = '/home/claude/reports'
 app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB max file size
 
 # Create necessary directories
-Path(app.config['UPLOAD_FOLDER']).mkdir(exist_ok=True)
-Path(app.config['REPORTS_FOLDER']).mkdir(exist_ok=True)
+Path(app.config['UPLOAD_FOLDER']).mkdir(parents=True, exist_ok=True)
+Path(app.config['REPORTS_FOLDER']).mkdir(parents=True, exist_ok=True)
 
 # Simple in-memory database (use SQLite or PostgreSQL in production)
 projects_db = {}
@@ -686,27 +688,35 @@ def upload_model():
     
     # Run validation
     try:
-        validator_path = Path('/home/claude/amazon_3d_validator.py')
-        result = subprocess.run(
-            [sys.executable, str(validator_path), str(filepath)],
-            capture_output=True,
-            text=True,
-            cwd='/home/claude'
-        )
-        
-        # Load JSON report
         json_report_path = filepath.parent / f"{filepath.stem}_compliance_report.json"
-        with open(json_report_path) as f:
-            report = json.load(f)
-        
-        # Generate PDF report
-        pdf_generator_path = Path('/home/claude/pdf_report_generator.py')
-        subprocess.run(
-            [sys.executable, str(pdf_generator_path), str(json_report_path), 'WarRoom'],
-            capture_output=True,
-            text=True,
-            cwd='/home/claude'
-        )
+        try:
+            # Warm validator daemon: validates and writes the JSON and PDF reports
+            record = validator_daemon.validate_model(str(filepath), json_output=str(json_report_path),
+                                                     pdf_brand='WarRoom')
+            if record['report'] is None:
+                return jsonify({'error': f"{record['status']}: {record['error']}"}), 500
+            report = record['report']
+        except validator_daemon.DaemonUnavailable:
+            validator_path = Path('/home/claude/amazon_3d_validator.py')
+            result = subprocess.run(
+                [sys.executable, str(validator_path), str(filepath)],
+                capture_output=True,
+                text=True,
+                cwd='/home/claude'
+            )
+            
+            # Load JSON report
+            with open(json_report_path) as f:
+                report = json.load(f)
+            
+            # Generate PDF report
+            pdf_generator_path = Path('/home/claude/pdf_report_generator.py')
+            subprocess.run(
+                [sys.executable, str(pdf_generator_path), str(json_report_path), 'WarRoom'],
+                capture_output=True,
+                text=True,
+                cwd='/home/claude'
+            )
         
         # Store project
         project_id = len(projects_db) + 1
@@ -774,6 +784,7 @@ if __name__ == '__main__':
     print("🎯 WarRoom 3D QA Dashboard Starting...")
     print("="*60)
     print("\n📍 Dashboard will be available at: http://localhost:5000")
+    print("⚡ Run `python validator_daemon.py serve` alongside for warm, faster validations")
     print("🔄 Press Ctrl+C to stop the server\n")
     
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -18,7 +18,7 @@ from werkzeug.utils import secure_filename
 
 # Import our validator
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from amazon_3d_validator import AmazonGLTFValidator
+from amazon_3d_validator import AmazonGLTFValidator, ValidationCache
 
 app = Flask(__name__)
 app.config['UPLOAD_FOLDER'] = './uploads'
@@ -27,6 +27,9 @@ app.config['MAX_CONTENT_LENGTH'] = 200 * 1024 * 1024  # 200MB max
 # Create upload folder
 Path(app.config['UPLOAD_FOLDER']).mkdir(exist_ok=True)
 
+# Re-uploads of identical models are answered from this cache
+validation_cache = ValidationCache(Path(app.config['UPLOAD_FOLDER']) / '.validation_cache')
+
 # HTML Template with Flixmedia Smollan branding
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -798,7 +801,7 @@ def validate():
         filepath = Path(app.config['UPLOAD_FOLDER']) / filename
         file.save(filepath)
         
-        validator = AmazonGLTFValidator(str(filepath))
+        validator = AmazonGLTFValidator(str(filepath), cache=validation_cache)
         report = validator.validate()
         
         recommendations = generate_recommendations(report.__dict__)
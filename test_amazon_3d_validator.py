@@ -0,0 +1,848 @@
+"""
+Regression tests for amazon_3d_validator.
+
+Run with: python -m pytest -q test_amazon_3d_validator.py
+"""
+
+import base64
+import io
+import json
+import os
+import signal
+import struct
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+import pygltflib
+import pytest
+from PIL import Image
+
+import amazon_3d_validator
+from amazon_3d_validator import (
+    AmazonGLTFValidator, GLBReader, ValidationCache, _stage_for_khronos, gltf_validator_available,
+    probe_image_file,
+    data_uri_reader, probe_image, read_draco_header,
+)
+
+# One triangle: three VEC3 float positions
+TRIANGLE = struct.pack('<9f', 0, 0, 0, 1, 0, 0, 0, 1, 0)
+
+
+def write_gltf(path, nodes, scene_nodes, **extra):
+    """Write a minimal one-triangle .gltf with the given node hierarchy"""
+    doc = {
+        "asset": {"version": "2.0"},
+        "scene": 0,
+        "scenes": [{"nodes": scene_nodes}],
+        "nodes": nodes,
+        "meshes": [{"primitives": [{"attributes": {"POSITION": 0}}]}],
+        "accessors": [{
+            "bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3",
+            "min": [0, 0, 0], "max": [1, 1, 0],
+        }],
+        "bufferViews": [{"buffer": 0, "byteLength": len(TRIANGLE)}],
+        "buffers": [{
+            "byteLength": len(TRIANGLE),
+            "uri": "data:application/octet-stream;base64," + base64.b64encode(TRIANGLE).decode(),
+        }],
+    }
+    doc.update(extra)
+    path.write_text(json.dumps(doc))
+    return path
+
+
+def glb_bytes(doc, bin_data=None, json_pad=b' ', bin_pad=b'\0'):
+    """Assemble a GLB container: header, space-padded JSON chunk, zero-padded BIN chunk"""
+    chunks = []
+    json_data = json.dumps(doc).encode()
+    chunks.append((0x4E4F534A, json_data, json_pad))
+    if bin_data is not None:
+        chunks.append((0x004E4942, bin_data, bin_pad))
+    body = b''
+    for chunk_type, data, pad in chunks:
+        body += struct.pack('<II', len(data), chunk_type) + data + pad * (-len(data) % 4)
+    return struct.pack('<III', 0x46546C67, 2, 12 + len(body)) + body
+
+
+def triangle_doc(**extra):
+    """A one-triangle glTF document whose vertex data lives in buffer 0 (the BIN chunk)"""
+    doc = {
+        "asset": {"version": "2.0"},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"mesh": 0, "children": [1]}, {"translation": [0, 1, 0]}],
+        "meshes": [{"primitives": [{"attributes": {"POSITION": 0}, "material": 0}]}],
+        "materials": [{"pbrMetallicRoughness": {"baseColorFactor": [1, 0, 0, 1]}}],
+        "accessors": [{
+            "bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3",
+            "min": [0, 0, 0], "max": [1, 1, 0],
+        }],
+        "bufferViews": [{"buffer": 0, "byteLength": len(TRIANGLE)}],
+        "buffers": [{"byteLength": len(TRIANGLE)}],
+    }
+    doc.update(extra)
+    return doc
+
+
+def run_with_guard(target, seconds=30):
+    """Run ``target`` in a thread and fail instead of hanging the suite"""
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(value=target()), daemon=True)
+    thread.start()
+    thread.join(seconds)
+    assert not thread.is_alive(), f"did not finish within {seconds}s"
+    return result["value"]
+
+
+def test_cyclic_children_terminate(tmp_path):
+    # 0 -> 1 -> 0: invalid glTF, but must not hang the scene walk
+    model = write_gltf(tmp_path / "cycle.gltf", [
+        {"mesh": 0, "children": [1]},
+        {"mesh": 0, "children": [0]},
+    ], scene_nodes=[0])
+    validator = AmazonGLTFValidator(str(model), run_external_validator=False)
+
+    report = run_with_guard(validator.validate)
+
+    assert report.overall_status != "TIMEOUT"
+    assert list(validator._scene_nodes(0)) == [0, 1]
+
+
+def test_longer_cycle_below_valid_root(tmp_path):
+    # 0 -> 1 -> 2 -> 3 -> 1: the cycle hangs off a proper root
+    model = write_gltf(tmp_path / "cycle.gltf", [
+        {"children": [1]},
+        {"mesh": 0, "children": [2]},
+        {"mesh": 0, "children": [3]},
+        {"mesh": 0, "children": [1]},
+    ], scene_nodes=[0])
+    validator = AmazonGLTFValidator(str(model), run_external_validator=False)
+
+    run_with_guard(validator.validate)
+
+    assert list(validator._scene_nodes(0)) == [0, 1, 2, 3]
+
+
+def test_cache_key_follows_percent_encoded_uris(tmp_path):
+    texture = tmp_path / "tex a.png"
+    texture.write_bytes(b"first")
+    model = write_gltf(tmp_path / "model.gltf", [{"mesh": 0}], scene_nodes=[0],
+                       images=[{"uri": "tex%20a.png"}])
+    cache = ValidationCache(tmp_path / "cache")
+
+    before = cache.key_for(model, "rules")
+    texture.write_bytes(b"second")
+
+    assert cache.key_for(model, "rules") != before
+
+
+
+def cached_run(model, cache, validator_class=AmazonGLTFValidator, **options):
+    report = validator_class(str(model), cache=cache, run_external_validator=False, **options).validate()
+    return report.model_info.get("cached", False)
+
+
+class BumpedRulesetValidator(AmazonGLTFValidator):
+    RULESET_VERSION = AmazonGLTFValidator.RULESET_VERSION + 1
+
+
+class LooserTextureValidator(AmazonGLTFValidator):
+    MAX_TEXTURE_SIZE = AmazonGLTFValidator.MAX_TEXTURE_SIZE * 2
+
+
+@pytest.mark.parametrize("validator_class, options", [
+    (BumpedRulesetValidator, {}),
+    (LooserTextureValidator, {}),
+    (AmazonGLTFValidator, {"alignment_type": "WALL"}),
+    (AmazonGLTFValidator, {"sample_bounds": True}),
+    (AmazonGLTFValidator, {"fail_fast": True}),
+])
+def test_cache_misses_after_rule_or_option_change(tmp_path, validator_class, options):
+    model = write_gltf(tmp_path / "model.gltf", [{"mesh": 0}], scene_nodes=[0])
+    cache = ValidationCache(tmp_path / "cache")
+
+    assert not cached_run(model, cache)
+    assert cached_run(model, cache)
+    assert not cached_run(model, cache, validator_class, **options)
+    assert cached_run(model, cache, validator_class, **options)
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    model = write_gltf(tmp_path / "model.gltf", [{"mesh": 0}], scene_nodes=[0])
+    report = AmazonGLTFValidator(str(model), run_external_validator=False).validate()
+    cache = ValidationCache(tmp_path / "cache")
+    cache.put("first", report)
+    size = cache._entry_path("first").stat().st_size
+    cache.max_bytes = size * 2 + size // 2
+    cache.put("second", report)
+    os.utime(cache._entry_path("first"), (100, 100))
+    os.utime(cache._entry_path("second"), (200, 200))
+
+    assert cache.get("first") is not None  # Now the most recently used
+    cache.put("third", report)
+
+    assert cache.evictions == 1
+    assert cache.get("second") is None
+    assert cache.get("first") is not None and cache.get("third") is not None
+
+
+def test_corrupt_cache_entry_is_a_miss(tmp_path):
+    model = write_gltf(tmp_path / "model.gltf", [{"mesh": 0}], scene_nodes=[0])
+    cache = ValidationCache(tmp_path / "cache")
+    assert not cached_run(model, cache)
+    (entry,) = (tmp_path / "cache").glob("*.json")
+
+    for garbage in ("{\"model_name\": ", "[]", "{}"):
+        entry.write_text(garbage)
+        assert not cached_run(model, cache)  # Revalidated and stored again
+        assert cached_run(model, cache)
+    assert cache.misses == 4 and cache.hits == 3
+
+@pytest.mark.parametrize("mode, transparency, channels", [
+    ("L", 0, 2),
+    ("RGB", (0, 0, 0), 4),
+    ("P", 0, 4),
+])
+def test_png_trns_counts_as_alpha(tmp_path, mode, transparency, channels):
+    path = tmp_path / "trns.png"
+    Image.new(mode, (8, 8)).save(path, transparency=transparency)
+
+    assert probe_image_file(path)["channels"] == channels
+
+
+def staged_files(stage_dir):
+    """Staged file names (relative to ``stage_dir``) mapped to their contents"""
+    return {str(p.relative_to(stage_dir)): p.read_bytes() for p in stage_dir.rglob('*') if p.is_file()}
+
+
+def test_khronos_staging_stays_inside_stage_dir(tmp_path):
+    models = tmp_path / "m"
+    (models / "a/b/c/d").mkdir(parents=True)
+    (models / "x.png").write_bytes(b"above")
+    outside = tmp_path / "outside.png"
+    outside.write_bytes(b"absolute")
+    model = write_gltf(models / "a/b/c/d/model.gltf", [{"mesh": 0}], scene_nodes=[0],
+                       images=[{"uri": "../../../../x.png"}, {"uri": str(outside)}])
+    stage = tmp_path / "scratch" / "000000"
+    stage.parent.mkdir()
+
+    _stage_for_khronos(model, stage)
+
+    # Nothing was linked beside the stage directory or into the source tree
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["m", "outside.png", "scratch"]
+    assert sorted(p.name for p in (tmp_path / "scratch").iterdir()) == ["000000"]
+    assert not any(p.is_symlink() for p in models.rglob('*'))
+    files = staged_files(stage)
+    assert files["x.png"] == b"above"
+    assert b"absolute" not in files.values()
+
+
+def test_khronos_staging_keeps_sibling_models_apart(tmp_path):
+    stages = []
+    for name in ("one", "two"):
+        (tmp_path / name / "shared").mkdir(parents=True)
+        (tmp_path / name / "shared" / "tex.png").write_bytes(name.encode())
+        (tmp_path / name / "model").mkdir()
+        model = write_gltf(tmp_path / name / "model" / "model.gltf", [{"mesh": 0}], scene_nodes=[0],
+                           images=[{"uri": "../shared/tex.png"}])
+        stages.append(tmp_path / "scratch" / name)
+        stages[-1].parent.mkdir(exist_ok=True)
+        _stage_for_khronos(model, stages[-1])
+
+    assert staged_files(stages[0])["shared/tex.png"] == b"one"
+    assert staged_files(stages[1])["shared/tex.png"] == b"two"
+    assert sorted(p.name for p in (tmp_path / "scratch").iterdir()) == ["one", "two"]
+
+
+def test_glb_reader_indexes_chunks(tmp_path):
+    path = tmp_path / "model.glb"
+    doc = triangle_doc()
+    path.write_bytes(glb_bytes(doc, TRIANGLE))
+
+    with GLBReader(path) as glb:
+        assert glb.version == 2
+        assert json.loads(glb.json_text()) == doc
+        assert glb.json_chunk[0] == 20
+        assert bytes(glb.bin_data) == TRIANGLE
+
+
+def test_glb_reader_excludes_chunk_padding(tmp_path):
+    # 9-byte BIN payload padded to 12, JSON padded with spaces to a 4-byte boundary
+    payload = b"123456789"
+    doc = {"asset": {"version": "2.0"}, "buffers": [{"byteLength": 9}], "x": "a"}
+    assert len(json.dumps(doc)) % 4
+    path = tmp_path / "padded.glb"
+    path.write_bytes(glb_bytes(doc, payload))
+
+    with GLBReader(path) as glb:
+        assert glb.json_text() == json.dumps(doc)
+        assert bytes(glb.bin_data) == payload
+        assert glb.bin_chunk[0] % 4 == 0
+
+
+def test_glb_reader_without_bin_chunk(tmp_path):
+    path = tmp_path / "nobin.glb"
+    path.write_bytes(glb_bytes({"asset": {"version": "2.0"}}))
+
+    with GLBReader(path) as glb:
+        assert glb.bin_chunk is None
+        assert glb.bin_data is None
+
+
+@pytest.mark.parametrize("corrupt, message", [
+    (lambda data: b"glTF" + data[4:8], "too small"),
+    (lambda data: b"gLTF" + data[4:], "bad magic"),
+    (lambda data: data[:4] + struct.pack('<I', 1) + data[8:], "container version"),
+    (lambda data: data[:8] + struct.pack('<I', len(data) + 4) + data[12:], "declares"),
+    (lambda data: data[:12] + struct.pack('<I', len(data)) + data[16:], "overruns"),
+    (lambda data: data[:16] + b"BIN\0" + data[20:], "First GLB chunk must be JSON"),
+])
+def test_glb_reader_rejects_corrupt_containers(tmp_path, corrupt, message):
+    path = tmp_path / "bad.glb"
+    path.write_bytes(corrupt(glb_bytes(triangle_doc(), TRIANGLE)))
+
+    with pytest.raises(ValueError, match=message):
+        GLBReader(path)
+
+
+def test_glb_reader_matches_pygltflib(tmp_path):
+    path = tmp_path / "model.glb"
+    path.write_bytes(glb_bytes(triangle_doc(), TRIANGLE))
+
+    with GLBReader(path) as glb:
+        ours = glb.load_gltf()
+    reference = pygltflib.GLTF2().load(str(path))
+
+    assert json.loads(ours.to_json()) == json.loads(reference.to_json())
+    assert reference.binary_blob() == TRIANGLE
+
+
+# Draco 2.2 encodings of the same 3-face, 5-point mesh (written with the
+# Draco encoder through DracoPy); edgebreaker counts encoded vertices, which
+# include the two split off at the open boundary
+DRACO_SEQUENTIAL = bytes.fromhex(
+    "445241434f0202010000000305010001020002030001040101000903000002000101000303692699"
+    "190316668788040c00000000ff3f00000000000000000000000000000000803f0e")
+DRACO_EDGEBREAKER = bytes.fromhex(
+    "445241434f0202010100000007030003000002ff00ff012201ff0000010009030000020001010003"
+    "036d1b952403f7249e91404c480000000000ff3f00000000000000000000000000000000803f0e")
+DRACO_WITH_METADATA = bytes.fromhex(
+    "445241434f0202010100800001117175616e74697a6174696f6e5f62697473040e00000000000703"
+    "0003000002ff00ff012201ff0000010009030000020001010003036d1b952403f7249e91404c4800"
+    "00000000ff3f00000000000000000000000000000000803f0e")
+# Draco 2.1 stores the counts as uint32: 12 faces, 8 points
+DRACO_V21_SEQUENTIAL = b"DRACO" + bytes([2, 1, 1, 0]) + b"\0\0" + struct.pack('<II', 12, 8)
+
+
+@pytest.mark.parametrize("data, method, faces, points", [
+    (DRACO_SEQUENTIAL, "sequential", 3, 5),
+    (DRACO_EDGEBREAKER, "edgebreaker", 3, 7),
+    (DRACO_WITH_METADATA, "edgebreaker", 3, 7),
+    (DRACO_V21_SEQUENTIAL, "sequential", 12, 8),
+])
+def test_draco_header_counts(data, method, faces, points):
+    header = read_draco_header(memoryview(data))
+
+    assert (header["method"], header["faces"], header["points"]) == (method, faces, points)
+
+
+def _reads(data):
+    try:
+        read_draco_header(data)
+    except ValueError:
+        return False
+    return True
+
+
+@pytest.mark.parametrize("data", [DRACO_SEQUENTIAL, DRACO_EDGEBREAKER, DRACO_WITH_METADATA, DRACO_V21_SEQUENTIAL])
+def test_draco_header_truncated(data):
+    # Every prefix that stops short of the counts is reported as truncated
+    header_end = next(n for n in range(len(data) + 1) if _reads(data[:n]))
+    for n in range(header_end):
+        with pytest.raises(ValueError):
+            read_draco_header(data[:n])
+
+
+@pytest.mark.parametrize("data, message", [
+    (b"NOTDRACO" * 4, "Not a Draco bitstream"),
+    (b"DRACO" + bytes([3, 0, 1, 0, 0, 0, 1, 1]), "version"),
+    (b"DRACO" + bytes([2, 2, 0, 0, 0, 0, 1, 1]), "point cloud"),
+    (b"DRACO" + bytes([2, 2, 1, 7, 0, 0, 1, 1]), "encoding method"),
+    (b"DRACO" + bytes([2, 2, 1, 0, 0, 0]) + b"\xff" * 16, "varint too long"),
+])
+def test_draco_header_rejects_garbage(data, message):
+    with pytest.raises(ValueError, match=message):
+        read_draco_header(data)
+
+
+def loaded_validator(tmp_path, bin_data, accessors, buffer_views, validator_class=AmazonGLTFValidator):
+    """A validator with a GLB of the given accessors loaded but no checks run"""
+    bin_data += b"\0" * (-len(bin_data) % 4)
+    doc = triangle_doc(accessors=accessors, bufferViews=buffer_views, buffers=[{"byteLength": len(bin_data)}])
+    model = tmp_path / "model.glb"
+    model.write_bytes(glb_bytes(doc, bin_data))
+    validator = validator_class(str(model), run_external_validator=False)
+    assert validator._load_model()
+    return validator
+
+
+def test_interleaved_accessors(tmp_path):
+    positions = [(0, 0, 0), (1, 0, 0), (0, 1, 0)]
+    colors = [(255, 0, 0, 255), (0, 51, 0, 255), (0, 0, 255, 0)]
+    data = b"".join(struct.pack("<3f4B", *p, *c) for p, c in zip(positions, colors))
+    validator = loaded_validator(tmp_path, data, [
+        {"bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3"},
+        {"bufferView": 0, "byteOffset": 12, "componentType": 5121, "normalized": True,
+         "count": 3, "type": "VEC4"},
+    ], [{"buffer": 0, "byteLength": len(data), "byteStride": 16}])
+
+    position = validator._read_accessor(0)
+    color = validator._read_accessor(1)
+
+    np.testing.assert_array_equal(position, positions)
+    np.testing.assert_allclose(color, np.array(colors) / 255)
+    assert not position.flags.owndata  # A strided view over the BIN chunk, not a copy
+    assert not position.flags.writeable and not color.flags.writeable
+
+
+@pytest.mark.parametrize("component_type, fmt, raw, expected", [
+    (5120, "b", [-128, -127, 0, 127], [-1, -1, 0, 1]),
+    (5121, "B", [0, 51, 255], [0, 0.2, 1]),
+    (5122, "h", [-32768, -32767, 0, 32767], [-1, -1, 0, 1]),
+    (5123, "H", [0, 13107, 65535], [0, 0.2, 1]),
+])
+def test_normalized_accessor(tmp_path, component_type, fmt, raw, expected):
+    data = struct.pack(f"<{len(raw)}{fmt}", *raw)
+    validator = loaded_validator(tmp_path, data, [
+        {"bufferView": 0, "componentType": component_type, "normalized": True, "count": len(raw), "type": "SCALAR"},
+    ], [{"buffer": 0, "byteLength": len(data)}])
+
+    values = validator._read_accessor(0)
+
+    assert values.dtype == np.float64
+    np.testing.assert_allclose(values[:, 0], expected)
+
+
+SPARSE_DATA = struct.pack("<9f", 0, 0, 0, 1, 0, 0, 0, 1, 0) + struct.pack("<2H", 2, 0) + struct.pack("<6f", 7, 7, 7, 9, 9, 9)
+SPARSE_VIEWS = [
+    {"buffer": 0, "byteLength": 36},
+    {"buffer": 0, "byteOffset": 36, "byteLength": 4},
+    {"buffer": 0, "byteOffset": 40, "byteLength": 24},
+]
+
+
+def sparse_accessor(count=3, base_view=0, **extra):
+    accessor = {"componentType": 5126, "count": count, "type": "VEC3", "sparse": {
+        "count": 2,
+        "indices": {"bufferView": 1, "componentType": 5123},
+        "values": {"bufferView": 2},
+    }}
+    if base_view is not None:
+        accessor["bufferView"] = base_view
+    accessor.update(extra)
+    return accessor
+
+
+@pytest.mark.parametrize("base_view, expected", [
+    (0, [(9, 9, 9), (1, 0, 0), (7, 7, 7)]),
+    (None, [(9, 9, 9), (0, 0, 0), (7, 7, 7)]),  # No bufferView: substitutes over zeros
+])
+def test_sparse_accessor(tmp_path, base_view, expected):
+    validator = loaded_validator(tmp_path, SPARSE_DATA, [sparse_accessor(base_view=base_view)], SPARSE_VIEWS)
+
+    values = validator._read_accessor(0)
+
+    np.testing.assert_array_equal(values, expected)
+    # The substitution went into a copy; the BIN chunk still holds the base data
+    np.testing.assert_array_equal(np.frombuffer(validator.glb.bin_data[:36], "<f4"), [0, 0, 0, 1, 0, 0, 0, 1, 0])
+
+
+def test_sparse_index_beyond_count(tmp_path):
+    validator = loaded_validator(tmp_path, SPARSE_DATA, [sparse_accessor(count=2, byteOffset=0)], SPARSE_VIEWS)
+
+    with pytest.raises(ValueError, match="sparse indices"):
+        validator._read_accessor(0)
+
+
+class SmallAccessorCacheValidator(AmazonGLTFValidator):
+    ACCESSOR_CACHE_BYTES = 64  # Two decoded 4-element SCALARs (float64)
+
+
+def test_accessor_cache_evicts_least_recently_used(tmp_path):
+    data = struct.pack("<4B", 0, 85, 170, 255)
+    normalized = {"bufferView": 0, "componentType": 5121, "normalized": True, "count": 4, "type": "SCALAR"}
+    dense = {"bufferView": 0, "componentType": 5121, "count": 4, "type": "SCALAR"}
+    validator = loaded_validator(tmp_path, data, [normalized, normalized, normalized, dense],
+                                 [{"buffer": 0, "byteLength": 4}], SmallAccessorCacheValidator)
+    cache = validator.accessors
+
+    first = validator._read_accessor(0)
+    validator._read_accessor(1)
+    assert validator._read_accessor(0) is first  # Hit; 1 is now least recently used
+    validator._read_accessor(2)
+
+    assert cache.evictions == 1 and cache.current_bytes == 64
+    assert validator._read_accessor(0) is first
+    assert validator._read_accessor(1) is not None and cache.misses == 4
+
+    # Zero-copy views are free to keep and never push anything out
+    evictions = cache.evictions
+    validator._read_accessor(3)
+    assert cache.evictions == evictions and cache.current_bytes == 64
+
+
+def test_accessor_larger_than_cache_is_not_kept(tmp_path):
+    data = struct.pack("<12B", *range(12))
+    validator = loaded_validator(tmp_path, data, [
+        {"bufferView": 0, "componentType": 5121, "normalized": True, "count": 12, "type": "SCALAR"},
+    ], [{"buffer": 0, "byteLength": 12}], SmallAccessorCacheValidator)
+
+    values = validator._read_accessor(0)
+
+    assert values is not validator._read_accessor(0)
+    assert validator.accessors.current_bytes == 0 and validator.accessors.evictions == 0
+
+def draco_doc(blob, mode, index_count):
+    """One Draco primitive over buffer 0, with accessor counts as declared by the exporter"""
+    return {
+        "asset": {"version": "2.0"},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"mesh": 0}],
+        "extensionsUsed": ["KHR_draco_mesh_compression"],
+        "extensionsRequired": ["KHR_draco_mesh_compression"],
+        "meshes": [{"primitives": [{
+            "attributes": {"POSITION": 0}, "indices": 1, "mode": mode,
+            "extensions": {"KHR_draco_mesh_compression": {"bufferView": 0, "attributes": {"POSITION": 0}}},
+        }]}],
+        "accessors": [
+            {"componentType": 5126, "count": 5, "type": "VEC3", "min": [0, 0, 0], "max": [1, 1, 1]},
+            {"componentType": 5125, "count": index_count, "type": "SCALAR"},
+        ],
+        "bufferViews": [{"buffer": 0, "byteLength": len(blob)}],
+        "buffers": [{"byteLength": len(blob)}],
+    }
+
+
+def result(report, check_name):
+    return next(r for r in report.results if r.check_name == check_name)
+
+
+@pytest.mark.parametrize("mode", [4, 5])
+def test_draco_triangles_come_from_header(tmp_path, mode):
+    # The declared TRIANGLE_STRIP mode must not be applied to the decoded triangle list
+    path = tmp_path / "draco.glb"
+    path.write_bytes(glb_bytes(draco_doc(DRACO_SEQUENTIAL, mode, 9), DRACO_SEQUENTIAL))
+
+    report = AmazonGLTFValidator(str(path), run_external_validator=False).validate()
+
+    assert result(report, "Triangle Count").message.startswith("Triangle count: 3 ")
+    assert "3 faces, 5 points" in result(report, "Draco Compression").message
+
+
+def test_draco_unreadable_header_falls_back(tmp_path):
+    blob = b"NOTDRACO" * 4
+    path = tmp_path / "draco.glb"
+    path.write_bytes(glb_bytes(draco_doc(blob, 4, 300), blob))
+
+    report = AmazonGLTFValidator(str(path), run_external_validator=False).validate()
+
+    assert result(report, "Draco Header").status == "WARNING"
+    assert result(report, "Triangle Count").message.startswith("Triangle count: 100 ")
+
+
+def encoded_image(mode, size, fmt, **save_args):
+    buffer = io.BytesIO()
+    Image.new(mode, size, (40,) * len(mode)).save(buffer, fmt, **save_args)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("mode, save_args, channels, progressive", [
+    ("RGB", {}, 3, False),
+    ("L", {}, 1, False),
+    ("RGB", {"progressive": True}, 3, True),
+])
+def test_probe_jpeg(mode, save_args, channels, progressive):
+    header = probe_image(io.BytesIO(encoded_image(mode, (300, 200), "JPEG", **save_args)))
+
+    assert (header["format"], header["width"], header["height"]) == ("jpeg", 300, 200)
+    assert header["channels"] == channels
+    assert header["progressive"] is progressive
+
+
+@pytest.mark.parametrize("mode, save_args, channels", [
+    ("RGB", {"quality": 80}, 3),
+    ("RGB", {"lossless": True}, 3),
+    ("RGBA", {"lossless": True}, 4),
+    ("RGBA", {"quality": 80}, 4),
+])
+def test_probe_webp(mode, save_args, channels):
+    header = probe_image(io.BytesIO(encoded_image(mode, (300, 200), "WEBP", **save_args)))
+
+    assert (header["format"], header["width"], header["height"]) == ("webp", 300, 200)
+    assert header["channels"] == channels
+
+
+def ktx2_bytes(width, height, color_model=None, samples=0, channel_id=0):
+    """KTX2 header with an optional basic data format descriptor"""
+    dfd = b''
+    if color_model is not None:
+        block_size = 24 + 16 * samples
+        block = bytearray(block_size)
+        struct.pack_into('<HB', block, 6, block_size, color_model)
+        if samples:
+            block[27] = channel_id
+        dfd = struct.pack('<I', 4 + block_size) + bytes(block)
+    dfd_offset = 12 + 44 + 24  # After the index: sgd/kvd fields
+    header = struct.pack('<11I', 0, 1, width, height, 0, 0, 1, 1, 1, dfd_offset, len(dfd))
+    data = b'\xabKTX 20\xbb\r\n\x1a\n' + header
+    return data + bytes(dfd_offset - len(data)) + dfd
+
+
+@pytest.mark.parametrize("data, color_type, channels", [
+    (ktx2_bytes(512, 256), "vkFormat 0", None),
+    (ktx2_bytes(512, 256, 163, samples=1), "ETC1S", 3),
+    (ktx2_bytes(512, 256, 163, samples=2), "ETC1S", 4),
+    (ktx2_bytes(512, 256, 166, samples=1, channel_id=3), "UASTC", 4),
+])
+def test_probe_ktx2(data, color_type, channels):
+    header = probe_image(io.BytesIO(data))
+
+    assert (header["format"], header["width"], header["height"]) == ("ktx2", 512, 256)
+    assert header["supercompression"] == "BasisLZ"
+    assert (header["color_type"], header["channels"]) == (color_type, channels)
+
+
+@pytest.mark.parametrize("fmt", ["PNG", "JPEG", "WEBP"])
+@pytest.mark.parametrize("wrap", [None, 64, 76])
+def test_probe_line_wrapped_data_uri(fmt, wrap):
+    encoded = base64.b64encode(encoded_image("RGB", (300, 200), fmt)).decode()
+    if wrap:
+        # MIME-style wrapping puts the first line break past any fixed-size prefix
+        encoded = "\r\n".join(encoded[i:i + wrap] for i in range(0, len(encoded), wrap))
+
+    header = probe_image(data_uri_reader(f"data:image/{fmt.lower()};base64,{encoded}"))
+
+    assert (header["format"], header["width"], header["height"]) == (
+        {"PNG": "png", "JPEG": "jpeg", "WEBP": "webp"}[fmt], 300, 200)
+
+
+def test_data_uri_without_padding():
+    payload = base64.b64encode(encoded_image("RGB", (30, 20), "PNG")).decode().rstrip('=')
+
+    header = probe_image(data_uri_reader("data:image/png;base64," + payload))
+
+    assert (header["width"], header["height"]) == (30, 20)
+
+
+def mr_model(tmp_path, pixels, fmt):
+    """A model whose only material uses ``pixels`` as its metallic-roughness texture"""
+    name = f"mr.{fmt.lower()}"
+    Image.fromarray(pixels, "RGB").save(tmp_path / name, fmt)
+    return write_gltf(
+        tmp_path / "mr.gltf", [{"mesh": 0}], scene_nodes=[0],
+        meshes=[{"primitives": [{"attributes": {"POSITION": 0}, "material": 0}]}],
+        materials=[{"pbrMetallicRoughness": {"metallicRoughnessTexture": {"index": 0}}}],
+        textures=[{"source": 0}],
+        images=[{"uri": name}],
+    )
+
+
+def gradient(channels):
+    """256x256 RGB image with a diagonal 0-255 ramp in the given channels"""
+    ramp = ((np.arange(256)[None, :] + np.arange(256)[:, None]) // 2).astype(np.uint8)
+    pixels = np.zeros((256, 256, 3), dtype=np.uint8)
+    for c in channels:
+        pixels[:, :, c] = ramp
+    return pixels
+
+
+@pytest.mark.parametrize("fmt", ["PNG", "JPEG"])
+@pytest.mark.parametrize("channels, mispacked", [((0,), True), ((1, 2), False), ((1,), False)])
+def test_metallic_roughness_packing(tmp_path, fmt, channels, mispacked):
+    # JPEG quantisation leaks a few levels of the red ramp into G and B
+    model = mr_model(tmp_path, gradient(channels), fmt)
+
+    report = AmazonGLTFValidator(str(model), run_external_validator=False).validate()
+
+    warned = any(r.check_name == "Metallic-Roughness Packing" for r in report.results)
+    assert warned is mispacked
+
+
+@pytest.mark.parametrize("fmt", ["PNG", "JPEG"])
+def test_solid_texture(tmp_path, fmt):
+    pixels = np.full((256, 256, 3), (200, 90, 30), dtype=np.uint8)
+    model = mr_model(tmp_path, pixels, fmt)
+
+    report = AmazonGLTFValidator(str(model), run_external_validator=False).validate()
+
+    assert any(r.check_name == "Solid Color Textures" for r in report.results)
+    assert not any(r.check_name == "Metallic-Roughness Packing" for r in report.results)
+
+
+@pytest.fixture
+def slow_khronos(tmp_path, monkeypatch):
+    """A gltf_validator on PATH that hangs; yields the file its pid is written to"""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    pid_file = tmp_path / "khronos.pid"
+    script = bin_dir / "gltf_validator"
+    script.write_text(
+        "#!/bin/sh\n"
+        "if [ \"$1\" = --version ]; then echo 2.0.0; exit 0; fi\n"
+        f"echo $$ > {pid_file}\n"
+        "exec sleep 60\n"
+    )
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    gltf_validator_available.cache_clear()
+    yield pid_file
+    gltf_validator_available.cache_clear()
+
+
+def process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # A killed child that has been reaped is gone; a zombie would still answer
+    with open(f"/proc/{pid}/stat") as f:
+        return f.read().split(") ")[1][0] != "Z"
+
+
+def test_deadline_kills_khronos(tmp_path, slow_khronos):
+    model = write_gltf(tmp_path / "model.gltf", [{"mesh": 0}], scene_nodes=[0])
+
+    start = time.monotonic()
+    report = AmazonGLTFValidator(str(model), deadline=1.0).validate()
+
+    assert time.monotonic() - start < 10
+    assert report.overall_status == "TIMEOUT"
+    assert result(report, "gltf_validator").status == "TIMEOUT"
+    assert not process_alive(int(slow_khronos.read_text()))
+
+
+def test_deadline_reports_unfinished_checks(tmp_path):
+    model = write_gltf(tmp_path / "model.gltf", [{"mesh": 0}], scene_nodes=[0])
+
+    report = AmazonGLTFValidator(str(model), run_external_validator=False, deadline=0).validate()
+
+    assert report.overall_status == "TIMEOUT"
+    timed_out = [r for r in report.results if r.status == "TIMEOUT"]
+    assert timed_out and all(r.category == "Timed Out Checks" for r in timed_out)
+
+
+class TriangleCapValidator(AmazonGLTFValidator):
+    MAX_TRIANGLES = 0  # Every model fails the geometry gate
+
+
+def test_fail_fast_skips_after_first_failure(tmp_path):
+    model = write_gltf(tmp_path / "model.gltf", [{"mesh": 0}], scene_nodes=[0])
+
+    report = TriangleCapValidator(str(model), run_external_validator=False, fail_fast=True).validate()
+
+    assert report.overall_status == "NON_COMPLIANT"
+    assert result(report, "Triangle Count").status == "FAIL"
+    skipped = [r.check_name for r in report.results if r.status == "SKIPPED"]
+    assert "textures" in skipped and "integrity" in skipped
+    statuses = [r.status for r in report.results]
+    assert statuses.index("FAIL") < statuses.index("SKIPPED")
+
+
+def test_quick_look_is_incomplete(tmp_path):
+    # Without a material the triangle only draws warnings, never a FAIL
+    doc = triangle_doc()
+    del doc["materials"], doc["meshes"][0]["primitives"][0]["material"]
+    model = tmp_path / "model.glb"
+    model.write_bytes(glb_bytes(doc, TRIANGLE))
+
+    report = AmazonGLTFValidator(str(model), quick_look=True).validate()
+
+    assert report.overall_status == "INCOMPLETE"
+    skipped = [r.check_name for r in report.results if r.status == "SKIPPED"]
+    assert {"integrity", "topology", "gltf_validator"} <= set(skipped)
+    assert report.model_info["quick_look"]["triangles"]["value"] == 1
+
+
+def fake_batch_worker(model_path, timeout, cache_dir=None, validator_options=None):
+    """Stands in for _batch_validate_one in spawned workers; the file name picks the behaviour"""
+    name = os.path.basename(model_path)
+    if name.startswith("crash"):
+        os._exit(1)
+    if name.startswith("hang"):
+        # Wedged in native code: the per-model alarm never gets through
+        signal.signal(signal.SIGALRM, signal.SIG_IGN)
+        time.sleep(60)
+    if name.startswith("slow"):
+        time.sleep(60)
+    return {"path": model_path, "status": "COMPLIANT", "elapsed_s": 0.0, "error": None, "report": None}
+
+
+@pytest.fixture
+def fake_batch(monkeypatch):
+    monkeypatch.setattr(amazon_3d_validator, "_batch_validate_one", fake_batch_worker)
+    monkeypatch.setattr(amazon_3d_validator, "gltf_validator_available", lambda: False)
+    monkeypatch.setattr(amazon_3d_validator, "BATCH_KILL_GRACE", 1.0)
+
+
+def run_fake_batch(paths, workers, timeout):
+    output = io.StringIO()
+    counts = amazon_3d_validator.run_batch(paths, workers, timeout, output=output)
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    return counts, {r["path"]: r["status"] for r in records}, len(records)
+
+
+def test_batch_timeout_kills_wedged_worker(fake_batch):
+    start = time.monotonic()
+    counts, statuses, written = run_fake_batch(["hang.glb", "a.glb", "b.glb"], 2, 2.0)
+
+    assert time.monotonic() - start < 30
+    assert statuses == {"hang.glb": "TIMEOUT", "a.glb": "COMPLIANT", "b.glb": "COMPLIANT"}
+    assert written == 3 and counts == {"TIMEOUT": 1, "COMPLIANT": 2}
+
+
+def test_batch_requeues_models_behind_wedged_worker(fake_batch):
+    emitted = []
+
+    crashed, requeue = amazon_3d_validator._run_batch_pool(
+        ["hang.glb", "a.glb", "slow.glb", "b.glb"], 2, 3.0, emitted.append)
+
+    # slow.glb started after hang.glb, so it is still within its own timeout
+    # when the pool is killed and must run again rather than be charged
+    assert crashed == []
+    assert requeue == ["slow.glb", "b.glb"]
+    assert {r["path"]: r["status"] for r in emitted} == {"hang.glb": "TIMEOUT", "a.glb": "COMPLIANT"}
+
+
+def test_batch_isolates_crashing_model(fake_batch):
+    counts, statuses, written = run_fake_batch(["crash.glb", "a.glb", "b.glb", "c.glb"], 2, None)
+
+    assert statuses == {"crash.glb": "CRASH", "a.glb": "COMPLIANT", "b.glb": "COMPLIANT", "c.glb": "COMPLIANT"}
+    assert written == 4 and counts == {"CRASH": 1, "COMPLIANT": 3}
+
+
+def test_peak_allocation_only_when_tracing(tmp_path):
+    model = write_gltf(tmp_path / "model.gltf", [{"mesh": 0}], scene_nodes=[0])
+
+    plain = AmazonGLTFValidator(str(model), run_external_validator=False).validate()
+    tracemalloc.start()
+    try:
+        traced = AmazonGLTFValidator(str(model), run_external_validator=False).validate()
+    finally:
+        tracemalloc.stop()
+
+    assert plain.timings and all(set(entry) == {"wall_ms", "cpu_ms"} for entry in plain.timings.values())
+    assert all(entry["peak_alloc_kb"] >= 0 for entry in traced.timings.values())
+
+
+@pytest.mark.parametrize("args", [["--batch", "models/"], ["a.glb", "b.glb"], ["--manifest", "list.txt"]])
+def test_profile_rejected_in_batch_mode(monkeypatch, capsys, args):
+    monkeypatch.setattr("sys.argv", ["amazon_3d_validator.py", *args, "--profile"])
+
+    with pytest.raises(SystemExit) as exit_info:
+        amazon_3d_validator.main()
+
+    assert exit_info.value.code == 2
+    assert "cannot be combined with --batch" in capsys.readouterr().err
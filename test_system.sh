@@ -55,6 +55,7 @@ files=(
     "pdf_report_generator.py"
     "amazon_compliance_addon.py"
     "dashboard_app.py"
+    "validator_daemon.py"
     "README.md"
     "IMPLEMENTATION_GUIDE.md"
     "QUICK_START.md"
@@ -108,6 +109,17 @@ else
 fi
 echo ""
 
+# Test 7: Check for the validator daemon (optional)
+echo "Test 7: Checking for the validator daemon (optional)..."
+daemon_status=$(python3 validator_daemon.py ping 2>/dev/null)
+if [[ $? -eq 0 ]]; then
+    echo -e "${GREEN}✓ ${daemon_status#✅ }${NC}"
+else
+    echo -e "${YELLOW}⚠ Validator daemon not running (optional)${NC}"
+    echo "  Start it with: python3 validator_daemon.py serve"
+fi
+echo ""
+
 # Summary
 echo "=================================================="
 echo "Test Summary"
@@ -121,7 +133,8 @@ echo "2. Test with a sample glTF/GLB model:"
 echo "   python amazon_3d_validator.py your_model.glb"
 echo "3. Generate a PDF report:"
 echo "   python pdf_report_generator.py model_compliance_report.json WarRoom"
-echo "4. Start the dashboard:"
+echo "4. Start the dashboard (and, optionally, the validator daemon):"
+echo "   python validator_daemon.py serve &"
 echo "   python dashboard_app.py"
 echo ""
 echo "For full documentation, see:"
@@ -0,0 +1,193 @@
+"""
+Tests for validator_daemon against a real daemon on a temporary socket.
+
+Run with: python -m pytest -q test_validator_daemon.py
+"""
+
+import functools
+import io
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import pytest
+
+import validator_daemon
+from test_amazon_3d_validator import write_gltf
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def start_daemon(socket_path, *serve_args):
+    """Run ``validator_daemon.py serve`` in a subprocess and wait until it answers"""
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(HERE, "validator_daemon.py"), "--socket", socket_path, "serve", *serve_args],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        assert process.poll() is None, "daemon exited during startup"
+        try:
+            validator_daemon.request({"op": "ping"}, socket_path, timeout=5)
+            return process
+        except validator_daemon.DaemonUnavailable:
+            time.sleep(0.1)
+    process.kill()
+    pytest.fail("daemon did not start within 60s")
+
+
+def stop_daemon(process, socket_path):
+    try:
+        validator_daemon.request({"op": "shutdown"}, socket_path, timeout=5)
+        process.wait(timeout=15)
+    except (validator_daemon.DaemonUnavailable, subprocess.TimeoutExpired):
+        process.kill()
+        process.wait()
+
+
+@pytest.fixture
+def socket_path():
+    # AF_UNIX paths are limited to ~100 bytes, too short for pytest's tmp_path
+    directory = tempfile.mkdtemp(prefix="vd", dir="/tmp")
+    yield os.path.join(directory, "daemon.sock")
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(socket_path):
+    process = start_daemon(socket_path, "--workers", "1", "--queue-timeout", "1")
+    yield socket_path
+    stop_daemon(process, socket_path)
+
+
+def raw_request(socket_path, line):
+    """Send one raw line and decode the reply"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(10)
+        sock.connect(socket_path)
+        sock.sendall(line)
+        with sock.makefile("rb") as reply:
+            return json.loads(reply.readline())
+
+
+def test_validate_protocol(daemon, tmp_path):
+    model = write_gltf(tmp_path / "model.gltf", [{"mesh": 0}], scene_nodes=[0])
+    output = tmp_path / "report.json"
+
+    record = validator_daemon.validate_model(str(model), daemon, timeout=60, json_output=str(output),
+                                             run_external_validator=False)
+
+    assert record["path"] == str(model)
+    assert record["status"] == record["report"]["overall_status"]
+    assert record["error"] is None and record["elapsed_s"] >= 0
+    assert json.loads(output.read_text()) == record["report"]
+
+    report = validator_daemon.validate(str(model), daemon, timeout=60, run_external_validator=False)
+    assert report.model_name == "model.gltf"
+
+    ping = validator_daemon.request({"op": "ping"}, daemon, timeout=5)
+    assert ping["status"] == "OK" and ping["workers"] == 1 and ping["served"] == 2
+
+
+@pytest.mark.parametrize("line, error", [
+    (b"not json\n", "Bad request"),
+    (b"[1, 2]\n", "Bad request: request must be a JSON object"),
+    (b'{"op": "reboot"}\n', "Unknown op: 'reboot'"),
+    (b'{"op": "validate", "path": "model.glb"}\n', "'path' must be an absolute model path"),
+    (b'{"op": "validate", "path": "/model.glb", "timeout": "soon"}\n', "'timeout' must be a number"),
+])
+def test_bad_requests(daemon, line, error):
+    reply = raw_request(daemon, line)
+
+    assert reply["status"] == "ERROR"
+    assert reply["error"].startswith(error)
+
+
+def test_busy_when_every_worker_is_taken(daemon, tmp_path):
+    # Opening a FIFO blocks until a writer appears, so this request holds
+    # the only worker until its timeout fires
+    blocker = tmp_path / "blocker.gltf"
+    os.mkfifo(blocker)
+    first = {}
+    thread = threading.Thread(target=lambda: first.update(validator_daemon.validate_model(
+        str(blocker), daemon, timeout=3, run_external_validator=False)))
+    thread.start()
+    time.sleep(0.5)
+
+    model = write_gltf(tmp_path / "model.gltf", [{"mesh": 0}], scene_nodes=[0])
+    second = validator_daemon.validate_model(str(model), daemon, timeout=60, run_external_validator=False)
+    thread.join(30)
+
+    assert second["status"] == "BUSY" and second["report"] is None
+    assert first["status"] == "TIMEOUT"
+    # The worker is free again once the blocked request has timed out
+    third = validator_daemon.validate_model(str(model), daemon, timeout=60, run_external_validator=False)
+    assert third["report"] is not None
+
+
+def test_stale_socket_is_replaced(socket_path):
+    # A socket file with nobody listening, as left by a daemon that was killed
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(socket_path)
+    with pytest.raises(validator_daemon.DaemonUnavailable):
+        validator_daemon.request({"op": "ping"}, socket_path, timeout=5)
+
+    process = start_daemon(socket_path, "--workers", "1")
+    try:
+        assert validator_daemon.request({"op": "ping"}, socket_path, timeout=5)["status"] == "OK"
+        # A live daemon is never displaced
+        with pytest.raises(RuntimeError, match="already listening"):
+            validator_daemon.serve(socket_path)
+    finally:
+        stop_daemon(process, socket_path)
+    assert not os.path.exists(socket_path)
+
+
+def test_client_without_daemon(socket_path, tmp_path):
+    model = write_gltf(tmp_path / "model.gltf", [{"mesh": 0}], scene_nodes=[0])
+
+    with pytest.raises(validator_daemon.DaemonUnavailable):
+        validator_daemon.validate_model(str(model), socket_path)
+    result = subprocess.run(
+        [sys.executable, os.path.join(HERE, "validator_daemon.py"), "--socket", socket_path, "validate", str(model)],
+        capture_output=True, text=True,
+    )
+    assert result.returncode == validator_daemon.EXIT_UNAVAILABLE
+
+
+def test_dashboard_falls_back_without_daemon(socket_path, tmp_path, monkeypatch):
+    pytest.importorskip("flask")
+    import dashboard_app
+
+    monkeypatch.setitem(dashboard_app.app.config, "UPLOAD_FOLDER", str(tmp_path))
+    monkeypatch.setattr(validator_daemon, "validate_model",
+                        functools.partial(validator_daemon.validate_model, socket_path=socket_path))
+    commands = []
+
+    def run(command, **kwargs):
+        # Stand-in for the validator and PDF scripts: record the call and
+        # write the JSON report the validator would have written
+        commands.append(command)
+        if command[1].endswith("amazon_3d_validator.py"):
+            report = {"overall_status": "COMPLIANT", "summary": {"PASS": 1}, "results": []}
+            (tmp_path / "upload_compliance_report.json").write_text(json.dumps(report))
+        return subprocess.CompletedProcess(command, 0, "", "")
+    monkeypatch.setattr(dashboard_app.subprocess, "run", run)
+    monkeypatch.setattr(dashboard_app, "projects_db", {})
+
+    response = dashboard_app.app.test_client().post("/upload", data={
+        "model_file": (io.BytesIO(b"glTF"), "upload.glb"),
+        "project_name": "Lamp",
+    }, content_type="multipart/form-data")
+
+    assert response.status_code == 200
+    assert [os.path.basename(c[1]) for c in commands] == ["amazon_3d_validator.py", "pdf_report_generator.py"]
+    assert commands[0][2] == str(tmp_path / "upload.glb")
+    (project,) = dashboard_app.projects_db.values()
+    assert project["name"] == "Lamp" and project["status"] == "compliant"
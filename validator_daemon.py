@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+Resident Amazon 3D validator service
+Keeps warm validator processes behind a local Unix-domain socket
+
+Usage:
+    python validator_daemon.py serve [--workers N] [--timeout S]
+    python validator_daemon.py validate model.glb [--json] [-o report.json]
+    python validator_daemon.py ping
+    python validator_daemon.py stop
+
+Protocol: the client connects, writes one JSON object terminated by a
+newline and reads one JSON line back. Requests carry an ``op``:
+
+    {"op": "validate", "path": "/abs/model.glb", "timeout": 60,
+     "options": {"alignment_type": "FLOOR", "sample_bounds": false},
+     "json_output": "/abs/model_compliance_report.json", "pdf_brand": "WarRoom"}
+    {"op": "ping"}
+    {"op": "shutdown"}
+
+A validate reply is the same record batch mode writes per model
+(path, status, elapsed_s, error, report), where ``report`` is an asdict()
+ComplianceReport. ``status`` is the report's overall status, or ERROR,
+TIMEOUT, CRASH or BUSY when no report could be produced.
+
+This module imports only the standard library, so the client side starts
+fast; the validator itself is loaded in the worker processes.
+"""
+
+import argparse
+import json
+import os
+import queue
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Dict, Optional
+import multiprocessing
+
+
+DEFAULT_SOCKET = os.environ.get("AMAZON_VALIDATOR_SOCKET", "/tmp/amazon_3d_validator.sock")
+DEFAULT_TIMEOUT = 120.0
+# How long a request waits for a free worker before it is answered BUSY
+DEFAULT_QUEUE_TIMEOUT = 30.0
+# Extra seconds beyond a request's timeout before its worker is presumed
+# wedged in native code and replaced
+KILL_GRACE = 10.0
+MAX_REQUEST_BYTES = 1 << 20
+
+# AmazonGLTFValidator keyword arguments a client may set per request
+VALIDATOR_OPTIONS = ("alignment_type", "sample_bounds", "fail_fast", "deadline", "quick_look",
+                     "run_external_validator")
+
+EXIT_CODES = {"COMPLIANT": 0, "WARNING": 2, "INCOMPLETE": 2}
+EXIT_UNAVAILABLE = 3
+
+
+class DaemonUnavailable(ConnectionError):
+    """No validator daemon is listening on the socket"""
+
+
+class DaemonError(RuntimeError):
+    """The daemon answered, but without a report"""
+
+
+# ---------------------------------------------------------------------------
+# Worker side (runs in the spawned validator processes)
+# ---------------------------------------------------------------------------
+
+def _warm_worker() -> int:
+    """Load the validator and its heavy dependencies ahead of the first request"""
+    import amazon_3d_validator
+    if not amazon_3d_validator.missing_dependencies():
+        amazon_3d_validator.import_dependencies()
+    return os.getpid()
+
+
+def _validate_request(path: str, timeout: float, cache_dir: Optional[str], options: Dict,
+                      json_output: Optional[str] = None, pdf_brand: Optional[str] = None) -> Dict:
+    """Validate one model in a warm worker, optionally writing JSON and PDF reports"""
+    from amazon_3d_validator import _batch_validate_one
+
+    record = _batch_validate_one(path, timeout, cache_dir, options)
+    if record["report"] is None or not json_output:
+        return record
+
+    with open(json_output, 'w') as f:
+        json.dump(record["report"], f, indent=2)
+    record["json_report"] = json_output
+
+    if pdf_brand:
+        if find_spec("reportlab") is None:
+            record["pdf_error"] = "reportlab is not installed"
+        else:
+            from pdf_report_generator import CompliancePDFGenerator
+            try:
+                pdf_path = str(Path(json_output).with_suffix(".pdf"))
+                record["pdf_report"] = CompliancePDFGenerator(json_output, pdf_brand).generate(pdf_path)
+            except Exception as e:
+                record["pdf_error"] = f"{type(e).__name__}: {e}"
+    return record
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+class ValidatorDaemon:
+    """
+    Pool of warm single-process validator workers.
+
+    Each worker is its own one-process executor, so a request that overruns
+    its timeout can be killed and replaced without touching requests running
+    on the other workers. The number of workers is the concurrency limit.
+    """
+
+    def __init__(self, workers: int = 2, default_timeout: float = DEFAULT_TIMEOUT,
+                 queue_timeout: float = DEFAULT_QUEUE_TIMEOUT, cache_dir: Optional[str] = None):
+        self.workers = max(1, workers)
+        self.default_timeout = default_timeout
+        self.queue_timeout = queue_timeout
+        self.cache_dir = cache_dir
+        self.started = time.time()
+        self.served = 0
+        self._lock = threading.Lock()
+        self._idle = queue.Queue()
+        for _ in range(self.workers):
+            self._idle.put(self._spawn_worker())
+
+    @staticmethod
+    def _spawn_worker() -> ProcessPoolExecutor:
+        # spawn, not fork: the daemon is multi-threaded
+        executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+        executor.submit(_warm_worker)
+        return executor
+
+    @staticmethod
+    def _kill_worker(executor: ProcessPoolExecutor):
+        from amazon_3d_validator import _kill_pool
+        _kill_pool(executor)
+
+    def handle(self, request: Dict) -> Dict:
+        """Answer one decoded protocol request"""
+        op = request.get("op", "validate")
+        if op == "validate":
+            return self.validate(request)
+        if op == "ping":
+            return {
+                "status": "OK",
+                "pid": os.getpid(),
+                "workers": self.workers,
+                "idle_workers": self._idle.qsize(),
+                "served": self.served,
+                "uptime_s": round(time.time() - self.started, 1),
+            }
+        if op == "shutdown":
+            return {"status": "OK"}
+        return {"status": "ERROR", "error": f"Unknown op: {op!r}"}
+
+    def validate(self, request: Dict) -> Dict:
+        """Run a validate request on the next free worker"""
+        path = request.get("path")
+        record = {"path": path, "status": "ERROR", "elapsed_s": None, "error": None, "report": None}
+        if not isinstance(path, str) or not os.path.isabs(path):
+            record["error"] = "'path' must be an absolute model path"
+            return record
+        options = {k: v for k, v in (request.get("options") or {}).items() if k in VALIDATOR_OPTIONS}
+        try:
+            timeout = float(request.get("timeout") or self.default_timeout)
+        except (TypeError, ValueError):
+            record["error"] = "'timeout' must be a number of seconds"
+            return record
+
+        start = time.perf_counter()
+        try:
+            worker = self._idle.get(timeout=self.queue_timeout)
+        except queue.Empty:
+            record["status"] = "BUSY"
+            record["error"] = f"All {self.workers} workers busy for {self.queue_timeout}s"
+            return record
+
+        try:
+            future = worker.submit(_validate_request, path, timeout, self.cache_dir, options,
+                                   request.get("json_output"), request.get("pdf_brand"))
+            record = future.result(timeout=timeout + KILL_GRACE)
+        except FutureTimeout:
+            # The in-worker alarm did not fire: stuck in native code
+            self._kill_worker(worker)
+            worker = self._spawn_worker()
+            record["status"] = "TIMEOUT"
+            record["error"] = f"Validation exceeded {timeout}s; worker restarted"
+        except BrokenProcessPool:
+            worker.shutdown(wait=False, cancel_futures=True)  # Reap the dead pool's manager thread
+            worker = self._spawn_worker()
+            record["status"] = "CRASH"
+            record["error"] = "Validator process died"
+        except Exception as e:
+            record["error"] = f"{type(e).__name__}: {e}"
+        finally:
+            self._idle.put(worker)
+
+        record["elapsed_s"] = round(time.perf_counter() - start, 3)
+        with self._lock:
+            self.served += 1
+        return record
+
+    def close(self):
+        """Stop every worker"""
+        while not self._idle.empty():
+            self._idle.get_nowait().shutdown(wait=False, cancel_futures=True)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline(MAX_REQUEST_BYTES + 1)
+        if not line:
+            return
+        payload = {}
+        try:
+            if len(line) > MAX_REQUEST_BYTES:
+                raise ValueError("request too large")
+            payload = json.loads(line)
+            if not isinstance(payload, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as e:
+            reply = {"status": "ERROR", "error": f"Bad request: {e}"}
+            payload = {}
+        else:
+            reply = self.server.daemon.handle(payload)
+        self.wfile.write(json.dumps(reply).encode() + b"\n")
+        if payload.get("op") == "shutdown":
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, daemon: ValidatorDaemon):
+        self.daemon = daemon
+        super().__init__(socket_path, _RequestHandler)
+
+
+def serve(socket_path: str = DEFAULT_SOCKET, **daemon_options):
+    """Run the daemon on ``socket_path`` until stopped by SIGTERM/SIGINT or a shutdown request"""
+    if os.path.exists(socket_path):
+        try:
+            request({"op": "ping"}, socket_path, timeout=2)
+        except DaemonUnavailable:
+            os.unlink(socket_path)  # left behind by a daemon that died
+        else:
+            raise RuntimeError(f"A validator daemon is already listening on {socket_path}")
+
+    daemon = ValidatorDaemon(**daemon_options)
+    old_umask = os.umask(0o177)  # socket is rw for the owner only
+    try:
+        server = _UnixServer(socket_path, daemon)
+    finally:
+        os.umask(old_umask)
+
+    def stop(signum, frame):
+        threading.Thread(target=server.shutdown, daemon=True).start()
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    print(f"🚀 Validator daemon listening on {socket_path} ({daemon.workers} workers, pid {os.getpid()})")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        daemon.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        print(f"🛑 Validator daemon stopped after {daemon.served} requests")
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+def request(payload: Dict, socket_path: str = DEFAULT_SOCKET, timeout: Optional[float] = None) -> Dict:
+    """Send one protocol request and return the decoded reply"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(socket_path)
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise DaemonUnavailable(f"No validator daemon on {socket_path}") from e
+        sock.sendall(json.dumps(payload).encode() + b"\n")
+        with sock.makefile('rb') as reply:
+            line = reply.readline()
+    if not line:
+        raise DaemonError("Daemon closed the connection without replying")
+    return json.loads(line)
+
+
+def validate_model(model_path: str, socket_path: str = DEFAULT_SOCKET, timeout: Optional[float] = None,
+                   json_output: Optional[str] = None, pdf_brand: Optional[str] = None, **options) -> Dict:
+    """
+    Validate ``model_path`` on the daemon and return its record.
+
+    ``options`` are AmazonGLTFValidator keyword arguments (alignment_type,
+    sample_bounds, run_external_validator). Raises DaemonUnavailable when
+    no daemon is running, so callers can fall back to a subprocess.
+    """
+    payload = {"op": "validate", "path": os.path.abspath(model_path), "options": options}
+    if timeout:
+        payload["timeout"] = timeout
+    if json_output:
+        payload["json_output"] = os.path.abspath(json_output)
+    if pdf_brand:
+        payload["pdf_brand"] = pdf_brand
+    # The daemon answers within queue wait + timeout + kill grace; allow for both defaults
+    wait = (timeout or DEFAULT_TIMEOUT) + DEFAULT_QUEUE_TIMEOUT + KILL_GRACE + 5
+    return request(payload, socket_path, timeout=wait)
+
+
+def validate(model_path: str, socket_path: str = DEFAULT_SOCKET, timeout: Optional[float] = None, **options):
+    """Validate ``model_path`` on the daemon and return a ComplianceReport"""
+    record = validate_model(model_path, socket_path, timeout, **options)
+    if record.get("report") is None:
+        raise DaemonError(f"{record.get('status')}: {record.get('error')}")
+    from amazon_3d_validator import report_from_dict
+    return report_from_dict(record["report"])
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+def _print_record(record: Dict):
+    """One-screen summary of a validate reply"""
+    status = record.get("status")
+    icon = {"COMPLIANT": "✅", "WARNING": "⚠️ "}.get(status, "❌")
+    print(f"{icon} {status}: {record.get('path')} ({record.get('elapsed_s')}s)")
+    if record.get("error"):
+        print(f"   {record['error']}")
+    report = record.get("report")
+    if report:
+        summary = report.get("summary", {})
+        print("   " + ", ".join(f"{k}: {v}" for k, v in summary.items()))
+        for result in report.get("results", []):
+            if result["status"] in ("FAIL", "WARNING"):
+                print(f"   {result['status']:<7} {result['category']} / {result['check_name']}: {result['message']}")
+    for key, label in (("json_report", "JSON report"), ("pdf_report", "PDF report")):
+        if record.get(key):
+            print(f"📄 {label}: {record[key]}")
+    if record.get("pdf_error"):
+        print(f"   PDF not generated: {record['pdf_error']}")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Resident Amazon 3D validator service")
+    parser.add_argument('--socket', default=DEFAULT_SOCKET,
+                        help="Unix socket path (default: $AMAZON_VALIDATOR_SOCKET or %(default)s)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = commands.add_parser('serve', help="Run the daemon in the foreground")
+    serve_parser.add_argument('--workers', type=int, default=min(4, os.cpu_count() or 1),
+                              help="Concurrent validations (warm worker processes)")
+    serve_parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                              help="Default per-request timeout in seconds")
+    serve_parser.add_argument('--queue-timeout', type=float, default=DEFAULT_QUEUE_TIMEOUT,
+                              help="Seconds a request may wait for a free worker before BUSY")
+    serve_parser.add_argument('--cache-dir', help="Reuse reports for unchanged models from this cache directory")
+
+    validate_parser = commands.add_parser('validate', help="Validate a model on the running daemon")
+    validate_parser.add_argument('model')
+    validate_parser.add_argument('--timeout', type=float, help="Per-request timeout in seconds")
+    validate_parser.add_argument('--alignment', choices=('FLOOR', 'WALL', 'CEILING'))
+    validate_parser.add_argument('--fast-bounds', action='store_true')
+    validate_parser.add_argument('--fail-fast', action='store_true')
+    validate_parser.add_argument('--deadline', type=float, metavar='SECONDS',
+                                 help="Time budget; unfinished checks come back as TIMEOUT results")
+    validate_parser.add_argument('--quick-look', action='store_true',
+                                 help="Estimates from metadata and samples; follow with a full request")
+    validate_parser.add_argument('-o', '--output', help="Also write the JSON report here")
+    validate_parser.add_argument('--pdf', metavar='BRAND', help="Also generate a PDF report next to --output")
+    validate_parser.add_argument('--json', action='store_true', help="Print the raw reply record")
+
+    commands.add_parser('ping', help="Check that the daemon is running")
+    commands.add_parser('stop', help="Ask the daemon to shut down")
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        serve(args.socket, workers=args.workers, default_timeout=args.timeout,
+              queue_timeout=args.queue_timeout, cache_dir=args.cache_dir)
+        return
+
+    try:
+        if args.command == 'validate':
+            if args.pdf and not args.output:
+                parser.error("--pdf needs --output")
+            options = {}
+            if args.alignment:
+                options["alignment_type"] = args.alignment
+            if args.fast_bounds:
+                options["sample_bounds"] = True
+            if args.fail_fast:
+                options["fail_fast"] = True
+            if args.deadline:
+                options["deadline"] = args.deadline
+            if args.quick_look:
+                options["quick_look"] = True
+            record = validate_model(args.model, args.socket, args.timeout,
+                                    json_output=args.output, pdf_brand=args.pdf, **options)
+            if args.json:
+                print(json.dumps(record))
+            else:
+                _print_record(record)
+            sys.exit(EXIT_CODES.get(record.get("status"), 1))
+
+        reply = request({"op": "ping" if args.command == 'ping' else "shutdown"}, args.socket, timeout=10)
+        if args.command == 'ping':
+            print(f"✅ Daemon pid {reply['pid']} on {args.socket}: {reply['idle_workers']}/{reply['workers']} "
+                  f"workers idle, {reply['served']} served, up {reply['uptime_s']}s")
+        else:
+            print(f"🛑 Daemon on {args.socket} is shutting down")
+    except DaemonUnavailable as e:
+        print(f"❌ {e}. Start it with: python validator_daemon.py serve", file=sys.stderr)
+        sys.exit(EXIT_UNAVAILABLE)
+
+
+if __name__ == "__main__":
+    main()